@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
 # 라우팅 경로 변경
-from app.api.routes import auth, users
+from app.api.routes import admin, auth, images, users
 from app.api.api_v1.endpoints import oauth
 
 # API 라우터
@@ -14,4 +14,10 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
 
 # OAuth 관련 라우트
-api_router.include_router(oauth.router, prefix="/oauth", tags=["소셜 로그인"]) 
\ No newline at end of file
+api_router.include_router(oauth.router, prefix="/oauth", tags=["소셜 로그인"]) 
+
+# 프로필 이미지 썸네일 (인증 없이 공개)
+api_router.include_router(images.router, prefix="/images", tags=["images"])
+
+# 관리자 전용 라우트 (운영 진단용)
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
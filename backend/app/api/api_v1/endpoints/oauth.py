@@ -1,22 +1,128 @@
-from fastapi import APIRouter, Depends, HTTPException, Request, status, Response
+from fastapi import APIRouter, HTTPException, Request, status, Response
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from uuid import UUID
 import httpx
-from typing import Dict, Optional
+import redis
+from typing import Dict, NamedTuple, Optional
 import json
 import logging
+import time
 import urllib.parse
 
 from app import crud, schemas
 from app.core.config import settings
 from app.core import security
-from app.api import deps
+from app.core.resilience import (
+    CircuitBreaker, CircuitOpenError, Deadline, DeadlineExceeded, SingleFlight, retry_with_jitter
+)
+from app.core.tracing import SpanKind, inject_trace_headers, tracer
+from app.api.routing import LazySessionRoute
+from app.db.redis import acquire_lock, release_lock
+from app.db.session import SessionLocal
+from app.services.login_event import login_event_recorder
+from app.models.login_event import LoginEventType
 from app.models.oauth import OAuthProvider
 from app.models.user import OAuthAccount
 
-router = APIRouter()
+router = APIRouter(route_class=LazySessionRoute)
 logger = logging.getLogger(__name__)
 
+PROVIDER_UNAVAILABLE_MESSAGE = "소셜 로그인 서비스가 일시적으로 원활하지 않습니다. 잠시 후 다시 시도해주세요."
+
+class ProviderUnavailable(Exception):
+    """제공자 서버 오류 (5xx 응답)"""
+
+# 제공자별 서킷 브레이커
+provider_breakers = {
+    provider: CircuitBreaker(
+        name=provider.value,
+        failure_threshold=settings.OAUTH_BREAKER_FAILURE_THRESHOLD,
+        slow_call_seconds=settings.OAUTH_BREAKER_SLOW_CALL_SECONDS,
+        reset_timeout=settings.OAUTH_BREAKER_RESET_SECONDS,
+    )
+    for provider in OAuthProvider
+}
+
+# 더블 클릭/브라우저 재시도로 같은 인가 코드가 동시에 들어오면 토큰 교환/사용자 정보 조회를 한 번만 수행
+# (인가 코드는 한 번만 쓸 수 있어서 두 번째 교환은 실패하고, 브라우저는 마지막 응답을 보여줌)
+oauth_code_flight = SingleFlight("oauth_code")
+
+# 같은 제공자 계정의 사용자 찾기/생성은 워커 안에서 한 번만 실행하고 결과 공유
+oauth_user_flight = SingleFlight("oauth_user")
+
+class ResolvedOAuthUser(NamedTuple):
+    """콜백 간에 공유하는 사용자 정보 (세션에 묶인 ORM 객체 대신)"""
+    id: UUID
+    email: Optional[str]
+    name: Optional[str]
+    username: Optional[str]
+
+def oauth_error_redirect(message: str) -> RedirectResponse:
+    """오류 메시지와 함께 프론트엔드 콜백 페이지로 리디렉션"""
+    error_description = urllib.parse.quote(message)
+    error_redirect_url = f"{settings.FRONTEND_URL}/auth/oauth-callback?error=true&error_description={error_description}"
+    return RedirectResponse(url=error_redirect_url)
+
+async def provider_request(
+    client: httpx.AsyncClient,
+    provider: OAuthProvider,
+    deadline: Deadline,
+    method: str,
+    url: str,
+    *,
+    idempotent: bool = False,
+    **kwargs
+) -> httpx.Response:
+    """
+    서킷 브레이커와 마감 시간을 적용한 제공자 API 호출
+
+    멱등 요청만 jitter 백오프로 재시도합니다. 4xx 응답은 제공자 장애가 아니므로 그대로 반환합니다.
+    """
+    breaker = provider_breakers[provider]
+
+    async def attempt() -> httpx.Response:
+        timeout = deadline.timeout(settings.OAUTH_REQUEST_TIMEOUT_SECONDS)
+        permit = breaker.allow_request()
+        if permit is None:
+            raise CircuitOpenError(breaker.name)
+        started = time.monotonic()
+        try:
+            # 재시도마다 별도 CLIENT span, 제공자에는 traceparent 헤더 전달
+            with tracer.start_as_current_span(
+                f"{method} {provider.value}",
+                kind=SpanKind.CLIENT,
+                attributes={"http.request.method": method, "url.full": url, "oauth.provider": provider.value},
+            ) as span:
+                headers = inject_trace_headers(kwargs.get("headers"))
+                try:
+                    response = await client.request(
+                        method, url, timeout=timeout, **{**kwargs, "headers": headers}
+                    )
+                except httpx.TransportError:
+                    breaker.record_failure()
+                    raise
+                span.set_attribute("http.response.status_code", response.status_code)
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                    raise ProviderUnavailable(f"{provider.value} {method} {url}: {response.status_code}")
+            breaker.record_success(time.monotonic() - started)
+            return response
+        finally:
+            # 취소/기록하지 않는 예외로 끝나도 half-open 시험 자리가 영구히 잡혀 있지 않도록
+            # (이 호출이 시험 호출일 때만 반환)
+            if permit == breaker.HALF_OPEN:
+                breaker.release_trial()
+
+    return await retry_with_jitter(
+        attempt,
+        attempts=settings.OAUTH_RETRY_ATTEMPTS if idempotent else 1,
+        base_delay=settings.OAUTH_RETRY_BASE_DELAY_SECONDS,
+        deadline=deadline,
+        retry_on=(httpx.TransportError, ProviderUnavailable),
+    )
+
 # 카카오 로그인 시작
 @router.get("/kakao")
 async def kakao_login():
@@ -27,13 +133,18 @@ async def kakao_login():
 @router.get("/kakao/callback")
 async def kakao_callback(
     request: Request,
-    code: str,
-    db: Session = Depends(deps.get_db)
+    code: str
 ):
+    # 제공자 장애 중에는 외부 호출 없이 바로 오류 페이지로 안내
+    if provider_breakers[OAuthProvider.KAKAO].is_open:
+        logger.warning("카카오 서킷 브레이커 열림: 로그인 요청 즉시 실패 처리")
+        return oauth_error_redirect(PROVIDER_UNAVAILABLE_MESSAGE)
+    
     try:
         logger.info(f"카카오 로그인 콜백 시작: code={code[:5]}...")
+        deadline = Deadline(settings.OAUTH_CALLBACK_DEADLINE_SECONDS)
         # 인증 코드로 액세스 토큰 얻기
-        token_url = "https://kauth.kakao.com/oauth/token"
+        token_url = settings.KAKAO_TOKEN_URL
         token_data = {
             "grant_type": "authorization_code",
             "client_id": settings.KAKAO_CLIENT_ID,
@@ -42,17 +153,26 @@ async def kakao_callback(
             "redirect_uri": settings.KAKAO_REDIRECT_URI
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, data=token_data)
-            token_info = response.json()
-            
-            # 사용자 정보 가져오기
-            user_info_url = "https://kapi.kakao.com/v2/user/me"
-            headers = {
-                "Authorization": f"Bearer {token_info['access_token']}"
-            }
-            user_response = await client.get(user_info_url, headers=headers)
-            user_info = user_response.json()
+        async def fetch_user_info() -> dict:
+            async with httpx.AsyncClient() as client:
+                # 인가 코드는 한 번만 쓸 수 있으므로 토큰 교환은 재시도하지 않음
+                response = await provider_request(
+                    client, OAuthProvider.KAKAO, deadline, "POST", token_url, data=token_data
+                )
+                token_info = response.json()
+                
+                # 사용자 정보 가져오기
+                user_info_url = settings.KAKAO_USER_INFO_URL
+                headers = {
+                    "Authorization": f"Bearer {token_info['access_token']}"
+                }
+                user_response = await provider_request(
+                    client, OAuthProvider.KAKAO, deadline, "GET", user_info_url,
+                    idempotent=True, headers=headers
+                )
+                return user_response.json()
+        
+        user_info = await oauth_code_flight.do((OAuthProvider.KAKAO, code), fetch_user_info)
             
         # 사용자 정보에서 필요한 데이터 추출
         kakao_account = user_info.get("kakao_account", {})
@@ -66,8 +186,8 @@ async def kakao_callback(
         logger.info(f"카카오 사용자 정보: id={provider_user_id}, email={email}")
         
         # 해당 OAuth 계정으로 사용자 찾거나 생성
-        user = await find_or_create_oauth_user(
-            db=db,
+        user = await resolve_oauth_user(
+            deadline=deadline,
             provider=OAuthProvider.KAKAO,
             provider_user_id=provider_user_id,
             email=email,
@@ -75,6 +195,11 @@ async def kakao_callback(
             profile_image=profile_image
         )
         
+        # 로그인 이력은 큐에 넣고 배치로 기록
+        await login_event_recorder.record_async(
+            user.id, LoginEventType.LOGIN, provider=OAuthProvider.KAKAO.value
+        )
+        
         # 액세스 토큰 생성
         access_token = security.create_access_token(subject=str(user.id))
         refresh_token = security.create_refresh_token(subject=str(user.id))
@@ -133,15 +258,15 @@ async def kakao_callback(
         return response
     except HTTPException as e:
         # 구체적인 HTTP 예외는 적절한 오류 메시지와 함께 리디렉션
-        error_description = urllib.parse.quote(e.detail)
-        error_redirect_url = f"{settings.FRONTEND_URL}/auth/oauth-callback?error=true&error_description={error_description}"
-        return RedirectResponse(url=error_redirect_url)
+        return oauth_error_redirect(e.detail)
+    except (CircuitOpenError, DeadlineExceeded, ProviderUnavailable, httpx.TransportError) as e:
+        # 제공자 지연/장애는 재시도 없이 안내 메시지와 함께 리디렉션
+        logger.warning(f"카카오 제공자 호출 실패: {type(e).__name__} {str(e)}")
+        return oauth_error_redirect(PROVIDER_UNAVAILABLE_MESSAGE)
     except Exception as e:
         # 일반적인 예외 처리
         logger.error(f"카카오 로그인 처리 중 오류 발생: {str(e)}")
-        error_description = urllib.parse.quote("로그인 처리 중 오류가 발생했습니다.")
-        error_redirect_url = f"{settings.FRONTEND_URL}/auth/oauth-callback?error=true&error_description={error_description}"
-        return RedirectResponse(url=error_redirect_url)
+        return oauth_error_redirect("로그인 처리 중 오류가 발생했습니다.")
 
 # 구글 로그인 시작
 @router.get("/google")
@@ -153,13 +278,18 @@ async def google_login():
 @router.get("/google/callback")
 async def google_callback(
     request: Request,
-    code: str,
-    db: Session = Depends(deps.get_db)
+    code: str
 ):
+    # 제공자 장애 중에는 외부 호출 없이 바로 오류 페이지로 안내
+    if provider_breakers[OAuthProvider.GOOGLE].is_open:
+        logger.warning("구글 서킷 브레이커 열림: 로그인 요청 즉시 실패 처리")
+        return oauth_error_redirect(PROVIDER_UNAVAILABLE_MESSAGE)
+    
     try:
         logger.info(f"구글 로그인 콜백 시작: code={code[:5]}...")
+        deadline = Deadline(settings.OAUTH_CALLBACK_DEADLINE_SECONDS)
         # 인증 코드로 액세스 토큰 얻기
-        token_url = "https://oauth2.googleapis.com/token"
+        token_url = settings.GOOGLE_TOKEN_URL
         token_data = {
             "code": code,
             "client_id": settings.GOOGLE_CLIENT_ID,
@@ -168,17 +298,26 @@ async def google_callback(
             "grant_type": "authorization_code"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(token_url, data=token_data)
-            token_info = response.json()
-            
-            # 사용자 정보 가져오기
-            user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-            headers = {
-                "Authorization": f"Bearer {token_info['access_token']}"
-            }
-            user_response = await client.get(user_info_url, headers=headers)
-            user_info = user_response.json()
+        async def fetch_user_info() -> dict:
+            async with httpx.AsyncClient() as client:
+                # 인가 코드는 한 번만 쓸 수 있으므로 토큰 교환은 재시도하지 않음
+                response = await provider_request(
+                    client, OAuthProvider.GOOGLE, deadline, "POST", token_url, data=token_data
+                )
+                token_info = response.json()
+                
+                # 사용자 정보 가져오기
+                user_info_url = settings.GOOGLE_USER_INFO_URL
+                headers = {
+                    "Authorization": f"Bearer {token_info['access_token']}"
+                }
+                user_response = await provider_request(
+                    client, OAuthProvider.GOOGLE, deadline, "GET", user_info_url,
+                    idempotent=True, headers=headers
+                )
+                return user_response.json()
+        
+        user_info = await oauth_code_flight.do((OAuthProvider.GOOGLE, code), fetch_user_info)
         
         # 사용자 정보에서 필요한 데이터 추출
         provider_user_id = user_info["id"]
@@ -189,8 +328,8 @@ async def google_callback(
         logger.info(f"구글 사용자 정보: id={provider_user_id}, email={email}")
         
         # 해당 OAuth 계정으로 사용자 찾거나 생성
-        user = await find_or_create_oauth_user(
-            db=db,
+        user = await resolve_oauth_user(
+            deadline=deadline,
             provider=OAuthProvider.GOOGLE,
             provider_user_id=provider_user_id,
             email=email,
@@ -198,6 +337,11 @@ async def google_callback(
             profile_image=profile_image
         )
         
+        # 로그인 이력은 큐에 넣고 배치로 기록
+        await login_event_recorder.record_async(
+            user.id, LoginEventType.LOGIN, provider=OAuthProvider.GOOGLE.value
+        )
+        
         # 액세스 토큰 생성
         access_token = security.create_access_token(subject=str(user.id))
         refresh_token = security.create_refresh_token(subject=str(user.id))
@@ -256,15 +400,15 @@ async def google_callback(
         return response
     except HTTPException as e:
         # 구체적인 HTTP 예외는 적절한 오류 메시지와 함께 리디렉션
-        error_description = urllib.parse.quote(e.detail)
-        error_redirect_url = f"{settings.FRONTEND_URL}/auth/oauth-callback?error=true&error_description={error_description}"
-        return RedirectResponse(url=error_redirect_url)
+        return oauth_error_redirect(e.detail)
+    except (CircuitOpenError, DeadlineExceeded, ProviderUnavailable, httpx.TransportError) as e:
+        # 제공자 지연/장애는 재시도 없이 안내 메시지와 함께 리디렉션
+        logger.warning(f"구글 제공자 호출 실패: {type(e).__name__} {str(e)}")
+        return oauth_error_redirect(PROVIDER_UNAVAILABLE_MESSAGE)
     except Exception as e:
         # 일반적인 예외 처리
         logger.error(f"구글 로그인 처리 중 오류 발생: {str(e)}")
-        error_description = urllib.parse.quote("로그인 처리 중 오류가 발생했습니다.")
-        error_redirect_url = f"{settings.FRONTEND_URL}/auth/oauth-callback?error=true&error_description={error_description}"
-        return RedirectResponse(url=error_redirect_url)
+        return oauth_error_redirect("로그인 처리 중 오류가 발생했습니다.")
 
 # 로그아웃 엔드포인트
 @router.post("/logout")
@@ -278,6 +422,61 @@ async def logout():
     
     return response
 
+async def _acquire_resolution_lock(provider: OAuthProvider, provider_user_id: str, deadline: Deadline):
+    """다른 워커가 같은 계정을 처리 중이면 끝날 때까지 대기 (Redis 장애/대기 초과 시 락 없이 진행)"""
+    if settings.TOKEN_STORE_BACKEND == "memory":
+        return None
+    wait = max(0.0, min(settings.OAUTH_CALLBACK_LOCK_WAIT_SECONDS, deadline.remaining()))
+    try:
+        lock = await run_in_threadpool(
+            acquire_lock,
+            f"oauth_callback_lock:{provider.value}:{provider_user_id}",
+            settings.OAUTH_CALLBACK_LOCK_SECONDS,
+            wait,
+        )
+    except redis.RedisError as e:
+        logger.error(f"OAuth 콜백 락 획득 실패: {str(e)}")
+        return None
+    if lock is None:
+        logger.warning(f"OAuth 콜백 락 대기 시간 초과: provider={provider.value}, provider_user_id={provider_user_id}")
+    return lock
+
+async def resolve_oauth_user(
+    deadline: Deadline,
+    provider: OAuthProvider,
+    provider_user_id: str,
+    email: Optional[str] = None,
+    name: Optional[str] = None,
+    profile_image: Optional[str] = None
+) -> ResolvedOAuthUser:
+    """
+    동시 콜백을 하나로 합친 find_or_create_oauth_user
+
+    같은 (제공자, 제공자 사용자 ID)의 콜백이 동시에 들어오면 워커 안에서는 먼저 온 요청만 실행하고
+    나머지는 그 결과를 받습니다. 워커 간에는 Redis 락으로 순서를 정해서,
+    뒤에 실행되는 쪽은 먼저 생성된 계정을 찾게 됩니다 (사용자/계정 INSERT는 한 번).
+    공유 호출은 먼저 온 요청이 취소되어도 계속 실행되므로 요청의 Session 대신 전용 Session을 사용합니다.
+    """
+    async def resolve() -> ResolvedOAuthUser:
+        lock = await _acquire_resolution_lock(provider, provider_user_id, deadline)
+        db = SessionLocal()
+        try:
+            user = await find_or_create_oauth_user(
+                db=db,
+                provider=provider,
+                provider_user_id=provider_user_id,
+                email=email,
+                name=name,
+                profile_image=profile_image
+            )
+            return ResolvedOAuthUser(user.id, user.email, user.name, user.username)
+        finally:
+            db.close()
+            if lock is not None:
+                await run_in_threadpool(release_lock, lock)
+
+    return await oauth_user_flight.do((provider, provider_user_id), resolve)
+
 # 사용자 찾기 또는 생성 (OAuth)
 async def find_or_create_oauth_user(
     db: Session,
@@ -299,7 +498,12 @@ async def find_or_create_oauth_user(
     if oauth_account:
         # 기존 OAuth 계정이 있으면 연결된 사용자 반환
         logger.info(f"기존 OAuth 계정 발견: provider={provider.value}, user_id={oauth_account.user_id}")
-        return oauth_account.user
+        user = oauth_account.user
+        if profile_image and user.profile_image != profile_image:
+            # 제공자 쪽 프로필 사진이 바뀌었으면 반영 (프로필 캐시는 커밋 시 무효화, 썸네일은 새 주소로 생성)
+            user.profile_image = profile_image
+            db.commit()
+        return user
     
     # 2. 이메일이 있는 경우, 이메일로 등록된 사용자가 있는지 확인
     if not email:
@@ -357,7 +561,6 @@ async def create_new_oauth_user(
         email=email,
         username=f"{provider.value}_{provider_user_id}",
         password=None,  # OAuth 사용자는 비밀번호 없음
-        is_active=True,
         oauth_provider=provider,
         oauth_id=provider_user_id,
         name=name,
@@ -1,11 +1,11 @@
 from fastapi import Depends, HTTPException, status
-from jose import jwt
 from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.services import user as user_service
 from app.db.redis import get_redis
-from app.core.auth import get_current_user, get_optional_current_user
+from app.core.auth import get_auth_context, get_current_user, get_optional_current_user
 
 # DB 세션 의존성
 get_db_session = Depends(get_db)
@@ -17,4 +17,24 @@ get_redis_client = Depends(get_redis)
 get_authenticated_user = Depends(get_current_user)
 
 # 선택적 인증 사용자 의존성 (토큰이 없어도 에러는 아님)
-get_optional_authenticated_user = Depends(get_optional_current_user) 
\ No newline at end of file
+get_optional_authenticated_user = Depends(get_optional_current_user)
+
+# 요청 단위 인증 컨텍스트 의존성 (원본 토큰/클레임 접근용)
+get_request_auth = Depends(get_auth_context)
+
+
+def get_current_superuser(
+    current_user: dict = get_authenticated_user,
+    db: Session = get_db_session
+) -> dict:
+    """관리자 권한 확인 (관리자 전용 엔드포인트용)"""
+    user = user_service.get_by_id(db, user_id=current_user["id"])
+    if not user or not user_service.is_superuser(user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다."
+        )
+    return current_user
+
+# 관리자 사용자 의존성
+get_admin_user = Depends(get_current_superuser)
@@ -0,0 +1,147 @@
+from datetime import date
+from typing import Any, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+from redis.exceptions import RedisError
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_admin_user, get_db_session
+from app.api.routing import LazySessionRoute
+from app.core import cpu_profiler
+from app.core.config import settings
+from app.core.memory_profiler import allocation_profiler
+from app.db import keyspace
+from app.db.redis import redis_client
+from app.db.slow_query import slow_query_sampler
+from app.schemas.admin import (
+    ActiveUserReport, CpuProfileReport, KeyspaceReport, MemoryProfileDump, MemoryProfileReport, SlowQueryReport
+)
+from app.services import active_users
+
+router = APIRouter(route_class=LazySessionRoute)
+
+@router.get("/slow-queries", response_model=SlowQueryReport)
+def get_slow_queries(
+    limit: int = Query(50, ge=1, le=1000),
+    current_user: dict = get_admin_user
+) -> Any:
+    """느린 쿼리 기록 조회 (쿼리 형태별 집계 + 최근 항목)"""
+    return {
+        "threshold_ms": slow_query_sampler.threshold_ms,
+        "summary": slow_query_sampler.summary(),
+        "recent": slow_query_sampler.entries(limit),
+    }
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+def clear_slow_queries(current_user: dict = get_admin_user) -> None:
+    """느린 쿼리 기록 초기화"""
+    slow_query_sampler.clear()
+
+@router.get("/memory-profile", response_model=MemoryProfileReport)
+def get_memory_profile(current_user: dict = get_admin_user) -> Any:
+    """라우트별 메모리 할당 집계 조회 (요청당 평균 순 증가량 순)"""
+    return {"enabled": settings.MEMORY_PROFILER_ENABLED, **allocation_profiler.report()}
+
+@router.post("/memory-profile/dump", response_model=MemoryProfileDump)
+def dump_memory_profile(current_user: dict = get_admin_user) -> Any:
+    """메모리 할당 집계를 서버의 MEMORY_PROFILER_DUMP_PATH 파일로 저장"""
+    return {"path": allocation_profiler.dump(settings.MEMORY_PROFILER_DUMP_PATH)}
+
+@router.delete("/memory-profile", status_code=status.HTTP_204_NO_CONTENT)
+def clear_memory_profile(current_user: dict = get_admin_user) -> None:
+    """메모리 할당 집계 초기화"""
+    allocation_profiler.clear()
+
+@router.get(
+    "/cpu-profile",
+    response_model=CpuProfileReport,
+    responses={200: {"content": {"text/plain": {}}, "description": "format=collapsed이면 collapsed stack 텍스트"}},
+)
+def get_cpu_profile(
+    seconds: float = Query(10, gt=0, le=settings.CPU_PROFILER_MAX_SECONDS),
+    interval_ms: float = Query(10, ge=1, le=1000),
+    format: str = Query("top", pattern="^(top|collapsed)$"),
+    include_idle: bool = False,
+    limit: int = Query(50, ge=1, le=1000),
+    db: Session = get_db_session,
+    current_user: dict = get_admin_user
+) -> Any:
+    """
+    이 워커의 모든 스레드를 seconds 동안 표본 추출한 CPU 프로파일
+
+    format=top: 함수별/패키지별 표본 수, format=collapsed: flamegraph용 collapsed stack.
+    한 번에 하나만 수집하며 진행 중이면 409를 반환합니다.
+    """
+    # 수집하는 동안 커넥션을 잡고 있지 않도록 관리자 확인에 쓴 세션 반환
+    db.release()
+    try:
+        result = cpu_profiler.capture(seconds, interval_ms / 1000, include_idle)
+    except cpu_profiler.ProfileInProgress:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 CPU 프로파일을 수집 중입니다."
+        )
+    stacks = result.pop("stacks")
+    if format == "collapsed":
+        return PlainTextResponse(cpu_profiler.collapsed(stacks))
+    functions, packages = cpu_profiler.top_functions(stacks, limit)
+    return {**result, "samples": sum(stacks.values()), "functions": functions, "packages": packages}
+
+@router.get("/active-users", response_model=ActiveUserReport)
+def get_active_users(
+    end: Optional[date] = Query(None, description="마지막 날짜 (UTC, 기본: 오늘)"),
+    days: int = Query(30, ge=1, le=settings.ACTIVE_USERS_RETENTION_DAYS),
+    current_user: dict = get_admin_user
+) -> Any:
+    """일별 활성 사용자와 DAU/WAU/MAU 추정치 (일별 HyperLogLog를 합친 고유 사용자 수)"""
+    try:
+        return active_users.report(end, days)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+@router.get("/redis-keyspace", response_model=KeyspaceReport)
+def get_redis_keyspace(
+    prefix: Optional[List[str]] = Query(None, description="접두사 (여러 번 지정 가능, 기본: REDIS_KEYSPACE_PREFIXES)"),
+    sample_rate: float = Query(settings.REDIS_KEYSPACE_SAMPLE_RATE, gt=0, le=1),
+    max_keys: int = Query(settings.REDIS_KEYSPACE_MAX_KEYS, ge=1, le=settings.REDIS_KEYSPACE_MAX_KEYS),
+    max_seconds: float = Query(
+        settings.REDIS_KEYSPACE_MAX_SECONDS, gt=0, le=settings.REDIS_KEYSPACE_MAX_SECONDS
+    ),
+    db: Session = get_db_session,
+    current_user: dict = get_admin_user
+) -> Any:
+    """
+    접두사별 Redis 키 수, 메모리 사용량 추정치, 남은 TTL 분포
+
+    SCAN으로 REDIS_KEYSPACE_KEYS_PER_SECOND 이하 속도로 훑으므로, 스레드 풀을 오래 붙잡지 않도록
+    max_seconds가 지나면 그때까지의 결과를 timed_out=true로 반환합니다 (전체 보고서는 scripts.redis_keyspace_report).
+    한 번에 하나만 실행하며 진행 중이면 409를 반환합니다.
+    """
+    if settings.TOKEN_STORE_BACKEND == "memory":
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="TOKEN_STORE_BACKEND가 memory라 Redis를 사용하지 않습니다."
+        )
+    # 스캔하는 동안 커넥션을 잡고 있지 않도록 관리자 확인에 쓴 세션 반환
+    db.release()
+    try:
+        return keyspace.scan_keyspace(
+            redis_client,
+            prefix or settings.REDIS_KEYSPACE_PREFIXES,
+            scan_count=settings.REDIS_KEYSPACE_SCAN_COUNT,
+            keys_per_second=settings.REDIS_KEYSPACE_KEYS_PER_SECOND,
+            sample_rate=sample_rate,
+            max_keys=max_keys,
+            max_seconds=max_seconds,
+        )
+    except keyspace.KeyspaceScanInProgress:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="이미 키스페이스를 스캔 중입니다."
+        )
+    except RedisError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Redis 조회 실패: {str(e)}"
+        )
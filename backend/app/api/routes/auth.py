@@ -5,12 +5,13 @@ from fastapi.security import OAuth2PasswordRequestForm
 import redis
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db_session, get_redis_client, get_authenticated_user
-from app.core.auth import get_current_user
+from app.api.deps import get_db_session, get_redis_client, get_authenticated_user, get_request_auth
+from app.api.routing import LazySessionRoute
+from app.core.auth import AuthContext
 from app.schemas.token import Token, RefreshToken
 from app.services import auth as auth_service
 
-router = APIRouter()
+router = APIRouter(route_class=LazySessionRoute)
 
 @router.post("/login", response_model=Token)
 def login(
@@ -60,14 +61,16 @@ def refresh_token(
 @router.post("/logout", status_code=status.HTTP_200_OK)
 def logout(
     current_user: dict = get_authenticated_user,
-    token: str = Depends(get_current_user),
+    auth: AuthContext = get_request_auth,
     redis_client: redis.Redis = get_redis_client
 ) -> Any:
     """사용자 로그아웃"""
+    # 미들웨어에서 이미 검증한 토큰과 클레임을 그대로 사용 (재디코딩 없음)
     success = auth_service.logout(
         user_id=current_user["id"],
-        token=token,
-        redis_client=redis_client
+        token=auth.token,
+        redis_client=redis_client,
+        expires_at=auth.claims.get("exp")
     )
     
     if not success:
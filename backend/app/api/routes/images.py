@@ -0,0 +1,93 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import FileResponse, RedirectResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.api.deps import get_db_session
+from app.api.routing import LazySessionRoute
+from app.core.config import settings
+from app.core.http_cache import etag_matches, immutable_headers
+from app.services import user as user_service
+from app.services.thumbnail import ThumbnailError, thumbnail_cache, thumbnail_digest
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(route_class=LazySessionRoute)
+
+def _check_size(size: int) -> None:
+    if size not in settings.THUMBNAIL_SIZES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하는 크기: {', '.join(map(str, settings.THUMBNAIL_SIZES))}"
+        )
+
+@router.get(
+    "/avatars/{user_id}",
+    status_code=status.HTTP_302_FOUND,
+    responses={status.HTTP_302_FOUND: {"description": "크기별 썸네일 주소로 이동"}},
+)
+async def get_avatar(
+    request: Request,
+    user_id: UUID,
+    size: int = Query(128, description="썸네일 한 변 크기(px)"),
+    db: Session = get_db_session
+) -> Any:
+    """
+    사용자 프로필 이미지 썸네일
+
+    현재 profile_image의 썸네일(내용 해시 주소)로 리디렉션합니다.
+    리디렉션은 짧게만 캐시되므로 프로필 이미지가 바뀌면 곧 새 썸네일로 이동합니다.
+    """
+    _check_size(size)
+    profile = (await run_in_threadpool(user_service.get_profiles, db, [user_id]))[0]
+    # 원본 다운로드 동안 DB 커넥션을 잡고 있지 않도록
+    db.release()
+    if profile is None or not profile["profile_image"]:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로필 이미지가 없습니다."
+        )
+
+    try:
+        digest = await thumbnail_digest(profile["profile_image"])
+    except ThumbnailError as e:
+        logger.warning(f"썸네일 생성 실패: user_id={user_id}, {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="프로필 이미지를 가져올 수 없습니다."
+        )
+    return RedirectResponse(
+        url=str(request.url_for("get_thumbnail", size=size, digest=digest)),
+        status_code=status.HTTP_302_FOUND,
+        headers={"Cache-Control": f"public, max-age={settings.THUMBNAIL_REDIRECT_MAX_AGE_SECONDS}"},
+    )
+
+@router.get(
+    "/thumbnails/{size}/{digest}.jpg",
+    name="get_thumbnail",
+    response_class=FileResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "변경 없음 (If-None-Match)"}},
+)
+def get_thumbnail(
+    request: Request,
+    size: int,
+    digest: str = Path(pattern="^[0-9a-f]{64}$")
+) -> Any:
+    """내용 해시로 저장된 썸네일 (주소가 바뀌지 않는 한 내용도 그대로이므로 1년간 캐시)"""
+    _check_size(size)
+    etag = f'"{digest}-{size}"'
+    headers = immutable_headers(etag)
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    path = thumbnail_cache.open_thumbnail(digest, size)
+    if path is None:
+        # 캐시 정리로 지워진 경우: /avatars 주소를 다시 요청하면 새로 생성
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="썸네일을 찾을 수 없습니다."
+        )
+    return FileResponse(path, media_type="image/jpeg", headers=headers)
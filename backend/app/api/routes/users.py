@@ -1,14 +1,34 @@
-from typing import Any, List
+from typing import Any, List, Literal, Optional
 
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db_session, get_authenticated_user
+from app.api.deps import get_admin_user, get_db_session, get_authenticated_user
+from app.api.routing import LazySessionRoute
 from app.models.user import User
-from app.schemas.user import User as UserSchema, UserCreate, UserUpdate
+from app.core.config import settings
+from app.core.http_cache import is_not_modified, not_modified_response, validator_headers
+from app.schemas.user import (
+    Availability, User as UserSchema, UserBatchRequest, UserBatchResponse, UserCreate, UserSearchPage, UserUpdate
+)
+from app.services import availability as availability_service
 from app.services import user as user_service
+from app.services import user_cache
+from app.services import user_search as user_search_service
 
-router = APIRouter()
+router = APIRouter(route_class=LazySessionRoute)
+
+DUPLICATE_MESSAGES = {
+    "email": "이미 사용 중인 이메일입니다.",
+    "username": "이미 사용 중인 사용자명입니다.",
+}
+
+def duplicate_user_exception(field: str) -> HTTPException:
+    """중복 필드에 맞는 400 응답 생성"""
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=DUPLICATE_MESSAGES[field]
+    )
 
 @router.post("/", response_model=UserSchema, status_code=status.HTTP_201_CREATED)
 def create_user(
@@ -16,42 +36,103 @@ def create_user(
     db: Session = get_db_session
 ) -> Any:
     """새 사용자 등록"""
-    # 이메일 또는 사용자명 중복 확인
-    user = user_service.get_by_email(db, email=user_in.email)
-    if user:
+    # 사전 조회 없이 INSERT 한 번으로 생성하고, 중복은 유니크 제약 위반으로 판단
+    try:
+        user = user_service.create(db, obj_in=user_in)
+    except user_service.DuplicateUserError as e:
+        raise duplicate_user_exception(e.field)
+    return user
+
+@router.get("/availability", response_model=Availability, response_model_exclude_none=True)
+def check_availability(
+    username: Optional[str] = None,
+    email: Optional[str] = None,
+    db: Session = get_db_session
+) -> Any:
+    """사용자명/이메일 사용 가능 여부 확인 (Bloom 필터에 있을 수도 있는 값만 DB 조회)"""
+    if not username and not email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 사용 중인 이메일입니다."
+            detail="확인할 사용자명 또는 이메일을 입력해주세요."
         )
     
-    user = user_service.get_by_username(db, username=user_in.username)
-    if user:
+    result = Availability()
+    if username:
+        result.username = availability_service.is_username_available(db, username)
+    if email:
+        result.email = availability_service.is_email_available(db, email)
+    return result
+
+@router.get("/search", response_model=UserSearchPage)
+def search_users(
+    q: str = Query(..., min_length=1, max_length=100),
+    mode: Literal["prefix", "fuzzy"] = "prefix",
+    limit: int = Query(20, ge=1, le=settings.USER_SEARCH_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    current_user: dict = get_authenticated_user,
+    db: Session = get_db_session
+) -> Any:
+    """사용자 검색 (멘션 자동완성/관리자용, 시간 제한 초과 시 빈 결과와 timed_out=true)"""
+    # 이메일 검색/노출은 관리자에게만 허용
+    me = user_service.get_by_id(db, user_id=current_user["id"])
+    include_email = bool(me and user_service.is_superuser(me))
+    
+    try:
+        rows, next_cursor, timed_out = user_search_service.search_users(
+            db, q, mode=mode, limit=limit, cursor=cursor, include_email=include_email
+        )
+    except user_search_service.InvalidCursor:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 사용 중인 사용자명입니다."
+            detail="잘못된 페이지 커서입니다."
         )
-    
-    # 새 사용자 생성
-    user = user_service.create(db, obj_in=user_in)
-    return user
+    return {"items": rows, "next_cursor": next_cursor, "timed_out": timed_out}
+
+@router.post("/batch", response_model=UserBatchResponse)
+def get_users_batch(
+    batch_in: UserBatchRequest,
+    current_user: dict = get_admin_user,
+    db: Session = get_db_session
+) -> Any:
+    """사용자 ID 목록을 공개 프로필로 일괄 변환 (내부 서비스용이라 관리자 계정만 허용, 요청 순서 유지)"""
+    return {"items": user_service.get_profiles(db, batch_in.ids)}
 
-@router.get("/me", response_model=UserSchema)
+@router.get(
+    "/me",
+    response_model=UserSchema,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "변경 없음 (If-None-Match/If-Modified-Since)"}},
+)
 def get_current_user(
+    request: Request,
+    response: Response,
     current_user: dict = get_authenticated_user,
     db: Session = get_db_session
 ) -> Any:
-    """현재 로그인된 사용자 정보 조회"""
+    """현재 로그인된 사용자 정보 조회 (ETag/Last-Modified 조건부 요청 지원)"""
+    # 캐시된 버전 스탬프와 일치하면 사용자 행을 읽지 않고 304
+    stamp = user_cache.get_stamp(current_user["id"])
+    if stamp and is_not_modified(request.headers, stamp.etag, stamp.last_modified):
+        return not_modified_response(stamp.etag, stamp.last_modified)
+    
     user = user_service.get_by_id(db, user_id=current_user["id"])
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다."
         )
+    
+    stamp = user_cache.stamp_for(user)
+    user_cache.set_stamp(stamp)
+    # 변경이 없으면 직렬화 없이 304
+    if is_not_modified(request.headers, stamp.etag, stamp.last_modified):
+        return not_modified_response(stamp.etag, stamp.last_modified)
+    response.headers.update(validator_headers(stamp.etag, stamp.last_modified))
     return user
 
 @router.put("/me", response_model=UserSchema)
 def update_current_user(
     user_in: UserUpdate,
+    response: Response,
     current_user: dict = get_authenticated_user,
     db: Session = get_db_session
 ) -> Any:
@@ -63,22 +144,12 @@ def update_current_user(
             detail="사용자를 찾을 수 없습니다."
         )
     
-    # 이메일 업데이트 시 중복 확인
-    if user_in.email and user_in.email != user.email:
-        if user_service.get_by_email(db, email=user_in.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용 중인 이메일입니다."
-            )
-    
-    # 사용자명 업데이트 시 중복 확인
-    if user_in.username and user_in.username != user.username:
-        if user_service.get_by_username(db, username=user_in.username):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용 중인 사용자명입니다."
-            )
-    
-    # 사용자 정보 업데이트
-    user = user_service.update(db, db_obj=user, obj_in=user_in)
+    # 사용자 정보 업데이트 (이메일/사용자명 중복은 유니크 제약으로 감지)
+    try:
+        user = user_service.update(db, db_obj=user, obj_in=user_in)
+    except user_service.DuplicateUserError as e:
+        raise duplicate_user_exception(e.field)
+    # 클라이언트가 바로 다음 조회부터 조건부 요청을 쓸 수 있도록 새 ETag 전달
+    stamp = user_cache.stamp_for(user)
+    response.headers.update(validator_headers(stamp.etag, stamp.last_modified))
     return user 
\ No newline at end of file
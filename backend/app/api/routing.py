@@ -0,0 +1,59 @@
+import functools
+import inspect
+from typing import Any, Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from app.db.session import LazySession
+from app.db.slow_query import current_route
+
+
+def _release_sessions(values: dict) -> None:
+    for value in values.values():
+        if isinstance(value, LazySession):
+            value.release()
+
+
+def release_sessions_after(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    """엔드포인트가 반환되는 즉시(응답 직렬화 전) 주입된 DB 세션의 커넥션을 반환"""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(**kwargs: Any) -> Any:
+            try:
+                return await endpoint(**kwargs)
+            finally:
+                _release_sessions(kwargs)
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(**kwargs: Any) -> Any:
+        try:
+            return endpoint(**kwargs)
+        finally:
+            _release_sessions(kwargs)
+    return wrapper
+
+
+class LazySessionRoute(APIRoute):
+    """
+    핸들러 종료 시점에 DB 커넥션을 돌려주는 라우트 클래스
+
+    요청 처리 중에는 라우트 이름을 current_route에 설정해서 느린 쿼리 기록에 남깁니다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, release_sessions_after(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+        # 라우터 prefix는 포함 방식이 FastAPI 버전마다 달라서 경로 대신 엔드포인트 이름 사용
+        label = f"{','.join(sorted(self.methods))} {self.endpoint.__module__.rsplit('.', 1)[-1]}.{self.name}"
+
+        async def route_handler(request: Request) -> Response:
+            token = current_route.set(label)
+            try:
+                return await handler(request)
+            finally:
+                current_route.reset(token)
+        return route_handler
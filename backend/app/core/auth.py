@@ -1,70 +1,125 @@
 from typing import Optional
-from datetime import datetime
+from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from starlette.requests import cookie_parser
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.core.config import settings
-from app.db.session import get_db
-from app.db.redis import get_redis, is_token_blacklisted
-import redis
+from app.core.security import InvalidTokenError, decode_token, subject_user_id
+from app.db.redis import is_token_blacklisted
+from app.services.active_users import active_user_recorder
 
 # OAuth2 스키마 설정 (토큰 엔드포인트 지정)
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
+# 실제 토큰 추출은 AuthContextMiddleware가 담당하므로 OpenAPI 문서용으로만 사용
+oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl=f"{settings.API_V1_STR}/auth/login", auto_error=False
+)
+
+def extract_token(scope: Scope) -> Optional[str]:
+    """Authorization 헤더(Bearer) 또는 access_token 쿠키에서 토큰 추출"""
+    cookie_header = None
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            if scheme.lower() == "bearer" and credentials:
+                return credentials
+        elif name == b"cookie":
+            cookie_header = value.decode("latin-1")
+    if cookie_header:
+        return cookie_parser(cookie_header).get("access_token") or None
+    return None
+
+class AuthContext:
+    """
+    요청 단위 인증 컨텍스트
+
+    토큰 디코딩과 블랙리스트 확인은 처음 필요할 때 한 번만 수행하고 결과를 보관합니다.
+    인증이 필요 없는 요청은 Redis를 건드리지 않습니다.
+    """
+    __slots__ = ("token", "_claims", "_decoded", "_authenticated")
+
+    def __init__(self, token: Optional[str]):
+        self.token = token
+        self._claims: Optional[dict] = None
+        self._decoded = False
+        self._authenticated: Optional[bool] = None
+
+    @property
+    def claims(self) -> Optional[dict]:
+        """서명/만료가 검증된 토큰 클레임 (유효하지 않으면 None)"""
+        if not self._decoded:
+            self._decoded = True
+            if self.token:
+                try:
+                    self._claims = decode_token(self.token)
+                except InvalidTokenError:
+                    self._claims = None
+        return self._claims
+
+    @property
+    def user_id(self) -> Optional[UUID]:
+        return subject_user_id(self.claims)
+
+    @property
+    def is_authenticated(self) -> bool:
+        """유효한 액세스 토큰이며 블랙리스트에 없는지 여부"""
+        if self._authenticated is None:
+            claims = self.claims
+            self._authenticated = bool(
+                claims
+                and self.user_id is not None
+                and claims.get("type") == "access"
+                # 토큰이 블랙리스트에 있는지 확인 (로그아웃된 토큰)
+                and not is_token_blacklisted(self.token)
+            )
+            if self._authenticated:
+                # 활성 사용자 집계 (메모리에만 기록, 요청당 한 번)
+                active_user_recorder.record(self.user_id)
+        return self._authenticated
+
+class AuthContextMiddleware:
+    """요청마다 AuthContext를 만들어 request.state.auth에 저장하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["auth"] = AuthContext(extract_token(scope))
+        await self.app(scope, receive, send)
+
+def get_auth_context(request: Request) -> AuthContext:
+    """현재 요청의 인증 컨텍스트 반환"""
+    auth = getattr(request.state, "auth", None)
+    if auth is None:
+        # 미들웨어 없이 실행되는 경우(테스트 등)에도 동작하도록 직접 생성
+        auth = AuthContext(extract_token(request.scope))
+        request.state.auth = auth
+    return auth
 
 def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-    redis_client: redis.Redis = Depends(get_redis)
+    request: Request,
+    _token: Optional[str] = Depends(oauth2_scheme)
 ):
     """현재 인증된 사용자 정보 반환"""
-    # 토큰 검증 실패 시 발생할 예외
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="인증에 실패했습니다",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    try:
-        # 토큰 디코딩
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    auth = get_auth_context(request)
+    if not auth.is_authenticated:
+        # 토큰 검증 실패 시 발생할 예외
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증에 실패했습니다",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        user_id: str = payload.get("sub")
-        token_type: str = payload.get("type")
-        
-        # 사용자 ID 또는 토큰 타입이 없는 경우 예외 발생
-        if user_id is None or token_type != "access":
-            raise credentials_exception
-        
-        # 토큰이 블랙리스트에 있는지 확인 (로그아웃된 토큰)
-        if is_token_blacklisted(token):
-            raise credentials_exception
-            
-        # 여기서 데이터베이스에서 사용자 정보를 조회하는 로직 추가
-        # from app.models.user import User
-        # user = db.query(User).filter(User.id == user_id).first()
-        # if user is None:
-        #     raise credentials_exception
-        # return user
-        
-        # 임시로 사용자 ID만 반환 (이후 모델 구현 시 수정 필요)
-        return {"id": user_id}
-        
-    except JWTError:
-        raise credentials_exception
+    return {"id": auth.user_id}
 
 def get_optional_current_user(
-    token: Optional[str] = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-    redis_client: redis.Redis = Depends(get_redis)
+    request: Request,
+    _token: Optional[str] = Depends(oauth2_scheme)
 ):
     """현재 인증된 사용자 정보를 선택적으로 반환 (없으면 None)"""
-    if token:
-        try:
-            return get_current_user(token, db, redis_client)
-        except HTTPException:
-            return None
-    return None 
\ No newline at end of file
+    auth = get_auth_context(request)
+    if not auth.is_authenticated:
+        return None
+    return {"id": auth.user_id}
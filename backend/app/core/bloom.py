@@ -0,0 +1,106 @@
+import hashlib
+import itertools
+import math
+import threading
+from typing import Iterable, Iterator, List
+
+import redis
+
+def optimal_size(capacity: int, error_rate: float) -> tuple:
+    """예상 원소 수와 오탐률로 비트 수(m)와 해시 함수 개수(k) 계산"""
+    bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+class BloomFilter:
+    """
+    프로세스 메모리 Bloom 필터
+
+    might_contain이 False면 확실히 없는 값이고, True면 있을 가능성이 있는 값입니다.
+    """
+    _CHUNK = 1000  # 대량 추가 시 한 번에 처리하는 원소 수
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.num_bits, self.num_hashes = optimal_size(capacity, error_rate)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def positions(self, item: str) -> List[int]:
+        # 128비트 해시 하나를 둘로 나눠 k개의 위치를 만드는 double hashing
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        self.add_many([item])
+
+    def add_many(self, items: Iterable[str]) -> None:
+        # items가 DB 스트림일 수 있으므로 읽기/해시 계산은 락 밖에서 하고,
+        # 비트 갱신만 청크 단위로 잠가서 가입/조회가 전체 스캔 뒤에 막히지 않도록
+        for chunk in _chunks(items, self._CHUNK):
+            positions = [pos for item in chunk for pos in self.positions(item)]
+            with self._lock:
+                for pos in positions:
+                    self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def might_contain(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self.positions(item))
+
+    def is_complete(self) -> bool:
+        """전체 스캔까지 끝난 필터인지 여부 (메모리 필터는 프로세스마다 새로 만듦)"""
+        return False
+
+    def mark_complete(self) -> None:
+        """전체 스캔 완료 표시 (공유 필터에서 다른 워커가 다시 만들지 않도록)"""
+
+class RedisBloomFilter(BloomFilter):
+    """
+    Redis 비트맵 Bloom 필터 (여러 워커가 하나의 필터를 공유)
+
+    조회/추가 모두 파이프라인 한 번으로 처리합니다.
+    """
+
+    def __init__(self, client: redis.Redis, key: str, capacity: int, error_rate: float):
+        self.num_bits, self.num_hashes = optimal_size(capacity, error_rate)
+        self.client = client
+        self.key = key
+        # 비트맵 키는 첫 추가 때 바로 생기므로 스캔 완료 여부는 별도 키로 표시
+        self.ready_key = f"{key}:ready"
+
+    def add_many(self, items: Iterable[str]) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pending = 0
+        for item in items:
+            for pos in self.positions(item):
+                pipe.setbit(self.key, pos, 1)
+            pending += 1
+            if pending >= self._CHUNK:
+                pipe.execute()
+                pending = 0
+        if pending:
+            pipe.execute()
+
+    def might_contain(self, item: str) -> bool:
+        pipe = self.client.pipeline(transaction=False)
+        for pos in self.positions(item):
+            pipe.getbit(self.key, pos)
+        return all(pipe.execute())
+
+    def is_complete(self) -> bool:
+        # 완료 표시가 있어도 비트맵이 지워졌으면(만료/eviction) 다시 생성
+        pipe = self.client.pipeline(transaction=False)
+        pipe.exists(self.ready_key)
+        pipe.exists(self.key)
+        return all(pipe.execute())
+
+    def mark_complete(self) -> None:
+        self.client.set(self.ready_key, "1")
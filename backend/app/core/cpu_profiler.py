@@ -0,0 +1,137 @@
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from app.core.memory_profiler import short_path
+
+# 대기 중인 스레드의 가장 안쪽 Python 프레임 (C 함수에서 잠든 경우 호출한 쪽이 남음)
+_IDLE_LEAVES = {
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("selectors.py", "select"),
+    ("queue.py", "get"),
+    ("concurrent/futures/thread.py", "_worker"),
+}
+_THREAD_NUMBER = re.compile(r"[-_ ]?\d+$")
+
+class ProfileInProgress(Exception):
+    """다른 CPU 프로파일 수집이 진행 중"""
+
+_capture_lock = threading.Lock()
+
+def _frame_label(code) -> str:
+    return f"{short_path(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+def _is_idle(code) -> bool:
+    filename = code.co_filename.replace("\\", "/")
+    return any(
+        code.co_name == name and filename.endswith("/" + suffix)
+        for suffix, name in _IDLE_LEAVES
+    )
+
+def capture(seconds: float, interval: float = 0.01, include_idle: bool = False) -> dict:
+    """
+    seconds 동안 interval마다 이 프로세스의 모든 스레드 스택을 표본 추출
+
+    호출한 스레드 자신은 제외하고, 스택은 바깥 프레임부터 (스레드 이름을 맨 앞에) 기록합니다.
+    include_idle이 False면 락/큐/셀렉터에서 대기 중인 스레드는 CPU를 쓰지 않는 것으로 보고 건너뜁니다.
+    동시에 하나만 실행되며, 다른 수집이 진행 중이면 ProfileInProgress를 발생시킵니다.
+    """
+    if not _capture_lock.acquire(blocking=False):
+        raise ProfileInProgress()
+    try:
+        return _sample(seconds, interval, include_idle)
+    finally:
+        _capture_lock.release()
+
+def _sample(seconds: float, interval: float, include_idle: bool) -> dict:
+    own = threading.get_ident()
+    stacks: Counter = Counter()
+    labels: Dict[object, str] = {}
+    ticks = 0
+    idle = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while True:
+        names = {thread.ident: _THREAD_NUMBER.sub("", thread.name) for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            if not include_idle and _is_idle(frame.f_code):
+                idle += 1
+                continue
+            codes = []
+            while frame is not None:
+                codes.append(frame.f_code)
+                frame = frame.f_back
+            stack = [names.get(thread_id, "thread")]
+            for code in reversed(codes):
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code)
+                stack.append(label)
+            stacks[tuple(stack)] += 1
+        ticks += 1
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        time.sleep(min(interval, deadline - now))
+    return {
+        "seconds": round(time.perf_counter() - started, 3),
+        "interval_ms": interval * 1000,
+        "ticks": ticks,
+        "idle_samples": idle,
+        "stacks": stacks,
+    }
+
+def collapsed(stacks: Counter) -> str:
+    """flamegraph.pl / speedscope에 바로 넣을 수 있는 "a;b;c 개수" 형식"""
+    return "".join(
+        f"{';'.join(stack)} {count}\n"
+        for stack, count in sorted(stacks.items(), key=lambda item: item[1], reverse=True)
+    )
+
+def _package(label: str) -> str:
+    path = label.rsplit(":", 1)[0]
+    head = path.split("/", 1)[0]
+    if "/" not in path:
+        # 표준 라이브러리 단일 모듈 (threading.py 등)
+        return "stdlib" if head.endswith(".py") else head
+    return head
+
+def top_functions(stacks: Counter, limit: int = 50) -> Tuple[List[dict], List[dict]]:
+    """(함수별 self/total 표본 수, 최상위 패키지별 포함 표본 수)"""
+    total = sum(stacks.values()) or 1
+    self_counts: Counter = Counter()
+    total_counts: Counter = Counter()
+    package_counts: Counter = Counter()
+    for stack, count in stacks.items():
+        frames = stack[1:]
+        if not frames:
+            continue
+        self_counts[frames[-1]] += count
+        # 재귀 호출도 스택당 한 번만
+        for label in set(frames):
+            total_counts[label] += count
+        for package in {_package(label) for label in frames}:
+            package_counts[package] += count
+
+    functions = [
+        {
+            "function": label,
+            "self_samples": self_counts[label],
+            "total_samples": samples,
+            "self_pct": round(self_counts[label] * 100 / total, 2),
+            "total_pct": round(samples * 100 / total, 2),
+        }
+        for label, samples in total_counts.items()
+    ]
+    functions.sort(key=lambda f: (f["self_samples"], f["total_samples"]), reverse=True)
+    packages = [
+        {"package": package, "samples": samples, "pct": round(samples * 100 / total, 2)}
+        for package, samples in package_counts.most_common()
+    ]
+    return functions[:limit], packages
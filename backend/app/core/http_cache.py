@@ -0,0 +1,74 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+from fastapi import Response, status
+
+def http_date(value: datetime) -> str:
+    """HTTP 날짜 형식 (DB 시각은 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def _parse_http_date(value: str) -> Optional[datetime]:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 목록에 ETag가 있는지 확인 (약한 비교)"""
+    if if_none_match.strip() == "*":
+        return True
+    etag = _strip_weak(etag)
+    return any(_strip_weak(tag.strip()) == etag for tag in if_none_match.split(","))
+
+def is_not_modified(headers: Mapping[str, str], etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    조건부 GET 요청이 304로 응답할 수 있는지 확인
+
+    If-None-Match가 있으면 If-Modified-Since는 무시합니다 (RFC 9110).
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        since = _parse_http_date(if_modified_since)
+        if since is None:
+            return False
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """ETag/Last-Modified와 매 요청 재검증을 요구하는 캐시 헤더"""
+    headers = {
+        "ETag": etag,
+        # 사용자별 응답이므로 공유 캐시에 저장하지 않고, 사용 전 항상 재검증
+        "Cache-Control": "private, no-cache",
+        "Vary": "Authorization, Cookie",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+def not_modified_response(etag: str, last_modified: Optional[datetime]) -> Response:
+    """본문 없는 304 응답"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=validator_headers(etag, last_modified),
+    )
+
+def immutable_headers(etag: str) -> Dict[str, str]:
+    """내용 주소(해시) URL처럼 절대 바뀌지 않는 공개 리소스용 캐시 헤더"""
+    return {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
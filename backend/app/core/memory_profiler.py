@@ -0,0 +1,217 @@
+import functools
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_OTHER_ROUTE = "(other)"
+_TRACE_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+def route_label(scope: Scope) -> str:
+    """느린 쿼리 기록과 같은 형식의 라우트 이름 ("GET users.get_current_user")"""
+    method = scope.get("method", "")
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return f"{method} (unmatched)"
+    module = getattr(endpoint, "__module__", "") or ""
+    return f"{method} {module.rsplit('.', 1)[-1]}.{getattr(endpoint, '__name__', 'endpoint')}"
+
+def short_path(filename: str) -> str:
+    """sys.path 기준 상대 경로 (예: sqlalchemy/orm/query.py)"""
+    for prefix in _path_prefixes():
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+def _site(frame: tracemalloc.Frame) -> str:
+    return f"{short_path(frame.filename)}:{frame.lineno}"
+
+@functools.lru_cache(maxsize=1)
+def _path_prefixes() -> Tuple[str, ...]:
+    # 가장 구체적인 경로부터 (site-packages가 표준 라이브러리 경로보다 먼저)
+    paths = {os.path.abspath(path or os.getcwd()) for path in sys.path}
+    return tuple(path.rstrip(os.sep) + os.sep for path in sorted(paths, key=len, reverse=True))
+
+class AllocationProfiler:
+    """
+    샘플링 요청별 메모리 할당 프로파일러
+
+    표본으로 뽑힌 요청 구간에서만 tracemalloc을 켜고, 요청이 끝났을 때 아직 남아 있는
+    할당(순 증가량)과 할당 위치 상위 항목을 라우트별로 누적합니다.
+    tracemalloc은 프로세스 전역이라 표본 요청은 한 번에 하나만 측정하고,
+    같은 시간에 처리된 다른 요청의 할당도 섞일 수 있습니다 (여러 표본의 평균으로 판단).
+    """
+
+    def __init__(self, sample_rate: float, top_sites: int = 10, max_routes: int = 200, frames: int = 1):
+        self.sample_rate = sample_rate
+        self.top_sites = top_sites
+        self.max_routes = max_routes
+        self.frames = frames
+        self.sampled = 0
+        self.skipped_busy = 0
+        self._routes: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._busy = threading.Lock()
+
+    def should_sample(self) -> bool:
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def begin(self) -> Optional[Tuple[Optional[tracemalloc.Snapshot], bool]]:
+        """측정 시작, 다른 표본 요청이 측정 중이면 None"""
+        if not self._busy.acquire(blocking=False):
+            self.skipped_busy += 1
+            return None
+        try:
+            if tracemalloc.is_tracing():
+                # 외부에서(PYTHONTRACEMALLOC 등) 켜 둔 경우 끄지 않고 스냅샷 비교
+                return tracemalloc.take_snapshot(), False
+            tracemalloc.start(self.frames)
+        except BaseException:
+            # 시작하지 못한 측정이 자리를 계속 차지해서 이후 프로파일링이 멈추지 않도록
+            self._busy.release()
+            raise
+        return None, True
+
+    def end(self, route: str, state: Tuple[Optional[tracemalloc.Snapshot], bool]) -> None:
+        baseline, started = state
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            if started:
+                tracemalloc.stop()
+                started = False
+            snapshot = snapshot.filter_traces(_TRACE_FILTERS)
+            if baseline is None:
+                # 요청 동안 켜져 있었으므로 남아 있는 추적 항목이 곧 순 증가량
+                sites = [(_site(s.traceback[0]), s.size, s.count) for s in snapshot.statistics("lineno")]
+            else:
+                diffs = snapshot.compare_to(baseline.filter_traces(_TRACE_FILTERS), "lineno")
+                sites = [(_site(d.traceback[0]), d.size_diff, d.count_diff) for d in diffs if d.size_diff]
+        finally:
+            if started:
+                tracemalloc.stop()
+            self._busy.release()
+        self.record(route, sites)
+
+    def record(self, route: str, sites: List[Tuple[str, int, int]]) -> None:
+        net_bytes = sum(size for _, size, _ in sites)
+        net_blocks = sum(count for _, _, count in sites)
+        with self._lock:
+            self.sampled += 1
+            if route not in self._routes and len(self._routes) >= self.max_routes:
+                route = _OTHER_ROUTE
+            entry = self._routes.setdefault(route, {
+                "route": route,
+                "samples": 0,
+                "total_net_bytes": 0,
+                "max_net_bytes": None,
+                "total_net_blocks": 0,
+                "sites": {},
+            })
+            entry["samples"] += 1
+            entry["total_net_bytes"] += net_bytes
+            entry["total_net_blocks"] += net_blocks
+            if entry["max_net_bytes"] is None or net_bytes > entry["max_net_bytes"]:
+                entry["max_net_bytes"] = net_bytes
+            for site, size, count in sites:
+                totals = entry["sites"].setdefault(site, [0, 0, 0])
+                totals[0] += size
+                totals[1] += count
+                totals[2] += 1
+            # 위치 목록이 계속 늘지 않도록 누적 크기 상위만 유지
+            if len(entry["sites"]) > self.top_sites * 10:
+                kept = sorted(entry["sites"].items(), key=lambda item: item[1][0], reverse=True)
+                entry["sites"] = dict(kept[:self.top_sites * 5])
+
+    def report(self) -> dict:
+        with self._lock:
+            routes = []
+            for entry in self._routes.values():
+                top = sorted(entry["sites"].items(), key=lambda item: item[1][0], reverse=True)[:self.top_sites]
+                routes.append({
+                    "route": entry["route"],
+                    "samples": entry["samples"],
+                    "avg_net_bytes": round(entry["total_net_bytes"] / entry["samples"]),
+                    "max_net_bytes": entry["max_net_bytes"],
+                    "total_net_bytes": entry["total_net_bytes"],
+                    "total_net_blocks": entry["total_net_blocks"],
+                    "top_sites": [
+                        {"site": site, "size_bytes": size, "blocks": count, "samples": samples}
+                        for site, (size, count, samples) in top
+                    ],
+                })
+            sampled, skipped = self.sampled, self.skipped_busy
+        return {
+            "pid": os.getpid(),
+            "generated_at": datetime.now(timezone.utc),
+            "sample_rate": self.sample_rate,
+            "sampled_requests": sampled,
+            "skipped_busy": skipped,
+            # 요청당 평균 순 증가량이 큰 라우트부터
+            "routes": sorted(routes, key=lambda r: r["avg_net_bytes"], reverse=True),
+        }
+
+    def dump(self, path: str) -> str:
+        """보고서를 JSON 파일로 저장 ({pid}는 프로세스 ID로 치환)"""
+        path = path.format(pid=os.getpid())
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2, default=str)
+        return path
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self.sampled = 0
+            self.skipped_busy = 0
+
+class MemoryProfilerMiddleware:
+    """
+    표본 요청의 메모리 할당을 AllocationProfiler에 기록하는 순수 ASGI 미들웨어
+
+    표본이 아닌 요청은 난수 하나만 뽑고 그대로 통과합니다.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: Optional[AllocationProfiler] = None):
+        self.app = app
+        self.profiler = profiler or allocation_profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.profiler.should_sample():
+            await self.app(scope, receive, send)
+            return
+
+        state = self.profiler.begin()
+        if state is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            try:
+                self.profiler.end(route_label(scope), state)
+            except Exception as e:
+                logger.warning(f"메모리 프로파일 기록 실패: {str(e)}")
+
+# 앱 전역 프로파일러 (MEMORY_PROFILER_ENABLED일 때 main에서 미들웨어 등록)
+allocation_profiler = AllocationProfiler(
+    sample_rate=settings.MEMORY_PROFILER_SAMPLE_RATE,
+    top_sites=settings.MEMORY_PROFILER_TOP_SITES,
+    max_routes=settings.MEMORY_PROFILER_MAX_ROUTES,
+    frames=settings.MEMORY_PROFILER_FRAMES,
+)
@@ -0,0 +1,173 @@
+import asyncio
+import functools
+import random
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 외부 호출을 시도하지 않음"""
+
+    def __init__(self, name: str):
+        super().__init__(f"circuit '{name}' is open")
+        self.name = name
+
+class DeadlineExceeded(Exception):
+    """요청 전체 마감 시간 초과"""
+
+class Deadline:
+    """요청 단위 마감 시간 (각 외부 호출의 타임아웃을 남은 시간으로 제한)"""
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+    def timeout(self, per_call_timeout: float) -> float:
+        """개별 호출 타임아웃과 남은 시간 중 작은 값 (남은 시간이 없으면 예외)"""
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded()
+        return min(per_call_timeout, remaining)
+
+class CircuitBreaker:
+    """
+    외부 서비스 호출용 서킷 브레이커
+
+    연속 실패(오류 또는 느린 응답)가 임계값에 도달하면 열리고,
+    reset_timeout이 지나면 한 번의 시험 호출(half-open)을 허용합니다.
+    이벤트 루프 단일 스레드에서 사용하는 것을 전제로 합니다.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        slow_call_seconds: float,
+        reset_timeout: float,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+
+    def allow_request(self) -> Optional[str]:
+        """
+        호출 허용 여부 (허용하지 않으면 None)
+
+        허용하면 허용한 시점의 상태를 돌려주며, HALF_OPEN이면 이 호출이 시험 호출 자리를 차지한 것입니다.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return state
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return state
+        return None
+
+    def record_success(self, duration: float) -> None:
+        # 응답은 왔지만 너무 느리면 실패로 취급
+        if duration > self.slow_call_seconds:
+            self.record_failure()
+            return
+        self._state = self.CLOSED
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+
+    def release_trial(self) -> None:
+        """
+        결과를 기록하지 못하고 끝난 시험 호출의 자리 반환 (취소, 예상 밖 예외 등)
+
+        allow_request()가 HALF_OPEN을 돌려준 호출만 호출해야 합니다
+        (closed 때 시작한 호출이 늦게 끝나면서 실제 시험 호출의 자리를 풀지 않도록).
+        상태는 그대로 두므로 half-open이면 다음 요청이 다시 시험 호출이 됩니다.
+        """
+        self._trial_in_flight = False
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 하나로 합치는 single-flight
+
+    진행 중인 호출이 있으면 새로 실행하지 않고 그 결과(또는 예외)를 함께 받습니다.
+    호출은 별도 태스크로 실행되므로 먼저 온 요청이 취소되어도(클라이언트 연결 끊김 등)
+    끝까지 실행되어 기다리던 다른 요청들이 결과를 받습니다.
+    호출이 끝나면 키를 지우므로 이후 요청은 다시 실행됩니다 (결과 캐시 아님).
+    이벤트 루프 단일 스레드에서 사용하는 것을 전제로 합니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.shared = 0  # 다른 호출의 결과를 받은 횟수
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(functools.partial(self._finished, key))
+        # 기다리던 요청(먼저 온 요청 포함)이 취소되어도 실행 중인 호출은 계속되도록
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # 기다리는 요청이 모두 취소됐을 때 "exception was never retrieved" 경고 방지
+            task.exception()
+
+async def retry_with_jitter(
+    call: Callable[[], Awaitable[T]],
+    *,
+    attempts: int,
+    base_delay: float,
+    deadline: Deadline,
+    retry_on: tuple = (Exception,),
+) -> T:
+    """
+    full jitter 지수 백오프로 재시도 (멱등 호출에만 사용)
+
+    다음 대기 시간이 남은 마감 시간을 넘으면 더 시도하지 않고 마지막 예외를 올립니다.
+    """
+    last_error: Optional[BaseException] = None
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except retry_on as e:
+            last_error = e
+        if attempt + 1 >= attempts:
+            break
+        delay = random.uniform(0, base_delay * (2 ** attempt))
+        if deadline.remaining() <= delay:
+            break
+        await asyncio.sleep(delay)
+    raise last_error
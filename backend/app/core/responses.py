@@ -0,0 +1,13 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (앱 기본 응답 클래스)"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        # datetime/UUID/Enum 등은 orjson이 네이티브로 직렬화
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,13 +1,195 @@
+import base64
+import hashlib
+import hmac
+import time
+import uuid
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
-from jose import jwt
+import orjson
+from jose import JWTError
+from jose import jwt as jose_jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.tracing import traced
+
+def build_pwd_context() -> CryptContext:
+    """설정값으로 비밀번호 해싱 컨텍스트 생성"""
+    return CryptContext(
+        schemes=settings.PASSWORD_HASH_SCHEMES,
+        deprecated="auto",  # 기본 스킴 외의 해시는 needs_update 대상
+        # min/max를 고정해서 비용이 바뀌면 기존 해시도 재해싱 대상이 되도록 함
+        bcrypt__rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+        bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+        argon2__type="ID",
+        argon2__time_cost=settings.ARGON2_TIME_COST,
+        argon2__memory_cost=settings.ARGON2_MEMORY_COST,
+        argon2__parallelism=settings.ARGON2_PARALLELISM,
+    )
 
 # 비밀번호 해싱을 위한 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_pwd_context()
+
+class InvalidTokenError(Exception):
+    """서명/형식/만료 검증에 실패한 토큰"""
+
+# 압축 클레임: "type": "access" 대신 "t": "a" (매 요청 헤더 크기 절약)
+_COMPACT_TYPES = {"access": "a", "refresh": "r"}
+_EXPANDED_TYPES = {v: k for k, v in _COMPACT_TYPES.items()}
+
+def compact_claims(claims: Dict[str, Any]) -> Dict[str, Any]:
+    """type 클레임을 짧은 키/값으로 변환"""
+    claims = dict(claims)
+    token_type = claims.pop("type", None)
+    if token_type is not None:
+        claims["t"] = _COMPACT_TYPES.get(token_type, token_type)
+    return claims
+
+def expand_claims(claims: Dict[str, Any]) -> Dict[str, Any]:
+    """압축 클레임을 일반 형식으로 복원 (설정 전환 중에는 두 형식이 섞여 들어옴)"""
+    if "t" in claims and "type" not in claims:
+        claims = dict(claims)
+        token_type = claims.pop("t")
+        claims["type"] = _EXPANDED_TYPES.get(token_type, token_type)
+    return claims
+
+class TokenCodec(ABC):
+    """JWT 인코딩/디코딩 백엔드 인터페이스"""
+
+    def __init__(self, secret_key: str, algorithm: str):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+
+    @abstractmethod
+    def encode(self, claims: Dict[str, Any]) -> str:
+        """클레임 서명 (exp는 정수 타임스탬프)"""
+
+    @abstractmethod
+    def decode(self, token: str, verify_exp: bool = True) -> Dict[str, Any]:
+        """서명/만료 검증 후 클레임 반환, 실패 시 InvalidTokenError"""
+
+class JoseCodec(TokenCodec):
+    """python-jose 백엔드 (RS/ES 등 모든 알고리즘 지원)"""
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return jose_jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def decode(self, token: str, verify_exp: bool = True) -> Dict[str, Any]:
+        try:
+            return jose_jwt.decode(
+                token, self.secret_key, algorithms=[self.algorithm],
+                options={"verify_exp": verify_exp}
+            )
+        except JWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+class PyJWTCodec(TokenCodec):
+    """PyJWT 백엔드 (PyJWT 패키지 필요)"""
+
+    def __init__(self, secret_key: str, algorithm: str):
+        super().__init__(secret_key, algorithm)
+        import jwt
+        self._jwt = jwt
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        return self._jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def decode(self, token: str, verify_exp: bool = True) -> Dict[str, Any]:
+        try:
+            return self._jwt.decode(
+                token, self.secret_key, algorithms=[self.algorithm],
+                options={"verify_exp": verify_exp}
+            )
+        except self._jwt.PyJWTError as e:
+            raise InvalidTokenError(str(e)) from e
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+class HMACCodec(TokenCodec):
+    """
+    HS256/HS384/HS512 전용 최소 구현
+
+    키를 넣은 HMAC 객체와 인코딩된 헤더를 미리 만들어 두고 토큰마다 복사해서 사용합니다.
+    헤더의 alg가 설정값과 다르면 거부합니다.
+    """
+    _DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+    def __init__(self, secret_key: str, algorithm: str):
+        super().__init__(secret_key, algorithm)
+        if algorithm not in self._DIGESTS:
+            raise ValueError(f"hmac 백엔드는 HS256/HS384/HS512만 지원합니다: {algorithm}")
+        self._mac = hmac.new(secret_key.encode("utf-8"), digestmod=self._DIGESTS[algorithm])
+        self._header = _b64encode(orjson.dumps({"alg": algorithm, "typ": "JWT"}))
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        signing_input = self._header + b"." + _b64encode(orjson.dumps(claims))
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode("ascii")
+
+    def decode(self, token: str, verify_exp: bool = True) -> Dict[str, Any]:
+        try:
+            raw = token.encode("ascii")
+            signing_input, signature = raw.rsplit(b".", 1)
+            header, payload = signing_input.split(b".")
+            if header != self._header and orjson.loads(_b64decode(header)).get("alg") != self.algorithm:
+                raise InvalidTokenError("알고리즘이 일치하지 않습니다")
+            if not hmac.compare_digest(self._sign(signing_input), _b64decode(signature)):
+                raise InvalidTokenError("서명이 유효하지 않습니다")
+            claims = orjson.loads(_b64decode(payload))
+        except (ValueError, UnicodeError, AttributeError) as e:
+            # orjson.JSONDecodeError, binascii.Error 모두 ValueError
+            raise InvalidTokenError("토큰 형식이 올바르지 않습니다") from e
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("토큰 형식이 올바르지 않습니다")
+        if verify_exp and "exp" in claims:
+            exp = claims["exp"]
+            if not isinstance(exp, (int, float)) or exp <= time.time():
+                raise InvalidTokenError("만료된 토큰입니다")
+        return claims
+
+_CODECS = {"jose": JoseCodec, "pyjwt": PyJWTCodec, "hmac": HMACCodec}
+
+def create_token_codec(
+    backend: str, secret_key: str = settings.SECRET_KEY, algorithm: str = settings.ALGORITHM
+) -> TokenCodec:
+    """설정된 백엔드 이름으로 JWT 코덱 생성"""
+    if backend not in _CODECS:
+        raise ValueError(f"알 수 없는 JWT 백엔드: {backend}")
+    return _CODECS[backend](secret_key, algorithm)
+
+# 토큰 발급/검증에 사용하는 코덱 (JWT_BACKEND 설정으로 선택)
+token_codec = create_token_codec(settings.JWT_BACKEND)
+
+def _create_token(subject: str, token_type: str, expire: datetime) -> str:
+    to_encode = {"exp": int(expire.timestamp()), "sub": str(subject), "type": token_type}
+    if settings.JWT_COMPACT_CLAIMS:
+        to_encode = compact_claims(to_encode)
+    return token_codec.encode(to_encode)
+
+def subject_user_id(claims: Optional[Dict[str, Any]]) -> Optional[uuid.UUID]:
+    """sub 클레임을 사용자 ID(UUID)로 변환 (없거나 형식이 다르면 None)"""
+    subject = claims.get("sub") if claims else None
+    if not isinstance(subject, str):
+        return None
+    try:
+        return uuid.UUID(subject)
+    except ValueError:
+        return None
+
+def decode_token(token: str, verify_exp: bool = True) -> Dict[str, Any]:
+    """토큰 검증 후 일반 형식 클레임 반환 (실패 시 InvalidTokenError)"""
+    return expand_claims(token_codec.decode(token, verify_exp=verify_exp))
 
 def create_access_token(
     subject: str, 
@@ -20,12 +202,7 @@ def create_access_token(
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    
-    to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
-    return encoded_jwt
+    return _create_token(subject, "access", expire)
 
 def create_refresh_token(
     subject: str,
@@ -38,17 +215,23 @@ def create_refresh_token(
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES
         )
-    
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
-    )
-    return encoded_jwt
+    return _create_token(subject, "refresh", expire)
 
+@traced("password verify", attributes={"password.schemes": ",".join(settings.PASSWORD_HASH_SCHEMES)})
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """평문 비밀번호와 해시된 비밀번호 검증"""
     return pwd_context.verify(plain_password, hashed_password)
 
+@traced("password verify", attributes={"password.schemes": ",".join(settings.PASSWORD_HASH_SCHEMES)})
+def verify_password_and_update(
+    plain_password: str, hashed_password: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """비밀번호 검증과 함께 정책이 바뀐 해시라면 새 해시를 반환 (검증은 한 번만 수행)"""
+    if not hashed_password:
+        return False, None
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+@traced("password hash", attributes={"password.schemes": ",".join(settings.PASSWORD_HASH_SCHEMES)})
 def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
     return pwd_context.hash(password) 
\ No newline at end of file
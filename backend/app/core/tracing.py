@@ -0,0 +1,161 @@
+import functools
+import importlib.util
+import inspect
+import logging
+from typing import Callable, Optional
+
+from opentelemetry import propagate, trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# OpenTelemetry API 추적기
+# TracerProvider가 설정되기 전(또는 추적 비활성화 시)에는 아무 일도 하지 않는 span을 만듦
+tracer = trace.get_tracer("app")
+
+_provider = None
+
+def setup_tracing() -> None:
+    """
+    TRACING_ENABLED일 때 SDK TracerProvider와 로컬 exporter 설정
+
+    exporter는 span을 한 줄에 하나씩 JSON으로 기록합니다 (console: 표준 출력, file: TRACING_FILE_PATH).
+    opentelemetry-sdk가 없으면 경고만 남기고 추적 없이 동작합니다.
+    """
+    global _provider
+    if not settings.TRACING_ENABLED or _provider is not None:
+        return
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    except ImportError:
+        logger.warning("opentelemetry-sdk가 설치되어 있지 않아 추적을 사용하지 않습니다.")
+        return
+
+    if settings.TRACING_EXPORTER == "file":
+        out = open(settings.TRACING_FILE_PATH, "a", buffering=1, encoding="utf-8")
+    elif settings.TRACING_EXPORTER == "console":
+        out = None
+    else:
+        raise ValueError(f"알 수 없는 추적 exporter: {settings.TRACING_EXPORTER}")
+
+    exporter_kwargs = {"formatter": lambda span: span.to_json(indent=None) + "\n"}
+    if out is not None:
+        exporter_kwargs["out"] = out
+    provider = TracerProvider(resource=Resource.create({"service.name": settings.PROJECT_NAME}))
+    provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter(**exporter_kwargs)))
+    trace.set_tracer_provider(provider)
+    _provider = provider
+
+def shutdown_tracing() -> None:
+    """남은 span을 모두 내보내고 종료"""
+    if _provider is not None:
+        _provider.shutdown()
+
+def traced(name: str, kind: SpanKind = SpanKind.INTERNAL, attributes: Optional[dict] = None) -> Callable:
+    """함수 실행 구간을 span으로 기록하는 데코레이터 (동기/비동기 함수 모두 지원)"""
+    def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with tracer.start_as_current_span(name, kind=kind, attributes=attributes):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(name, kind=kind, attributes=attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def native_http_tracing() -> bool:
+    """FastAPI가 요청 span을 직접 만드는 버전인지 여부 (이 경우 TracingMiddleware는 중복)"""
+    return importlib.util.find_spec("fastapi.telemetry") is not None
+
+def inject_trace_headers(headers: Optional[dict] = None) -> dict:
+    """외부 호출 헤더에 W3C traceparent/tracestate 추가"""
+    headers = dict(headers or {})
+    propagate.inject(headers)
+    return headers
+
+class TracingMiddleware:
+    """
+    요청마다 SERVER span 생성 (순수 ASGI 미들웨어, 자체 추적이 없는 FastAPI 버전용)
+
+    들어온 traceparent 헤더가 있으면 같은 trace를 이어가고,
+    span 이름은 라우팅이 끝난 뒤 경로 템플릿(/api/v1/users/{id} 등)으로 바꿔 카디널리티를 낮춥니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        method = scope["method"]
+        with tracer.start_as_current_span(
+            f"{method} {scope['path']}",
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    span.set_attribute("http.response.status_code", status_code)
+                    if status_code >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if route is not None and getattr(route, "path", None):
+                    span.update_name(f"{method} {route.path}")
+                    span.set_attribute("http.route", route.path)
+
+def instrument_engine(engine: Engine) -> None:
+    """SQL 문마다 CLIENT span 생성 (커서 실행 구간만 측정)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_sql_span(conn, cursor, statement, parameters, context, executemany):
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        context._trace_span = tracer.start_span(
+            f"SQL {operation}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": conn.dialect.name,
+                "db.operation": operation,
+                "db.statement": statement,
+            },
+        )
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end_sql_span(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_trace_span", None)
+        if span is not None:
+            if cursor.rowcount is not None and cursor.rowcount >= 0:
+                span.set_attribute("db.rowcount", cursor.rowcount)
+            span.end()
+            context._trace_span = None
+
+    @event.listens_for(engine, "handle_error")
+    def _fail_sql_span(exception_context):
+        context = exception_context.execution_context
+        span = getattr(context, "_trace_span", None) if context is not None else None
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+            context._trace_span = None
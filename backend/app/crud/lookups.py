@@ -0,0 +1,62 @@
+"""
+자주 실행되는 사용자/OAuth 계정 단건 조회
+
+문장은 모듈 로드 시 한 번만 만들고 값은 bindparam으로 넘깁니다.
+같은 문장 객체를 재사용하므로 호출마다 쿼리 구성 비용이 없고,
+SQLAlchemy 컴파일 캐시와 드라이버 쪽 prepared statement 캐시도 항상 같은 SQL로 적중합니다.
+"""
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import Row, bindparam, func, select
+from sqlalchemy.orm import Session
+
+from app.models.oauth import OAuthProvider
+from app.models.user import OAuthAccount, User
+
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id")).limit(1)
+
+# lower() 함수 인덱스(uq_users_*_lower)를 사용하도록 비교 값도 소문자로 전달
+_USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email")).limit(1)
+
+_USER_BY_USERNAME = select(User).where(func.lower(User.username) == bindparam("username")).limit(1)
+
+_USER_BY_OAUTH = select(User).where(
+    User.oauth_provider == bindparam("provider"),
+    User.oauth_id == bindparam("provider_user_id"),
+).limit(1)
+
+# 공개 프로필 일괄 조회 (IN 목록은 expanding 파라미터라 개수가 달라도 같은 문장 재사용)
+_PROFILES_BY_IDS = select(User.id, User.username, User.name, User.profile_image).where(
+    User.id.in_(bindparam("user_ids", expanding=True)),
+    User.is_active.is_(True),
+)
+
+_OAUTH_ACCOUNT_BY_PROVIDER_ID = select(OAuthAccount).where(
+    OAuthAccount.provider == bindparam("provider"),
+    OAuthAccount.provider_user_id == bindparam("provider_user_id"),
+).limit(1)
+
+def user_by_id(db: Session, user_id: UUID) -> Optional[User]:
+    return db.execute(_USER_BY_ID, {"user_id": user_id}).scalars().first()
+
+def profiles_by_ids(db: Session, user_ids: List[UUID]) -> List[Row]:
+    return db.execute(_PROFILES_BY_IDS, {"user_ids": user_ids}).all()
+
+def user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.execute(_USER_BY_EMAIL, {"email": email.lower()}).scalars().first()
+
+def user_by_username(db: Session, username: str) -> Optional[User]:
+    return db.execute(_USER_BY_USERNAME, {"username": username.lower()}).scalars().first()
+
+def user_by_oauth(db: Session, provider: OAuthProvider, provider_user_id: str) -> Optional[User]:
+    return db.execute(
+        _USER_BY_OAUTH, {"provider": provider, "provider_user_id": provider_user_id}
+    ).scalars().first()
+
+def oauth_account_by_provider_id(
+    db: Session, provider: OAuthProvider, provider_user_id: str
+) -> Optional[OAuthAccount]:
+    return db.execute(
+        _OAUTH_ACCOUNT_BY_PROVIDER_ID, {"provider": provider, "provider_user_id": provider_user_id}
+    ).scalars().first()
@@ -1,9 +1,11 @@
 from typing import Optional
+from uuid import UUID
 
 from sqlalchemy.orm import Session
 from app.models.user import OAuthAccount
 from app.models.oauth import OAuthProvider
 from app.schemas.oauth import OAuthAccountCreate, OAuthAccountUpdate
+from app.crud import lookups
 from app.crud.base import CRUDBase
 
 
@@ -11,13 +13,10 @@ class CRUDOAuthAccount(CRUDBase[OAuthAccount, OAuthAccountCreate, OAuthAccountUp
     def get_by_provider_and_id(
         self, db: Session, *, provider: OAuthProvider, provider_user_id: str
     ) -> Optional[OAuthAccount]:
-        return db.query(self.model).filter(
-            self.model.provider == provider,
-            self.model.provider_user_id == provider_user_id
-        ).first()
+        return lookups.oauth_account_by_provider_id(db, provider, provider_user_id)
     
     def get_by_user_id(
-        self, db: Session, *, user_id: int
+        self, db: Session, *, user_id: UUID
     ) -> list[OAuthAccount]:
         return db.query(self.model).filter(
             self.model.user_id == user_id
@@ -2,27 +2,28 @@ from typing import Any, Dict, Optional, Union
 
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, verify_password_and_update
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
+from app.crud import lookups
 from app.crud.base import CRUDBase
 from app.models.oauth import OAuthProvider
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
+    def get(self, db: Session, id: Any) -> Optional[User]:
+        return lookups.user_by_id(db, id)
+
     def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
-        return db.query(User).filter(User.email == email).first()
+        return lookups.user_by_email(db, email)
 
     def get_by_username(self, db: Session, *, username: str) -> Optional[User]:
-        return db.query(User).filter(User.username == username).first()
+        return lookups.user_by_username(db, username)
     
     def get_by_oauth(
         self, db: Session, *, provider: OAuthProvider, provider_user_id: str
     ) -> Optional[User]:
-        return db.query(User).filter(
-            User.oauth_provider == provider,
-            User.oauth_id == provider_user_id
-        ).first()
+        return lookups.user_by_oauth(db, provider, provider_user_id)
 
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
         hashed_password = None
@@ -33,8 +34,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             email=obj_in.email,
             username=obj_in.username,
             hashed_password=hashed_password,
-            is_active=obj_in.is_active,
-            is_superuser=obj_in.is_superuser,
+            is_active=True,
+            is_superuser=False,
             oauth_provider=obj_in.oauth_provider,
             oauth_id=obj_in.oauth_id,
             name=obj_in.name,
@@ -50,7 +51,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             email=obj_in.email,
             username=obj_in.username,
             hashed_password=None,  # OAuth 사용자는 비밀번호가 없음
-            is_active=obj_in.is_active,
+            is_active=True,
             is_superuser=False,
             oauth_provider=obj_in.oauth_provider,
             oauth_id=obj_in.oauth_id,
@@ -68,7 +69,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.dict(exclude_unset=True)
+            update_data = obj_in.model_dump(exclude_unset=True)
             
         if update_data.get("password"):
             hashed_password = get_password_hash(update_data["password"])
@@ -81,8 +82,14 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         user = self.get_by_username(db, username=username)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        verified, new_hash = verify_password_and_update(password, user.hashed_password)
+        if not verified:
             return None
+        # 해싱 정책(스킴/비용)이 바뀐 경우 로그인 성공 시점에 재해싱
+        if new_hash:
+            user.hashed_password = new_hash
+            db.add(user)
+            db.commit()
         return user
 
 
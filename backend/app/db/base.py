@@ -2,4 +2,5 @@
 # 이 파일을 import하면 모든 모델이 Base.metadata에 등록됩니다.
 
 from app.db.base_class import Base  # noqa
-from app.models.user import User, OAuthAccount  # noqa 
\ No newline at end of file
+from app.models.user import User, OAuthAccount  # noqa
+from app.models.login_event import LoginEvent  # noqa
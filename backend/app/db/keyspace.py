@@ -0,0 +1,171 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+from redis.exceptions import ResponseError
+
+# (상한 초, 이름) - 남은 TTL이 상한 미만인 첫 구간에 집계
+TTL_BUCKETS = [
+    (60, "<1m"),
+    (3600, "<1h"),
+    (86400, "<1d"),
+    (7 * 86400, "<7d"),
+    (30 * 86400, "<30d"),
+    (None, ">=30d"),
+]
+
+class KeyspaceScanInProgress(Exception):
+    """다른 키스페이스 스캔이 진행 중"""
+
+_scan_lock = threading.Lock()
+
+def _ttl_bucket(ttl_ms: int) -> str:
+    for limit, name in TTL_BUCKETS:
+        if limit is None or ttl_ms < limit * 1000:
+            return name
+    return TTL_BUCKETS[-1][1]
+
+class _PrefixStats:
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.keys = 0
+        self.key_name_bytes = 0
+        self.sampled = 0
+        self.sampled_bytes = 0
+        self.max_bytes = 0
+        self.no_ttl = 0
+        self.ttl = {name: 0 for _, name in TTL_BUCKETS}
+        self.complete = True
+
+    def add_batch(self, keys: List[str], ttls: List[int], usages: Dict[str, Optional[int]]) -> None:
+        for key, ttl_ms in zip(keys, ttls):
+            if ttl_ms == -2:
+                # SCAN과 PTTL 사이에 만료/삭제됨
+                continue
+            self.keys += 1
+            self.key_name_bytes += len(key.encode("utf-8"))
+            if ttl_ms == -1:
+                self.no_ttl += 1
+            else:
+                self.ttl[_ttl_bucket(ttl_ms)] += 1
+        for usage in usages.values():
+            if usage is None:
+                continue
+            self.sampled += 1
+            self.sampled_bytes += usage
+            self.max_bytes = max(self.max_bytes, usage)
+
+    def report(self) -> dict:
+        avg_bytes = self.sampled_bytes / self.sampled if self.sampled else None
+        return {
+            "prefix": self.prefix,
+            "keys": self.keys,
+            "complete": self.complete,
+            "avg_key_name_bytes": round(self.key_name_bytes / self.keys, 1) if self.keys else None,
+            "sampled": self.sampled,
+            "avg_bytes": round(avg_bytes, 1) if avg_bytes is not None else None,
+            "max_bytes": self.max_bytes if self.sampled else None,
+            # 표본 평균 x 키 수 (MEMORY USAGE는 키 이름/값/내부 구조 오버헤드 포함)
+            "estimated_bytes": round(avg_bytes * self.keys) if avg_bytes is not None else None,
+            "no_ttl": self.no_ttl,
+            "ttl_histogram": [{"bucket": name, "keys": self.ttl[name]} for _, name in TTL_BUCKETS],
+        }
+
+def _used_memory(client) -> Optional[int]:
+    try:
+        info = client.info("memory")
+    except ResponseError:
+        # INFO가 막힌 환경
+        return None
+    if "used_memory" in info:
+        return info["used_memory"]
+    # 클러스터: 노드별 응답 합계
+    values = [node["used_memory"] for node in info.values() if isinstance(node, dict) and "used_memory" in node]
+    return sum(values) if values else None
+
+def scan_keyspace(
+    client,
+    prefixes: Sequence[str],
+    scan_count: int = 200,
+    keys_per_second: Optional[float] = 5000,
+    sample_rate: float = 0.05,
+    max_keys: Optional[int] = None,
+    max_seconds: Optional[float] = None,
+) -> dict:
+    """
+    접두사별 키 수, 메모리 사용량 추정치, 남은 TTL 분포
+
+    KEYS 대신 SCAN(MATCH 접두사*)으로 조금씩 훑고, 배치(scan_count개)마다 PTTL을 파이프라인으로 보내며
+    MEMORY USAGE는 sample_rate 비율의 키에만 실행합니다.
+    keys_per_second를 넘지 않도록 배치 사이에 쉬어서 Redis를 오래 붙잡지 않습니다.
+    max_keys를 넘는 접두사는 거기서 멈추고 complete=False로 표시합니다 (바이트는 추정치).
+    max_seconds가 지나면 전체 스캔을 멈추고 timed_out=True, 진행 중/남은 접두사는 complete=False로 표시합니다.
+    동시에 하나만 실행되며, 다른 스캔이 진행 중이면 KeyspaceScanInProgress를 발생시킵니다.
+    """
+    if not _scan_lock.acquire(blocking=False):
+        raise KeyspaceScanInProgress()
+    try:
+        started = time.perf_counter()
+        deadline = started + max_seconds if max_seconds else None
+        timed_out = False
+        results = []
+        scanned = 0
+        for prefix in prefixes:
+            stats = _PrefixStats(prefix)
+            if timed_out:
+                # 시간 예산을 다 써서 훑지 못한 접두사
+                stats.complete = False
+                results.append(stats.report())
+                continue
+            batch: List[str] = []
+            # 접두사의 glob 특수 문자는 그대로 일치하도록 이스케이프
+            pattern = "".join("\\" + c if c in "*?[]\\" else c for c in prefix) + "*"
+            for key in client.scan_iter(match=pattern, count=scan_count):
+                batch.append(key)
+                if len(batch) >= scan_count:
+                    _measure(client, stats, batch, sample_rate)
+                    scanned += len(batch)
+                    batch = []
+                    if keys_per_second:
+                        # 지금까지 처리한 키 수 기준으로 속도 제한 (시간 예산을 넘겨서 쉬지는 않음)
+                        ahead = scanned / keys_per_second - (time.perf_counter() - started)
+                        if deadline is not None:
+                            ahead = min(ahead, deadline - time.perf_counter())
+                        if ahead > 0:
+                            time.sleep(ahead)
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        stats.complete = False
+                        timed_out = True
+                        break
+                    if max_keys is not None and stats.keys >= max_keys:
+                        stats.complete = False
+                        break
+            if batch:
+                _measure(client, stats, batch, sample_rate)
+                scanned += len(batch)
+            results.append(stats.report())
+        return {
+            "generated_at": datetime.now(timezone.utc),
+            "seconds": round(time.perf_counter() - started, 3),
+            "used_memory": _used_memory(client),
+            "scanned_keys": scanned,
+            "timed_out": timed_out,
+            "sample_rate": sample_rate,
+            "prefixes": results,
+        }
+    finally:
+        _scan_lock.release()
+
+def _measure(client, stats: _PrefixStats, keys: List[str], sample_rate: float) -> None:
+    sampled = [key for key in keys if random.random() < sample_rate]
+    pipe = client.pipeline(transaction=False)
+    for key in keys:
+        pipe.pttl(key)
+    for key in sampled:
+        pipe.memory_usage(key)
+    # MEMORY USAGE가 막힌 환경(일부 관리형 Redis)에서도 키 수/TTL은 집계되도록 명령별 오류는 표본 제외
+    replies = [None if isinstance(reply, Exception) else reply for reply in pipe.execute(raise_on_error=False)]
+    ttls = [-2 if ttl is None else ttl for ttl in replies[:len(keys)]]
+    stats.add_batch(keys, ttls, dict(zip(sampled, replies[len(keys):])))
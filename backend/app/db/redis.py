@@ -1,14 +1,33 @@
+from typing import Optional, Tuple
+
 import redis
+from redis.cluster import RedisCluster
+from redis.exceptions import LockError
+from redis.lock import Lock
+
 from app.core.config import settings
+from app.core.tracing import SpanKind, traced
+from app.db.token_store import TokenStore, create_token_store
 
 # Redis 클라이언트 생성
-redis_client = redis.Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB,
-    password=settings.REDIS_PASSWORD,
-    decode_responses=True
-)
+if settings.TOKEN_STORE_BACKEND == "redis_cluster":
+    redis_client = RedisCluster(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD,
+        decode_responses=True
+    )
+else:
+    redis_client = redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+        password=settings.REDIS_PASSWORD,
+        decode_responses=True
+    )
+
+# 토큰 저장소 (TOKEN_STORE_BACKEND 설정으로 선택)
+token_store: TokenStore = create_token_store(settings.TOKEN_STORE_BACKEND, redis_client)
 
 # 의존성 주입에 사용될 Redis 클라이언트 생성 함수
 def get_redis():
@@ -18,23 +37,60 @@ def get_redis():
         # 특별한 종료 로직이 필요하면 여기에 추가
         pass
 
+def _redis_span(operation: str):
+    return traced(f"redis {operation}", kind=SpanKind.CLIENT, attributes={
+        "db.system": "redis", "db.operation": operation, "token_store.backend": settings.TOKEN_STORE_BACKEND,
+    })
+
 # 리프레시 토큰 관리 함수들
+@_redis_span("save_refresh_token")
 def save_refresh_token(user_id: str, token: str, expires_in_seconds: int):
-    """리프레시 토큰을 Redis에 저장"""
-    redis_client.setex(f"refresh_token:{user_id}", expires_in_seconds, token)
+    """리프레시 토큰을 저장"""
+    token_store.save_refresh_token(user_id, token, expires_in_seconds)
 
+@_redis_span("get_refresh_token")
 def get_refresh_token(user_id: str) -> str:
     """사용자 ID로 리프레시 토큰 조회"""
-    return redis_client.get(f"refresh_token:{user_id}")
+    return token_store.get_refresh_token(user_id)
+
+@_redis_span("rotate_refresh_token")
+def rotate_refresh_token(
+    user_id: str,
+    old_token: str,
+    new_refresh_token: str,
+    new_access_token: str,
+    expires_in_seconds: int,
+    grace_seconds: int,
+) -> Optional[Tuple[str, str]]:
+    """리프레시 토큰을 원자적으로 교체하고 클라이언트에 줄 (액세스, 리프레시) 토큰 쌍 반환"""
+    return token_store.rotate_refresh_token(
+        user_id, old_token, new_refresh_token, new_access_token, expires_in_seconds, grace_seconds
+    )
 
+@_redis_span("delete_refresh_token")
 def delete_refresh_token(user_id: str):
     """리프레시 토큰 삭제 (로그아웃)"""
-    redis_client.delete(f"refresh_token:{user_id}")
+    token_store.delete_refresh_token(user_id)
+
+@_redis_span("acquire_lock")
+def acquire_lock(name: str, timeout: float, blocking_timeout: float) -> Optional[Lock]:
+    """짧은 분산 락 획득 (blocking_timeout 안에 얻지 못하면 None, timeout이 지나면 자동 해제)"""
+    lock = redis_client.lock(name, timeout=timeout, blocking_timeout=blocking_timeout)
+    return lock if lock.acquire() else None
+
+def release_lock(lock: Lock) -> None:
+    try:
+        lock.release()
+    except LockError:
+        # 처리가 timeout보다 오래 걸려 이미 만료된 경우
+        pass
 
+@_redis_span("is_token_blacklisted")
 def is_token_blacklisted(token: str) -> bool:
     """블랙리스트에 등록된 토큰인지 확인"""
-    return redis_client.exists(f"blacklist:{token}")
+    return token_store.is_token_blacklisted(token)
 
+@_redis_span("blacklist_token")
 def blacklist_token(token: str, expires_in_seconds: int):
     """토큰을 블랙리스트에 등록 (로그아웃 처리용)"""
-    redis_client.setex(f"blacklist:{token}", expires_in_seconds, "1") 
\ No newline at end of file
+    token_store.blacklist_token(token, expires_in_seconds)
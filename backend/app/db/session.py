@@ -1,21 +1,112 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 from app.db.base_class import Base  # base_class.py에서 Base를 가져옵니다
 
+def _connect_args(url: str) -> dict:
+    """
+    드라이버별 prepared statement 설정
+
+    psycopg(3)은 같은 SQL이 prepare_threshold번 실행되면 서버 측 prepared statement로 전환합니다.
+    psycopg2는 지원하지 않으므로 SQLAlchemy 컴파일 캐시만 사용합니다.
+    sqlite3는 커넥션마다 cached_statements개의 준비된 문장을 재사용합니다.
+    """
+    driver = make_url(url).drivername
+    if driver == "postgresql+psycopg":
+        return {"prepare_threshold": settings.DB_PREPARE_THRESHOLD}
+    if driver.startswith("sqlite"):
+        return {"cached_statements": settings.DB_STATEMENT_CACHE_SIZE}
+    return {}
+
 # SQLite와 PostgreSQL 모두 지원하도록 설정
 engine = create_engine(
     settings.DATABASE_URL,
-    # SQLite 전용 설정은 제거
-    echo=True  # 개발 중 SQL 쿼리 로깅 활성화
+    connect_args=_connect_args(settings.DATABASE_URL),
+    # 컴파일된 SQL 캐시 크기 (조회 문장은 crud/lookups.py에서 재사용)
+    query_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+    echo=settings.SQL_ECHO  # 느린 쿼리만 보려면 SLOW_QUERY_* 설정 사용
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 세션 사용 통계 (풀 점유가 실제 DB 작업을 따라가는지 확인용)
+_stats_lock = threading.Lock()
+_session_stats = {
+    "requested": 0,               # get_db가 주입된 횟수
+    "opened": 0,                  # 실제로 Session이 만들어진 횟수
+    "opened_without_queries": 0,  # Session은 만들었지만 커넥션을 쓰지 않은 횟수
+    "released_early": 0,          # 응답 직렬화 전에 커넥션을 반환한 횟수
+}
+
+def _count(key: str) -> None:
+    with _stats_lock:
+        _session_stats[key] += 1
+
+def get_session_stats() -> dict:
+    """세션 사용 통계와 현재 풀 점유 상태 반환"""
+    with _stats_lock:
+        stats = dict(_session_stats)
+    checkedout = getattr(engine.pool, "checkedout", None)
+    stats["pool_checked_out"] = checkedout() if checkedout else None
+    return stats
+
+@event.listens_for(SessionLocal, "after_begin")
+def _mark_session_used(session, transaction, connection):
+    # 트랜잭션이 커넥션과 함께 시작됨 = 실제로 DB를 사용함
+    session.info["used_connection"] = True
+
+class LazySession:
+    """
+    첫 사용 시점에 Session을 만드는 프록시
+
+    인증/검증 오류로 일찍 끝나는 요청은 Session을 만들지 않고,
+    release()로 핸들러가 끝나자마자 커넥션을 풀에 돌려줄 수 있습니다.
+    """
+
+    def __init__(self, session_factory: sessionmaker = SessionLocal):
+        self._session_factory = session_factory
+        self._session: Optional[Session] = None
+        _count("requested")
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = self._session_factory()
+            _count("opened")
+        return self._session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    def release(self) -> None:
+        """
+        커넥션 반환 (로드된 객체는 detached 상태로 계속 읽을 수 있음)
+
+        Session을 닫아 진행 중인 읽기 트랜잭션을 끝냅니다.
+        이후 다시 사용하면 새 Session이 만들어집니다.
+        """
+        if self._session is None:
+            return
+        if self._session.info.get("used_connection"):
+            _count("released_early")
+        self.close()
+
+    def close(self) -> None:
+        if self._session is None:
+            return
+        if not self._session.info.get("used_connection"):
+            _count("opened_without_queries")
+        self._session.close()
+        self._session = None
+
 # 의존성 주입에 사용될 DB 세션 생성 함수
 def get_db():
-    db = SessionLocal()
+    db = LazySession()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
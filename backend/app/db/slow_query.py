@@ -0,0 +1,203 @@
+import hashlib
+import logging
+import queue
+import random
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 쿼리를 실행한 라우트 ("GET users.get_current_user"), LazySessionRoute가 요청마다 설정
+current_route: ContextVar[Optional[str]] = ContextVar("current_route", default=None)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s|%\(\w+\)s|:\w+)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# 계획을 확인할 문장 (INSERT 계획은 거의 항상 같아서 제외)
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "WITH")
+_SKIP_OPTION = "slow_query_skip"
+_MAX_PLANS = 1000  # 보관할 실행 계획 수 (넘으면 비우고 다시 수집)
+
+def normalize_sql(statement: str) -> str:
+    """리터럴과 IN 목록 길이를 지워서 같은 형태의 쿼리를 하나로 묶음"""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+def fingerprint(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:12]
+
+def params_shape(parameters: Any, executemany: bool) -> Any:
+    """파라미터 값 대신 타입만 기록 (개인정보가 버퍼에 남지 않도록)"""
+    if executemany:
+        rows = list(parameters or [])
+        return {"rows": len(rows), "row": params_shape(rows[0], False) if rows else None}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return None
+
+class SlowQuerySampler:
+    """
+    느린 쿼리 샘플러
+
+    커서 실행 시간이 기준을 넘은 문장을 정규화된 SQL, 파라미터 형태, 호출 라우트와 함께
+    고정 크기 링 버퍼에 보관합니다. 실행 계획(EXPLAIN, ANALYZE 없이)은 요청 경로가 아닌
+    별도 스레드가 별도 커넥션으로 구하고, 같은 형태의 쿼리는 한 번만 확인합니다.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        buffer_size: int,
+        sample_rate: float = 1.0,
+        explain: bool = True,
+    ):
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self.explain = explain
+        self._entries: deque = deque(maxlen=buffer_size)
+        self._plans: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._explain_queue: queue.Queue = queue.Queue(maxsize=100)
+        self._worker: Optional[threading.Thread] = None
+        self._engine: Optional[Engine] = None
+
+    def install(self, engine: Engine) -> None:
+        """엔진에 실행 시간 측정 이벤트 등록 및 EXPLAIN 스레드 시작"""
+        self._engine = engine
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        if self.explain and self._worker is None:
+            self._worker = threading.Thread(target=self._explain_loop, name="slow-query-explain", daemon=True)
+            self._worker.start()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._slow_query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started", None)
+        if started is None or context.execution_options.get(_SKIP_OPTION):
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < self.threshold_ms or random.random() >= self.sample_rate:
+            return
+        self.record(conn.dialect.name, statement, parameters, executemany, duration_ms)
+
+    def record(self, dialect: str, statement: str, parameters: Any, executemany: bool, duration_ms: float) -> None:
+        normalized = normalize_sql(statement)
+        key = fingerprint(normalized)
+        entry = {
+            "fingerprint": key,
+            "sql": normalized,
+            "params_shape": params_shape(parameters, executemany),
+            "duration_ms": round(duration_ms, 2),
+            "route": current_route.get(),
+            "recorded_at": datetime.now(timezone.utc),
+            "plan": self._plans.get(key),
+        }
+        with self._lock:
+            self._entries.append(entry)
+        if (
+            self.explain
+            and entry["plan"] is None
+            and normalized.split(" ", 1)[0].upper() in _EXPLAINABLE
+        ):
+            first = list(parameters)[0] if executemany and parameters else parameters
+            try:
+                # 원래 파라미터는 계획을 구할 때까지만 보관
+                self._explain_queue.put_nowait((key, dialect, statement, first))
+            except queue.Full:
+                pass
+
+    def _explain_loop(self) -> None:
+        while True:
+            key, dialect, statement, parameters = self._explain_queue.get()
+            if key in self._plans:
+                self._attach_plan(key)
+                continue
+            try:
+                plan = self._run_explain(dialect, statement, parameters)
+            except Exception as e:
+                logger.warning(f"느린 쿼리 실행 계획 조회 실패: {str(e)}")
+                plan = f"EXPLAIN 실패: {e}"
+            if len(self._plans) >= _MAX_PLANS:
+                self._plans.clear()
+            self._plans[key] = plan
+            self._attach_plan(key)
+
+    def _run_explain(self, dialect: str, statement: str, parameters: Any) -> str:
+        prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN (ANALYZE off) "
+        with self._engine.connect() as conn:
+            rows = conn.execution_options(**{_SKIP_OPTION: True}).exec_driver_sql(
+                prefix + statement, parameters if parameters is not None else ()
+            ).all()
+        if dialect == "sqlite":
+            # (id, parent, notused, detail)
+            return "\n".join(str(row[-1]) for row in rows)
+        return "\n".join(str(row[0]) for row in rows)
+
+    def _attach_plan(self, key: str) -> None:
+        plan = self._plans[key]
+        with self._lock:
+            for entry in self._entries:
+                if entry["fingerprint"] == key and entry["plan"] is None:
+                    entry["plan"] = plan
+
+    def entries(self, limit: Optional[int] = None) -> List[dict]:
+        """최근 항목부터 반환"""
+        with self._lock:
+            items = [dict(entry) for entry in reversed(self._entries)]
+        return items[:limit] if limit else items
+
+    def summary(self) -> List[dict]:
+        """버퍼에 있는 항목을 쿼리 형태별로 집계 (총 소요 시간 순)"""
+        groups: Dict[str, dict] = {}
+        for entry in self.entries():
+            group = groups.setdefault(entry["fingerprint"], {
+                "fingerprint": entry["fingerprint"],
+                "sql": entry["sql"],
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "routes": set(),
+                "plan": entry["plan"],
+            })
+            group["count"] += 1
+            group["total_ms"] += entry["duration_ms"]
+            group["max_ms"] = max(group["max_ms"], entry["duration_ms"])
+            if entry["route"]:
+                group["routes"].add(entry["route"])
+        result = []
+        for group in groups.values():
+            group["total_ms"] = round(group["total_ms"], 2)
+            group["routes"] = sorted(group["routes"])
+            result.append(group)
+        return sorted(result, key=lambda g: g["total_ms"], reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self._plans.clear()
+
+# 앱 전역 샘플러 (SLOW_QUERY_ENABLED일 때 main에서 엔진에 등록)
+slow_query_sampler = SlowQuerySampler(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    buffer_size=settings.SLOW_QUERY_BUFFER_SIZE,
+    sample_rate=settings.SLOW_QUERY_SAMPLE_RATE,
+    explain=settings.SLOW_QUERY_EXPLAIN,
+)
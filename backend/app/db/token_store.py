@@ -0,0 +1,219 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+import redis
+
+class TokenStore(ABC):
+    """리프레시 토큰과 토큰 폐기(블랙리스트) 상태 저장소 인터페이스"""
+
+    @abstractmethod
+    def save_refresh_token(self, user_id: str, token: str, expires_in_seconds: int) -> None:
+        """리프레시 토큰 저장 (사용자당 1개)"""
+
+    @abstractmethod
+    def get_refresh_token(self, user_id: str) -> Optional[str]:
+        """사용자 ID로 리프레시 토큰 조회"""
+
+    @abstractmethod
+    def rotate_refresh_token(
+        self,
+        user_id: str,
+        old_token: str,
+        new_refresh_token: str,
+        new_access_token: str,
+        expires_in_seconds: int,
+        grace_seconds: int,
+    ) -> Optional[Tuple[str, str]]:
+        """
+        리프레시 토큰 교체 (compare-and-swap)
+
+        저장된 토큰이 old_token이면 새 토큰으로 바꾸고 새 (액세스, 리프레시) 토큰 쌍을 반환합니다.
+        grace_seconds 안에 같은 old_token으로 다시 요청하면 (동시에 갱신한 다른 탭 등)
+        이미 발급한 토큰 쌍을 반환합니다. 둘 다 아니면 None.
+        """
+
+    @abstractmethod
+    def delete_refresh_token(self, user_id: str) -> None:
+        """리프레시 토큰 삭제 (유예 중인 교체 기록 포함)"""
+
+    @abstractmethod
+    def is_token_blacklisted(self, token: str) -> bool:
+        """블랙리스트에 등록된 토큰인지 확인"""
+
+    @abstractmethod
+    def blacklist_token(self, token: str, expires_in_seconds: int) -> None:
+        """토큰을 만료 시각까지 블랙리스트에 등록"""
+
+class MemoryTokenStore(TokenStore):
+    """
+    프로세스 내부 메모리 저장소 (테스트 및 단일 노드용)
+
+    만료된 항목은 조회 시점과 주기적인 정리 시점에 제거합니다.
+    """
+    _PURGE_EVERY = 1000  # 쓰기 N회마다 만료 항목 정리
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[object, float]] = {}
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _set(self, key: str, value: object, expires_in_seconds: int) -> None:
+        with self._lock:
+            self._set_locked(key, value, expires_in_seconds)
+
+    def _set_locked(self, key: str, value: object, expires_in_seconds: int) -> None:
+        self._data[key] = (value, time.monotonic() + expires_in_seconds)
+        self._writes += 1
+        if self._writes % self._PURGE_EVERY == 0:
+            now = time.monotonic()
+            for k in [k for k, (_, exp) in self._data.items() if exp <= now]:
+                del self._data[k]
+
+    def _get(self, key: str) -> Optional[object]:
+        with self._lock:
+            return self._get_locked(key)
+
+    def _get_locked(self, key: str) -> Optional[object]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def save_refresh_token(self, user_id: str, token: str, expires_in_seconds: int) -> None:
+        self._set(f"refresh_token:{user_id}", token, expires_in_seconds)
+
+    def get_refresh_token(self, user_id: str) -> Optional[str]:
+        return self._get(f"refresh_token:{user_id}")
+
+    def rotate_refresh_token(
+        self,
+        user_id: str,
+        old_token: str,
+        new_refresh_token: str,
+        new_access_token: str,
+        expires_in_seconds: int,
+        grace_seconds: int,
+    ) -> Optional[Tuple[str, str]]:
+        key = f"refresh_token:{user_id}"
+        grace_key = f"refresh_grace:{user_id}"
+        with self._lock:
+            if self._get_locked(key) == old_token:
+                self._set_locked(key, new_refresh_token, expires_in_seconds)
+                if grace_seconds > 0:
+                    self._set_locked(grace_key, (old_token, new_access_token, new_refresh_token), grace_seconds)
+                return new_access_token, new_refresh_token
+            grace = self._get_locked(grace_key)
+            if grace is not None and grace[0] == old_token:
+                return grace[1], grace[2]
+            return None
+
+    def delete_refresh_token(self, user_id: str) -> None:
+        with self._lock:
+            self._data.pop(f"refresh_token:{user_id}", None)
+            self._data.pop(f"refresh_grace:{user_id}", None)
+
+    def is_token_blacklisted(self, token: str) -> bool:
+        return self._get(f"blacklist:{token}") is not None
+
+    def blacklist_token(self, token: str, expires_in_seconds: int) -> None:
+        if expires_in_seconds > 0:
+            self._set(f"blacklist:{token}", "1", expires_in_seconds)
+
+# KEYS[1]: 리프레시 토큰 키, KEYS[2]: 교체 유예 기록 키
+# ARGV: 기존 토큰, 새 리프레시 토큰, 새 액세스 토큰, 토큰 TTL, 유예 TTL
+_ROTATE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[4])
+    if tonumber(ARGV[5]) > 0 then
+        redis.call('DEL', KEYS[2])
+        redis.call('HSET', KEYS[2], 'old', ARGV[1], 'access', ARGV[3], 'refresh', ARGV[2])
+        redis.call('EXPIRE', KEYS[2], ARGV[5])
+    end
+    return {ARGV[3], ARGV[2]}
+end
+if redis.call('HGET', KEYS[2], 'old') == ARGV[1] then
+    return redis.call('HMGET', KEYS[2], 'access', 'refresh')
+end
+return false
+"""
+
+class RedisTokenStore(TokenStore):
+    """단일 Redis 저장소"""
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        # EVALSHA로 실행 (스크립트가 없으면 redis-py가 자동으로 다시 로드)
+        self._rotate = client.register_script(_ROTATE_SCRIPT)
+
+    def refresh_token_key(self, user_id: str) -> str:
+        return f"refresh_token:{user_id}"
+
+    def refresh_grace_key(self, user_id: str) -> str:
+        return f"refresh_grace:{user_id}"
+
+    def blacklist_key(self, token: str) -> str:
+        return f"blacklist:{token}"
+
+    def save_refresh_token(self, user_id: str, token: str, expires_in_seconds: int) -> None:
+        self.client.setex(self.refresh_token_key(user_id), expires_in_seconds, token)
+
+    def get_refresh_token(self, user_id: str) -> Optional[str]:
+        return self.client.get(self.refresh_token_key(user_id))
+
+    def rotate_refresh_token(
+        self,
+        user_id: str,
+        old_token: str,
+        new_refresh_token: str,
+        new_access_token: str,
+        expires_in_seconds: int,
+        grace_seconds: int,
+    ) -> Optional[Tuple[str, str]]:
+        result = self._rotate(
+            keys=[self.refresh_token_key(user_id), self.refresh_grace_key(user_id)],
+            args=[old_token, new_refresh_token, new_access_token, expires_in_seconds, grace_seconds],
+        )
+        if not result or None in result:
+            return None
+        return result[0], result[1]
+
+    def delete_refresh_token(self, user_id: str) -> None:
+        self.client.delete(self.refresh_token_key(user_id), self.refresh_grace_key(user_id))
+
+    def is_token_blacklisted(self, token: str) -> bool:
+        return bool(self.client.exists(self.blacklist_key(token)))
+
+    def blacklist_token(self, token: str, expires_in_seconds: int) -> None:
+        if expires_in_seconds > 0:
+            self.client.setex(self.blacklist_key(token), expires_in_seconds, "1")
+
+class RedisClusterTokenStore(RedisTokenStore):
+    """
+    Redis Cluster 저장소
+
+    사용자별 키는 {user_id} 해시 태그로 같은 슬롯에 모아서
+    여러 키를 다루는 명령/스크립트도 한 노드에서 처리되게 합니다.
+    블랙리스트 키는 토큰 단위로 전체 슬롯에 고르게 분산됩니다.
+    """
+
+    def refresh_token_key(self, user_id: str) -> str:
+        return f"refresh_token:{{{user_id}}}"
+
+    def refresh_grace_key(self, user_id: str) -> str:
+        return f"refresh_grace:{{{user_id}}}"
+
+def create_token_store(backend: str, client: Optional[redis.Redis] = None) -> TokenStore:
+    """설정된 백엔드 이름으로 토큰 저장소 생성"""
+    if backend == "memory":
+        return MemoryTokenStore()
+    if backend == "redis":
+        return RedisTokenStore(client)
+    if backend == "redis_cluster":
+        return RedisClusterTokenStore(client)
+    raise ValueError(f"알 수 없는 토큰 저장소 백엔드: {backend}")
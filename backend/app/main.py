@@ -2,14 +2,26 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.api import api_router
+from app.core.auth import AuthContextMiddleware
 from app.core.config import settings
+from app.core.memory_profiler import MemoryProfilerMiddleware
+from app.core.responses import ORJSONResponse
+from app.core.tracing import (
+    TracingMiddleware, instrument_engine, native_http_tracing, setup_tracing, shutdown_tracing
+)
 from app.db.session import engine
+from app.db.slow_query import slow_query_sampler
+from app.services import availability as availability_service
 from app.db.base import Base  # 이 import가 중요합니다 - 모든 모델을 등록합니다
+from app.services.active_users import active_user_recorder
+from app.services.login_event import login_event_recorder
 
 # 앱 초기화
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    # 모든 응답을 orjson으로 직렬화
+    default_response_class=ORJSONResponse
 )
 
 # CORS 설정
@@ -21,6 +33,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 인증 컨텍스트 설정 (토큰은 요청당 한 번만 검증)
+app.add_middleware(AuthContextMiddleware)
+
+# 표본 요청의 메모리 할당 프로파일 (비활성화 시 미들웨어 자체를 등록하지 않음)
+if settings.MEMORY_PROFILER_ENABLED:
+    app.add_middleware(MemoryProfilerMiddleware)
+
+# 요청/SQL 추적
+# 요청 span은 FastAPI가 직접 만들고, 지원하지 않는 버전에서만 미들웨어로 생성
+# (가장 바깥 미들웨어로 두어 다른 미들웨어 시간까지 포함)
+if settings.TRACING_ENABLED:
+    setup_tracing()
+    instrument_engine(engine)
+    if not native_http_tracing():
+        app.add_middleware(TracingMiddleware)
+
+# 느린 쿼리 샘플러 (기준 시간을 넘은 쿼리만 기록)
+if settings.SLOW_QUERY_ENABLED:
+    slow_query_sampler.install(engine)
+
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -31,8 +63,44 @@ async def init_db():
     # import logging
     # logging.basicConfig()
     # logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
+    if engine.dialect.name == "postgresql":
+        # 사용자 유사 검색 인덱스(gin_trgm_ops)에 필요한 확장
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
     Base.metadata.create_all(bind=engine)
 
+# 사용자명/이메일 Bloom 필터 생성 시작/중단 (완료 전까지는 DB로 확인)
+@app.on_event("startup")
+async def start_availability_filter_build():
+    await availability_service.start_build()
+
+@app.on_event("shutdown")
+async def stop_availability_filter_build():
+    await availability_service.stop_build()
+
+# 로그인 이벤트 write-behind 기록기 시작/종료
+@app.on_event("startup")
+async def start_login_event_recorder():
+    await login_event_recorder.start()
+
+@app.on_event("shutdown")
+async def stop_login_event_recorder():
+    # 큐에 남은 이벤트를 모두 기록한 뒤 종료
+    await login_event_recorder.stop()
+
+# 활성 사용자 집계 flush 태스크 시작/종료
+@app.on_event("startup")
+async def start_active_user_recorder():
+    await active_user_recorder.start()
+
+@app.on_event("shutdown")
+async def stop_active_user_recorder():
+    await active_user_recorder.stop()
+
+@app.on_event("shutdown")
+async def flush_traces():
+    shutdown_tracing()
+
 # 기본 라우트
 @app.get("/")
 def read_root():
@@ -0,0 +1,22 @@
+from enum import Enum
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Uuid
+
+from app.db.base_class import Base
+
+class LoginEventType(str, Enum):
+    LOGIN = "login"
+    REFRESH = "refresh"
+    LOGOUT = "logout"
+
+class LoginEvent(Base):
+    """로그인 이력 (추가 전용 테이블, LoginEventRecorder가 배치로 기록)"""
+    __tablename__ = "login_events"
+
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가하므로 variant 지정
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    # 쓰기 경로를 가볍게 유지하기 위해 FK 제약은 두지 않음
+    user_id = Column(Uuid, index=True, nullable=False)
+    event_type = Column(String, nullable=False)
+    provider = Column(String, nullable=True)  # OAuth 로그인인 경우 제공자
+    created_at = Column(DateTime, nullable=False)
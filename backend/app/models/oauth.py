@@ -1,7 +1,8 @@
 from enum import Enum
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
+from uuid import UUID
 
 class OAuthProvider(str, Enum):
     GOOGLE = "google"
@@ -15,8 +16,7 @@ class OAuthUserCreate(BaseModel):
     profile_image: Optional[str] = None
     
 class OAuthUser(OAuthUserCreate):
-    user_id: int
+    user_id: UUID
     created_at: datetime
     
-    class Config:
-        orm_mode = True 
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True) 
\ No newline at end of file
@@ -1,6 +1,8 @@
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, ForeignKey
+import uuid
+
+from sqlalchemy import DDL, Boolean, Column, Integer, String, DateTime, ForeignKey, Index, Uuid, event
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import object_session, relationship
 from typing import Optional
 
 from app.db.base_class import Base
@@ -8,9 +10,12 @@ from app.db.base_class import Base
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(String, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=True)
-    username = Column(String, unique=True, index=True)
+    # 네이티브 UUID (PostgreSQL uuid 16바이트, SQLite는 CHAR(32))
+    # ORM은 애플리케이션에서 생성하고, 직접 INSERT하는 경우에는 PostgreSQL 기본값 사용
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    # 유일성은 아래 lower() 함수 인덱스로 보장 (대소문자 무시)
+    email = Column(String, nullable=True)
+    username = Column(String)
     hashed_password = Column(String, nullable=True)  # OAuth 사용자는 비밀번호가 없을 수 있음
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
@@ -21,17 +26,67 @@ class User(Base):
     name = Column(String, nullable=True)
     profile_image = Column(String, nullable=True)
     
+    # 마지막 로그인 시각 (LoginEventRecorder가 배치로 갱신)
+    last_login_at = Column(DateTime, nullable=True)
+    
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # 응답 내용이 바뀔 때마다 1씩 증가 (ETag 생성용)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     # 관계 설정
     oauth_accounts = relationship("OAuthAccount", back_populates="user")
 
+    __table_args__ = (
+        # 대소문자를 무시한 유일성 + lower() 조건 조회용 인덱스
+        Index("uq_users_email_lower", func.lower(email), unique=True),
+        Index("uq_users_username_lower", func.lower(username), unique=True),
+        # 사용자 검색용 (PostgreSQL 전용, SQLite는 위 lower() 인덱스 범위 조회로 대체)
+        # 접두어 검색: LIKE 'q%'는 text_pattern_ops B-tree 인덱스를 사용
+        Index(
+            "ix_users_username_prefix", func.lower(username).label("username_lower"),
+            postgresql_ops={"username_lower": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_name_prefix", func.lower(name).label("name_lower"),
+            postgresql_ops={"name_lower": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_email_prefix", func.lower(email).label("email_lower"),
+            postgresql_ops={"email_lower": "text_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # SQLite 대체 검색용 (username/email은 위 유니크 lower() 인덱스 사용)
+        Index("ix_users_name_lower", func.lower(name)).ddl_if(dialect="sqlite"),
+        # 유사 검색: pg_trgm GIN 인덱스 (% 연산자 / similarity)
+        Index(
+            "ix_users_username_trgm", func.lower(username).label("username_lower"),
+            postgresql_using="gin", postgresql_ops={"username_lower": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_name_trgm", func.lower(name).label("name_lower"),
+            postgresql_using="gin", postgresql_ops={"name_lower": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+# SQLite에는 UUID 생성 함수가 없으므로 PostgreSQL에서만 서버 기본값 지정 (PostgreSQL 13+ 내장 함수)
+event.listen(
+    User.__table__,
+    "after_create",
+    DDL("ALTER TABLE users ALTER COLUMN id SET DEFAULT gen_random_uuid()").execute_if(dialect="postgresql"),
+)
+
+@event.listens_for(User, "before_update")
+def _bump_version(mapper, connection, target: User) -> None:
+    # 동시 수정에도 버전이 겹치지 않도록 DB에서 증가 (플러시 후 값은 만료되어 다시 로드됨)
+    session = object_session(target)
+    if session is not None and session.is_modified(target, include_collections=False):
+        target.version = User.version + 1
+
 class OAuthAccount(Base):
     __tablename__ = "oauth_accounts"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"))
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), index=True)
     provider = Column(String, index=True)
     provider_user_id = Column(String, index=True)
     access_token = Column(String, nullable=True)
@@ -0,0 +1,136 @@
+from typing import Any, List, Optional
+from datetime import date, datetime
+from pydantic import BaseModel
+
+# 느린 쿼리 기록 항목
+class SlowQuery(BaseModel):
+    fingerprint: str
+    sql: str  # 리터럴/IN 목록을 지운 정규화 SQL
+    params_shape: Any = None  # 파라미터 값 대신 타입만
+    duration_ms: float
+    route: Optional[str] = None
+    recorded_at: datetime
+    plan: Optional[str] = None  # EXPLAIN 결과 (수집 전이면 None)
+
+# 쿼리 형태별 집계
+class SlowQueryGroup(BaseModel):
+    fingerprint: str
+    sql: str
+    count: int
+    total_ms: float
+    max_ms: float
+    routes: List[str]
+    plan: Optional[str] = None
+
+# 느린 쿼리 조회 응답 모델
+class SlowQueryReport(BaseModel):
+    threshold_ms: float
+    summary: List[SlowQueryGroup]
+    recent: List[SlowQuery]
+
+# 할당 위치별 누적 순 증가량
+class AllocationSite(BaseModel):
+    site: str  # 파일:줄
+    size_bytes: int
+    blocks: int
+    samples: int  # 이 위치가 나타난 표본 요청 수
+
+# 라우트별 메모리 할당 집계
+class RouteAllocation(BaseModel):
+    route: str
+    samples: int
+    avg_net_bytes: int  # 요청이 끝난 뒤에도 남아 있는 할당의 평균
+    max_net_bytes: int
+    total_net_bytes: int
+    total_net_blocks: int
+    top_sites: List[AllocationSite]
+
+# 메모리 프로파일 조회 응답 모델
+class MemoryProfileReport(BaseModel):
+    enabled: bool
+    pid: int  # 워커가 여러 개면 응답한 워커의 보고서
+    generated_at: datetime
+    sample_rate: float
+    sampled_requests: int
+    skipped_busy: int  # 다른 표본 측정 중이라 건너뛴 요청 수
+    routes: List[RouteAllocation]
+
+# 메모리 프로파일 파일 저장 응답 모델
+class MemoryProfileDump(BaseModel):
+    path: str
+
+# 함수별 CPU 표본 수
+class CpuProfileFunction(BaseModel):
+    function: str  # 파일:함수 (sys.path 기준 상대 경로)
+    self_samples: int  # 가장 안쪽 프레임이었던 표본 수
+    total_samples: int  # 스택에 포함된 표본 수
+    self_pct: float
+    total_pct: float
+
+# 최상위 패키지별 CPU 표본 수 (passlib, jose, pydantic, sqlalchemy 등)
+class CpuProfilePackage(BaseModel):
+    package: str
+    samples: int
+    pct: float
+
+# CPU 프로파일 조회 응답 모델
+class CpuProfileReport(BaseModel):
+    seconds: float
+    interval_ms: float
+    ticks: int  # 스택을 수집한 횟수
+    samples: int  # 대기 중이 아닌 스레드 스택 수
+    idle_samples: int
+    functions: List[CpuProfileFunction]
+    packages: List[CpuProfilePackage]
+
+# 일별 활성 사용자 수
+class DailyActiveUsers(BaseModel):
+    day: date
+    users: int
+
+# 활성 사용자 기록기 상태 (이 워커 기준)
+class ActiveUserRecorderStats(BaseModel):
+    recorded: int  # flush 대기열에 넣은 사용자 수
+    deduplicated: int  # dedup 창 안이라 건너뛴 요청 수
+    dropped: int  # 대기열이 가득 찼거나 기록에 실패해 버린 수
+    flushed: int
+    pending: int
+
+# 활성 사용자 집계 응답 모델 (HyperLogLog 추정치, 오차 약 0.81%)
+class ActiveUserReport(BaseModel):
+    end: date
+    backend: str
+    daily: List[DailyActiveUsers]
+    dau: int
+    wau: int  # end까지 7일간 고유 사용자
+    mau: int  # end까지 30일간 고유 사용자
+    stickiness: Optional[float] = None  # DAU / MAU
+    recorder: ActiveUserRecorderStats
+
+# 남은 TTL 구간별 키 수
+class KeyspaceTtlBucket(BaseModel):
+    bucket: str  # <1m, <1h, <1d, <7d, <30d, >=30d
+    keys: int
+
+# 접두사별 키스페이스 통계
+class KeyspacePrefix(BaseModel):
+    prefix: str
+    keys: int
+    complete: bool  # False면 max_keys에서 멈춤 (키 수/바이트는 그때까지 기준)
+    avg_key_name_bytes: Optional[float] = None
+    sampled: int  # MEMORY USAGE를 실행한 키 수
+    avg_bytes: Optional[float] = None
+    max_bytes: Optional[int] = None
+    estimated_bytes: Optional[int] = None  # 표본 평균 x 키 수
+    no_ttl: int  # 만료 시간이 없는 키 수
+    ttl_histogram: List[KeyspaceTtlBucket]
+
+# Redis 키스페이스 메모리 보고서 응답 모델
+class KeyspaceReport(BaseModel):
+    generated_at: datetime
+    seconds: float
+    used_memory: Optional[int] = None  # INFO memory (인스턴스 전체)
+    scanned_keys: int
+    timed_out: bool = False  # True면 max_seconds에서 멈춤 (complete=False 접두사는 부분 결과)
+    sample_rate: float
+    prefixes: List[KeyspacePrefix]
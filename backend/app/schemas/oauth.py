@@ -1,11 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
+from uuid import UUID
 from app.models.oauth import OAuthProvider
 
 
 class OAuthAccountBase(BaseModel):
-    user_id: str
+    user_id: UUID
     provider: str
     provider_user_id: str
     access_token: Optional[str] = None
@@ -28,8 +29,7 @@ class OAuthAccountInDBBase(OAuthAccountBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OAuthAccount(OAuthAccountInDBBase):
@@ -1,13 +1,15 @@
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
-from pydantic import BaseModel, EmailStr, Field
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from app.core.config import settings
 
 # 기본 사용자 모델
+# is_active/is_superuser는 클라이언트가 바꿀 수 없도록 생성/수정 모델에는 두지 않음 (응답/DB 모델에만)
 class UserBase(BaseModel):
     email: Optional[EmailStr] = None
     username: Optional[str] = None
-    is_active: Optional[bool] = True
-    is_superuser: Optional[bool] = False
 
 # 사용자 생성 시 사용되는 모델
 class UserCreate(UserBase):
@@ -25,19 +27,58 @@ class UserUpdate(UserBase):
 
 # DB에서 가져온 데이터를 위한 모델
 class UserInDB(UserBase):
-    id: str
+    id: UUID
+    is_active: Optional[bool] = True
+    is_superuser: Optional[bool] = False
     hashed_password: str
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 # API 응답으로 반환되는 사용자 정보 모델
 class User(UserBase):
-    id: str
+    id: UUID
+    is_active: Optional[bool] = True
+    is_superuser: Optional[bool] = False
     created_at: datetime
     updated_at: Optional[datetime] = None
+    last_login_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# 사용자명/이메일 사용 가능 여부 응답 모델 (요청한 항목만 채워짐)
+class Availability(BaseModel):
+    username: Optional[bool] = None
+    email: Optional[bool] = None
+
+# 다른 서비스용 공개 프로필 (/users/batch)
+class UserProfile(BaseModel):
+    id: UUID
+    username: Optional[str] = None
+    name: Optional[str] = None
+    profile_image: Optional[str] = None
+
+# 사용자 일괄 조회 요청 (개수 제한은 검증/OpenAPI 문서에 함께 반영)
+class UserBatchRequest(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=settings.USER_BATCH_MAX_IDS)
+
+# 사용자 일괄 조회 응답 (요청 순서대로, 없거나 비활성 사용자는 null)
+class UserBatchResponse(BaseModel):
+    items: List[Optional[UserProfile]]
+
+# 사용자 검색 결과 항목 (공개 정보만, email은 관리자 검색에서만 포함)
+class UserSearchItem(BaseModel):
+    id: UUID
+    username: Optional[str] = None
+    name: Optional[str] = None
+    profile_image: Optional[str] = None
+    email: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
 
-    class Config:
-        orm_mode = True 
\ No newline at end of file
+# 사용자 검색 응답 모델 (keyset 페이지네이션)
+class UserSearchPage(BaseModel):
+    items: List[UserSearchItem]
+    next_cursor: Optional[str] = None
+    timed_out: bool = False
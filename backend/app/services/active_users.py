@@ -0,0 +1,214 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+class RedisActiveUserStore:
+    """
+    일별 HyperLogLog 활성 사용자 집계 (여러 워커 공유, 하루 키당 최대 12KB)
+
+    키에 같은 해시 태그를 붙여서 클러스터에서도 여러 날짜를 PFCOUNT 한 번으로 합칠 수 있습니다.
+    """
+
+    def __init__(self, client, retention_days: int):
+        self.client = client
+        self.retention_days = retention_days
+
+    def key(self, day: date) -> str:
+        return f"active_users:{{hll}}:{day.isoformat()}"
+
+    def add(self, day_users: Dict[date, Set[UUID]]) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for day, user_ids in day_users.items():
+            pipe.pfadd(self.key(day), *(str(user_id) for user_id in user_ids))
+            pipe.expire(self.key(day), self.retention_days * 86400)
+        pipe.execute()
+
+    def count(self, days: Iterable[date]) -> int:
+        """여러 날짜를 합친 고유 사용자 수 추정치 (오차 약 0.81%)"""
+        return self.client.pfcount(*(self.key(day) for day in days))
+
+    def daily_counts(self, days: List[date]) -> List[int]:
+        pipe = self.client.pipeline(transaction=False)
+        for day in days:
+            pipe.pfcount(self.key(day))
+        return pipe.execute()
+
+class MemoryActiveUserStore:
+    """프로세스 내부 정확한 집계 (단일 워커/개발용, 보관 기간이 지난 날짜는 정리)"""
+
+    def __init__(self, retention_days: int):
+        self.retention_days = retention_days
+        self._days: Dict[date, Set[UUID]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, day_users: Dict[date, Set[UUID]]) -> None:
+        oldest = _utc_today() - timedelta(days=self.retention_days)
+        with self._lock:
+            for day, user_ids in day_users.items():
+                self._days.setdefault(day, set()).update(user_ids)
+            for day in [day for day in self._days if day < oldest]:
+                del self._days[day]
+
+    def count(self, days: Iterable[date]) -> int:
+        with self._lock:
+            return len(set().union(*(self._days.get(day, set()) for day in days)))
+
+    def daily_counts(self, days: List[date]) -> List[int]:
+        with self._lock:
+            return [len(self._days.get(day, ())) for day in days]
+
+class ActiveUserRecorder:
+    """
+    인증된 요청의 사용자 ID를 일별 활성 사용자 집계에 기록
+
+    요청 경로에서는 메모리 집합에 넣기만 하고(Redis 호출 없음), 백그라운드 태스크가
+    flush 간격마다 날짜별 PFADD 한 번으로 모아서 보냅니다.
+    같은 사용자는 dedup 창(기본 5분) 동안 다시 기록하지 않으므로
+    워커당 사용자 한 명이 창마다 최대 한 번만 전송됩니다.
+    """
+
+    def __init__(
+        self,
+        store,
+        dedup_window: float = settings.ACTIVE_USERS_DEDUP_WINDOW_SECONDS,
+        flush_interval: float = settings.ACTIVE_USERS_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = settings.ACTIVE_USERS_MAX_PENDING,
+    ):
+        self.store = store
+        self.dedup_window = dedup_window
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.recorded = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.flushed = 0
+        self._seen: Set[tuple] = set()
+        self._seen_since = time.monotonic()
+        self._pending: Dict[date, Set[UUID]] = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """이벤트 루프에서 백그라운드 flush 태스크 시작"""
+        if self.store is None:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """flush 태스크를 멈추고 남은 사용자를 기록 (종료 시 호출)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._flush()
+
+    def record(self, user_id: UUID) -> None:
+        """요청 스레드/이벤트 루프 어디서나 호출 가능, 막히지 않음"""
+        if self._task is None:
+            return
+        day = _utc_today()
+        now = time.monotonic()
+        with self._lock:
+            # 창이 지나면 통째로 비움 (창 안에서 본 사용자만 보관하므로 메모리가 일정)
+            if now - self._seen_since >= self.dedup_window:
+                self._seen.clear()
+                self._seen_since = now
+            if (day, user_id) in self._seen:
+                self.deduplicated += 1
+                return
+            if self._pending_count >= self.max_pending:
+                self.dropped += 1
+                return
+            self._seen.add((day, user_id))
+            self._pending.setdefault(day, set()).add(user_id)
+            self._pending_count += 1
+            self.recorded += 1
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            count, self._pending_count = self._pending_count, 0
+        if not batch:
+            return
+        try:
+            await run_in_threadpool(self.store.add, batch)
+            self.flushed += count
+        except Exception as e:
+            # 집계용이므로 재시도하지 않고 버림
+            self.dropped += count
+            logger.warning(f"활성 사용자 기록 실패: {count}명, {str(e)}")
+
+    def stats(self) -> dict:
+        return {
+            "recorded": self.recorded,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "flushed": self.flushed,
+            "pending": self._pending_count,
+        }
+
+def create_active_user_store():
+    """설정된 백엔드로 활성 사용자 집계 저장소 생성 (none이면 기록하지 않음)"""
+    backend = settings.ACTIVE_USERS_BACKEND
+    retention = settings.ACTIVE_USERS_RETENTION_DAYS
+    if backend == "redis":
+        return RedisActiveUserStore(redis_client, retention)
+    if backend == "memory":
+        return MemoryActiveUserStore(retention)
+    if backend == "none":
+        return None
+    raise ValueError(f"알 수 없는 활성 사용자 집계 백엔드: {backend}")
+
+active_user_recorder = ActiveUserRecorder(create_active_user_store())
+
+def _window(end: date, days: int) -> List[date]:
+    return [end - timedelta(days=offset) for offset in range(days)]
+
+def report(end: Optional[date] = None, days: int = 30) -> dict:
+    """
+    end(기본: 오늘, UTC)까지의 일별 활성 사용자와 DAU/WAU/MAU 추정치
+
+    WAU/MAU는 7일/30일치 일별 HyperLogLog를 합친 고유 사용자 수입니다 (일별 합계가 아님).
+    """
+    store = active_user_recorder.store
+    if store is None:
+        raise RuntimeError("ACTIVE_USERS_BACKEND가 none이라 집계하지 않습니다.")
+    end = end or _utc_today()
+    window = list(reversed(_window(end, days)))
+    daily = [{"day": day, "users": users} for day, users in zip(window, store.daily_counts(window))]
+    dau = daily[-1]["users"]
+    mau = store.count(_window(end, 30))
+    return {
+        "end": end,
+        "backend": settings.ACTIVE_USERS_BACKEND,
+        "daily": daily,
+        "dau": dau,
+        "wau": store.count(_window(end, 7)),
+        "mau": mau,
+        "stickiness": round(dau / mau, 4) if mau else None,
+        "recorder": active_user_recorder.stats(),
+    }
@@ -1,22 +1,27 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from uuid import UUID
 
 import redis
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
-from app.core.security import create_access_token, create_refresh_token
-from app.db.redis import save_refresh_token, get_refresh_token, delete_refresh_token, blacklist_token
+from app.core.security import (
+    InvalidTokenError, create_access_token, create_refresh_token, decode_token, subject_user_id
+)
+from app.db.redis import save_refresh_token, rotate_refresh_token, delete_refresh_token, blacklist_token
+from app.models.login_event import LoginEventType
 from app.models.user import User
 from app.services import user as user_service
+from app.services.login_event import login_event_recorder
 
-def generate_tokens(user_id: str) -> dict:
+def generate_tokens(user_id: UUID) -> dict:
     """액세스 토큰과 리프레시 토큰을 생성"""
     access_token = create_access_token(subject=user_id)
     refresh_token = create_refresh_token(subject=user_id)
     
     # 리프레시 토큰 유효기간 계산 (초 단위)
-    refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS).total_seconds()
+    refresh_token_expires = timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES).total_seconds()
     
     return {
         "access_token": access_token,
@@ -48,6 +53,9 @@ def login(
         expires_in_seconds=int(tokens["expires_in"])
     )
     
+    # 로그인 이력은 큐에 넣고 배치로 기록 (요청 경로에서 DB 쓰기 없음)
+    login_event_recorder.record(user.id, LoginEventType.LOGIN)
+    
     return {
         "access_token": tokens["access_token"],
         "refresh_token": tokens["refresh_token"],
@@ -61,65 +69,65 @@ def refresh_tokens(
 ) -> Optional[dict]:
     """리프레시 토큰을 이용해 새 액세스 토큰 발급"""
     try:
-        from jose import jwt, JWTError
         # 리프레시 토큰 검증
-        payload = jwt.decode(
-            refresh_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        user_id = payload.get("sub")
+        payload = decode_token(refresh_token)
+        user_id = subject_user_id(payload)
         token_type = payload.get("type")
         
         # 토큰 타입 및 사용자 ID 확인
         if not user_id or token_type != "refresh":
             return None
         
-        # Redis에 저장된 리프레시 토큰과 비교
-        stored_token = get_refresh_token(user_id)
-        if not stored_token or stored_token != refresh_token:
+        # 새 토큰을 먼저 만든 뒤 Redis 스크립트 하나로 비교와 교체를 원자적으로 수행
+        # 동시에 들어온 같은 토큰의 요청은 유예 시간 동안 먼저 발급된 토큰 쌍을 받음
+        tokens = generate_tokens(user_id)
+        issued = rotate_refresh_token(
+            user_id=user_id,
+            old_token=refresh_token,
+            new_refresh_token=tokens["refresh_token"],
+            new_access_token=tokens["access_token"],
+            expires_in_seconds=int(tokens["expires_in"]),
+            grace_seconds=settings.REFRESH_TOKEN_GRACE_SECONDS,
+        )
+        if not issued:
             return None
         
-        # 사용자 존재 확인
+        # 사용자 존재 확인 (유효하지 않은 토큰은 DB 조회 없이 위에서 거부)
         user = user_service.get_by_id(db, user_id)
         if not user or not user_service.is_active(user):
+            delete_refresh_token(user_id)
             return None
         
-        # 새 토큰 발급
-        tokens = generate_tokens(user_id)
-        
-        # 기존 토큰 삭제 및 새 리프레시 토큰 저장
-        delete_refresh_token(user_id)
-        save_refresh_token(
-            user_id=user_id,
-            token=tokens["refresh_token"],
-            expires_in_seconds=int(tokens["expires_in"])
-        )
+        login_event_recorder.record(user_id, LoginEventType.REFRESH)
         
+        access_token, new_refresh_token = issued
         return {
-            "access_token": tokens["access_token"],
-            "refresh_token": tokens["refresh_token"],
+            "access_token": access_token,
+            "refresh_token": new_refresh_token,
             "token_type": "bearer"
         }
         
-    except JWTError:
+    except InvalidTokenError:
         return None
 
 def logout(
-    user_id: str,
+    user_id: UUID,
     token: str,
-    redis_client: redis.Redis
+    redis_client: redis.Redis,
+    expires_at: Optional[int] = None
 ) -> bool:
     """사용자 로그아웃 처리"""
     # 리프레시 토큰 삭제
     delete_refresh_token(user_id)
+    login_event_recorder.record(user_id, LoginEventType.LOGOUT)
     
     # 액세스 토큰 블랙리스트에 추가 (유효기간까지만)
     try:
-        from jose import jwt
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM],
-            options={"verify_exp": False}  # 만료된 토큰도 디코딩하기 위한 옵션
-        )
-        exp = payload.get("exp")
+        exp = expires_at
+        if exp is None:
+            # 만료된 토큰도 디코딩 (서명은 검증)
+            payload = decode_token(token, verify_exp=False)
+            exp = payload.get("exp")
         if exp:
             # 현재 시간과 만료 시간의 차이 계산
             now = datetime.utcnow().timestamp()
@@ -131,4 +139,4 @@ def logout(
     except Exception:
         pass
     
-    return False 
\ No newline at end of file
+    return False
\ No newline at end of file
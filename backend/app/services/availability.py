@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import threading
+from typing import Iterator, Optional
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.bloom import BloomFilter, RedisBloomFilter
+from app.core.config import settings
+from app.db.redis import redis_client
+from app.db.session import SessionLocal
+from app.models.user import User
+from app.services import user as user_service
+
+logger = logging.getLogger(__name__)
+
+def create_filter() -> BloomFilter:
+    """설정된 백엔드로 사용 중인 사용자명/이메일 Bloom 필터 생성"""
+    backend = settings.AVAILABILITY_FILTER_BACKEND
+    if backend == "redis":
+        return RedisBloomFilter(
+            redis_client,
+            "bloom:users:taken",
+            settings.AVAILABILITY_FILTER_CAPACITY,
+            settings.AVAILABILITY_FILTER_ERROR_RATE,
+        )
+    if backend == "memory":
+        # 워커마다 따로 채워지므로 단일 워커에서만 사용
+        return BloomFilter(settings.AVAILABILITY_FILTER_CAPACITY, settings.AVAILABILITY_FILTER_ERROR_RATE)
+    raise ValueError(f"알 수 없는 사용자명/이메일 필터 백엔드: {backend}")
+
+taken_filter = create_filter()
+# 시작 시 전체 스캔이 끝나기 전에는 필터를 믿지 않고 DB로 확인
+_filter_ready = False
+_build_task: Optional[asyncio.Task] = None
+_stop_build = threading.Event()
+
+class _BuildStopped(Exception):
+    """서버 종료로 필터 생성 중단"""
+
+def username_key(username: str) -> str:
+    return "u:" + username.strip().lower()
+
+def email_key(email: str) -> str:
+    return "e:" + email.strip().lower()
+
+def _iter_keys(db: Session, batch_size: int) -> Iterator[str]:
+    # yield_per로 서버 측 커서를 사용해 전체 테이블을 메모리에 올리지 않음
+    rows = db.execute(
+        select(User.username, User.email).execution_options(yield_per=batch_size)
+    )
+    for username, email in rows:
+        if _stop_build.is_set():
+            raise _BuildStopped()
+        if username:
+            yield username_key(username)
+        if email:
+            yield email_key(email)
+
+def build_from_db(batch_size: int = 10000) -> None:
+    """users 테이블을 스트리밍으로 읽어 필터 채우기 (서버 시작 시 1회)"""
+    global _filter_ready
+    db = SessionLocal()
+    try:
+        if taken_filter.is_complete():
+            # 다른 워커가 전체 스캔까지 끝낸 공유 필터(Redis)는 그대로 사용
+            # (비트맵만 있고 완료 표시가 없으면 생성 중이거나 실패한 필터이므로 다시 채움)
+            _filter_ready = True
+            return
+        taken_filter.add_many(_iter_keys(db, batch_size))
+        taken_filter.mark_complete()
+        _filter_ready = True
+        logger.info("사용자명/이메일 Bloom 필터 생성 완료")
+    except _BuildStopped:
+        # 완료 표시를 남기지 않으므로 다음 시작 때 다시 채움
+        logger.info("서버 종료로 사용자명/이메일 Bloom 필터 생성 중단")
+    except Exception as e:
+        logger.error(f"사용자명/이메일 Bloom 필터 생성 실패: {str(e)}")
+    finally:
+        db.close()
+
+def _build_finished(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"사용자명/이메일 Bloom 필터 생성 태스크 실패: {str(task.exception())}")
+
+async def start_build() -> None:
+    """스레드 풀에서 필터 생성 시작 (서버 시작 시 호출, 완료 전까지는 DB로 확인)"""
+    global _build_task
+    _stop_build.clear()
+    _build_task = asyncio.create_task(run_in_threadpool(build_from_db))
+    _build_task.add_done_callback(_build_finished)
+
+async def stop_build() -> None:
+    """진행 중인 필터 생성 중단 (종료 시 호출, 스캔 중인 스레드는 다음 행에서 멈춤)"""
+    global _build_task
+    if _build_task is None:
+        return
+    _stop_build.set()
+    _build_task.cancel()
+    try:
+        await _build_task
+    except asyncio.CancelledError:
+        pass
+    _build_task = None
+
+def _filter_rules_out(key: str) -> bool:
+    """필터로 확실히 없는 값인지 확인 (준비 전이거나 Redis 장애면 False → DB로 확인)"""
+    if not _filter_ready:
+        return False
+    try:
+        return not taken_filter.might_contain(key)
+    except Exception as e:
+        logger.error(f"Bloom 필터 조회 실패: {str(e)}")
+        return False
+
+def is_username_available(db: Session, username: str) -> bool:
+    """사용자명 사용 가능 여부 (필터에 없으면 DB 조회 없이 사용 가능)"""
+    if _filter_rules_out(username_key(username)):
+        return True
+    return user_service.get_by_username(db, username) is None
+
+def is_email_available(db: Session, email: str) -> bool:
+    """이메일 사용 가능 여부 (필터에 없으면 DB 조회 없이 사용 가능)"""
+    if _filter_rules_out(email_key(email)):
+        return True
+    return user_service.get_by_email(db, email) is None
+
+def _record_taken(username: Optional[str], email: Optional[str]) -> None:
+    keys = []
+    if username:
+        keys.append(username_key(username))
+    if email:
+        keys.append(email_key(email))
+    if keys:
+        try:
+            taken_filter.add_many(keys)
+        except Exception as e:
+            # 필터 갱신 실패는 가입/수정 자체를 막지 않음 (유니크 제약이 최종 보장)
+            logger.error(f"Bloom 필터 갱신 실패: {str(e)}")
+
+# 생성/수정 경로(서비스, CRUD, OAuth)와 상관없이 필터를 최신으로 유지
+# 롤백된 값이 남아도 오탐일 뿐이라 DB 조회로 보정됨
+@event.listens_for(User, "after_insert")
+def _user_inserted(mapper, connection, target: User) -> None:
+    _record_taken(target.username, target.email)
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    state = inspect(target)
+    username_changed = state.attrs.username.history.has_changes()
+    email_changed = state.attrs.email.history.has_changes()
+    _record_taken(
+        target.username if username_changed else None,
+        target.email if email_changed else None,
+    )
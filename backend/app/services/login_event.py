@@ -0,0 +1,180 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, insert, update
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.login_event import LoginEvent, LoginEventType
+from app.models.user import User
+from app.services import user_cache
+
+logger = logging.getLogger(__name__)
+
+# (user_id, event_type, provider, created_at)
+Event = Tuple[UUID, str, Optional[str], datetime]
+
+class LoginEventRecorder:
+    """
+    로그인/갱신/로그아웃 이벤트 write-behind 기록기
+
+    요청 경로에서는 메모리 큐에 넣기만 하고, 백그라운드 태스크가
+    크기 또는 시간 기준으로 모아서 한 번에 기록합니다.
+    - login_events 테이블에 다중 행 INSERT
+    - users.last_login_at은 사용자별 최신 시각으로 합쳐서 UPDATE
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = settings.LOGIN_EVENT_QUEUE_SIZE,
+        batch_size: int = settings.LOGIN_EVENT_BATCH_SIZE,
+        flush_interval: float = settings.LOGIN_EVENT_FLUSH_INTERVAL_SECONDS,
+        enqueue_timeout: float = settings.LOGIN_EVENT_ENQUEUE_TIMEOUT_SECONDS,
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.dropped = 0
+        self.flushed = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: List[Event] = []
+
+    async def start(self) -> None:
+        """이벤트 루프에서 백그라운드 flush 태스크 시작"""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """flush 태스크를 멈추고 큐에 남은 이벤트를 모두 기록 (종료 시 호출)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # 수집 중이던 배치와 큐에 남은 이벤트를 이어서 기록
+        batch, self._pending = self._pending, []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+        if batch:
+            await self._flush(batch)
+        self._loop = None
+
+    def record(
+        self, user_id: UUID, event_type: LoginEventType, provider: Optional[str] = None
+    ) -> None:
+        """
+        동기 코드(스레드풀)에서 이벤트 기록
+
+        요청 스레드를 막지 않도록 큐가 가득 찬 경우 이벤트를 버리고 개수만 셉니다.
+        """
+        if self._loop is None:
+            return
+        event = (user_id, event_type.value, provider, datetime.utcnow())
+        self._loop.call_soon_threadsafe(self._offer, event)
+
+    async def record_async(
+        self, user_id: UUID, event_type: LoginEventType, provider: Optional[str] = None
+    ) -> None:
+        """
+        비동기 코드에서 이벤트 기록
+
+        큐가 가득 차면 짧은 시간 동안 대기(backpressure)한 뒤에도 자리가 없으면 버립니다.
+        """
+        if self._queue is None:
+            return
+        event = (user_id, event_type.value, provider, datetime.utcnow())
+        try:
+            await asyncio.wait_for(self._queue.put(event), self.enqueue_timeout)
+        except asyncio.TimeoutError:
+            self._count_dropped()
+
+    def _offer(self, event: Event) -> None:
+        if self._queue is None:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._count_dropped()
+
+    def _count_dropped(self) -> None:
+        self.dropped += 1
+        if self.dropped % 1000 == 1:
+            logger.warning(f"로그인 이벤트 큐가 가득 차서 이벤트를 버림: 누적={self.dropped}")
+
+    async def _run(self) -> None:
+        while True:
+            # 첫 이벤트가 들어오면 배치 크기 또는 flush 간격까지 모아서 기록
+            batch = self._pending = [await self._queue.get()]
+            deadline = self._loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._pending = []
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Event]) -> None:
+        try:
+            await run_in_threadpool(write_batch, batch)
+            self.flushed += len(batch)
+        except Exception as e:
+            logger.error(f"로그인 이벤트 기록 실패: {len(batch)}건, {str(e)}")
+
+def write_batch(batch: List[Event]) -> None:
+    """이벤트 배치를 한 트랜잭션으로 기록"""
+    rows = [
+        {"user_id": user_id, "event_type": event_type, "provider": provider, "created_at": created_at}
+        for user_id, event_type, provider, created_at in batch
+    ]
+
+    # 사용자별 마지막 로그인 시각만 남김
+    last_login = {}
+    for user_id, event_type, _, created_at in batch:
+        if event_type == LoginEventType.LOGIN.value and created_at > last_login.get(user_id, datetime.min):
+            last_login[user_id] = created_at
+
+    db = SessionLocal()
+    try:
+        db.execute(insert(LoginEvent.__table__).values(rows))
+        if last_login:
+            users = User.__table__
+            db.execute(
+                update(users)
+                .where(users.c.id == bindparam("uid"))
+                # 로그인 기록은 프로필 변경이 아니므로 updated_at은 그대로 유지
+                # last_login_at도 응답에 포함되므로 버전(ETag)은 증가
+                .values(
+                    last_login_at=bindparam("ts"),
+                    updated_at=users.c.updated_at,
+                    version=users.c.version + 1,
+                ),
+                [{"uid": uid, "ts": ts} for uid, ts in last_login.items()],
+            )
+            user_cache.mark_stale(db, last_login.keys())
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+login_event_recorder = LoginEventRecorder()
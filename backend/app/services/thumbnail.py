@@ -0,0 +1,235 @@
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from PIL import Image, ImageOps, UnidentifiedImageError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.resilience import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+_EXTENSION = ".jpg"
+_TOUCH_INTERVAL_SECONDS = 3600  # 접근 시각(mtime) 갱신 간격 (LRU 순서용, 매 요청 쓰기 방지)
+
+class ThumbnailError(Exception):
+    """원본 이미지를 가져오거나 썸네일로 변환할 수 없음"""
+
+def is_allowed_source(url: str, allowed_hosts: Iterable[str]) -> bool:
+    """허용된 호스트의 http(s) 주소인지 확인 (".example.com"은 하위 도메인 포함)"""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if parts.scheme not in ("http", "https") or not host:
+        return False
+    for allowed in allowed_hosts:
+        allowed = allowed.lower()
+        if host == allowed.lstrip(".") or (allowed.startswith(".") and host.endswith(allowed)):
+            return True
+    return False
+
+def render_thumbnails(data: bytes, sizes: Iterable[int], max_pixels: int) -> Dict[int, bytes]:
+    """원본 이미지를 정사각형으로 잘라 크기별 JPEG 생성"""
+    try:
+        with Image.open(io.BytesIO(data)) as source:
+            # 디코딩 전에 헤더의 크기로 압축 폭탄 차단
+            if source.width * source.height > max_pixels:
+                raise ThumbnailError(f"이미지가 너무 큽니다: {source.width}x{source.height}")
+            image = ImageOps.exif_transpose(source).convert("RGB")
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        raise ThumbnailError(f"이미지를 읽을 수 없습니다: {e}") from e
+
+    thumbnails = {}
+    for size in sizes:
+        thumbnail = ImageOps.fit(image, (size, size), Image.Resampling.LANCZOS)
+        out = io.BytesIO()
+        thumbnail.save(out, "JPEG", quality=85, optimize=True, progressive=True)
+        thumbnails[size] = out.getvalue()
+    return thumbnails
+
+class ThumbnailCache:
+    """
+    디스크 썸네일 캐시
+
+    썸네일은 원본 내용의 SHA-256으로 저장하고(thumbs/ab/<digest>-<size>.jpg),
+    원본 주소 -> 내용 해시 색인(sources/)을 따로 둡니다.
+    profile_image 주소가 바뀌면 색인에 없으므로 새로 가져오고, 같은 이미지는 한 번만 저장됩니다.
+    전체 크기가 max_bytes를 넘으면 마지막 접근(mtime)이 오래된 썸네일부터 지웁니다.
+    여러 워커가 같은 디렉터리를 써도 되도록 파일은 임시 파일에 쓴 뒤 rename합니다.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, sizes: List[int], source_ttl_seconds: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.sizes = sorted(sizes)
+        self.source_ttl_seconds = source_ttl_seconds
+        self._usage: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def thumbnail_path(self, digest: str, size: int) -> Path:
+        return self.directory / "thumbs" / digest[:2] / f"{digest}-{size}{_EXTENSION}"
+
+    def _source_path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / "sources" / key[:2] / key
+
+    def lookup_source(self, url: str) -> Optional[str]:
+        """원본 주소의 내용 해시 (가져온 지 오래됐거나 썸네일이 지워졌으면 None)"""
+        path = self._source_path(url)
+        try:
+            if path.stat().st_mtime + self.source_ttl_seconds < time.time():
+                return None
+            digest = path.read_text().strip()
+        except (FileNotFoundError, OSError):
+            return None
+        if not all(self.thumbnail_path(digest, size).exists() for size in self.sizes):
+            return None
+        return digest
+
+    def open_thumbnail(self, digest: str, size: int) -> Optional[Path]:
+        """썸네일 파일 경로 (없으면 None), 접근 시각 갱신"""
+        path = self.thumbnail_path(digest, size)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        if now - mtime > _TOUCH_INTERVAL_SECONDS:
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+        return path
+
+    def store(self, url: str, data: bytes, max_pixels: int) -> str:
+        """원본을 크기별 썸네일로 저장하고 내용 해시 반환"""
+        digest = hashlib.sha256(data).hexdigest()
+        missing = [size for size in self.sizes if not self.thumbnail_path(digest, size).exists()]
+        written = 0
+        if missing:
+            for size, content in render_thumbnails(data, missing, max_pixels).items():
+                self._write(self.thumbnail_path(digest, size), content)
+                written += len(content)
+        self._write(self._source_path(url), digest.encode("ascii"))
+        self._add_usage(written)
+        return digest
+
+    def _write(self, path: Path, content: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _thumbnail_files(self) -> List[Tuple[Path, os.stat_result]]:
+        files = []
+        for path in (self.directory / "thumbs").glob(f"*/*{_EXTENSION}"):
+            try:
+                files.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return files
+
+    def usage(self) -> int:
+        with self._lock:
+            if self._usage is None:
+                self._usage = sum(stat.st_size for _, stat in self._thumbnail_files())
+            return self._usage
+
+    def _add_usage(self, written: int) -> None:
+        self.usage()
+        with self._lock:
+            self._usage += written
+            over = self._usage > self.max_bytes
+        if over:
+            self.evict()
+
+    def evict(self) -> int:
+        """오래 접근하지 않은 썸네일부터 최대 크기의 90%까지 삭제, 지운 파일 수 반환"""
+        files = sorted(self._thumbnail_files(), key=lambda item: item[1].st_mtime)
+        total = sum(stat.st_size for _, stat in files)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for path, stat in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= stat.st_size
+            removed += 1
+        with self._lock:
+            # 다른 워커가 쓴 파일까지 반영된 실제 크기로 맞춤
+            self._usage = total
+        if removed:
+            logger.info(f"썸네일 캐시 정리: {removed}개 삭제, 현재 {total / 1024 / 1024:.1f}MiB")
+        return removed
+
+# 앱 전역 썸네일 캐시
+thumbnail_cache = ThumbnailCache(
+    directory=settings.THUMBNAIL_CACHE_DIR,
+    max_bytes=settings.THUMBNAIL_CACHE_MAX_BYTES,
+    sizes=settings.THUMBNAIL_SIZES,
+    source_ttl_seconds=settings.THUMBNAIL_SOURCE_TTL_SECONDS,
+)
+
+# 같은 원본을 동시에 여러 번 가져오지 않도록
+_fetch_flight = SingleFlight("thumbnail_fetch")
+
+async def _fetch_source(url: str) -> bytes:
+    """원본 이미지 다운로드 (리디렉션은 따라가지 않고, 최대 크기를 넘으면 중단)"""
+    limit = settings.THUMBNAIL_MAX_SOURCE_BYTES
+    async with httpx.AsyncClient(timeout=settings.THUMBNAIL_FETCH_TIMEOUT_SECONDS) as client:
+        async with client.stream("GET", url) as response:
+            if response.status_code != 200:
+                raise ThumbnailError(f"원본 응답 {response.status_code}: {url}")
+            content_type = response.headers.get("content-type", "")
+            if not content_type.startswith("image/"):
+                raise ThumbnailError(f"이미지가 아닌 응답: {content_type}")
+            if int(response.headers.get("content-length") or 0) > limit:
+                raise ThumbnailError(f"원본이 너무 큽니다: {url}")
+            chunks = []
+            received = 0
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+                if received > limit:
+                    raise ThumbnailError(f"원본이 너무 큽니다: {url}")
+                chunks.append(chunk)
+    return b"".join(chunks)
+
+async def thumbnail_digest(url: str) -> str:
+    """
+    profile_image 주소의 썸네일 내용 해시 (캐시에 없으면 가져와서 생성)
+
+    허용되지 않은 호스트, 다운로드/변환 실패는 ThumbnailError를 발생시킵니다.
+    """
+    if not is_allowed_source(url, settings.THUMBNAIL_ALLOWED_HOSTS):
+        raise ThumbnailError(f"허용되지 않은 이미지 주소: {url}")
+    digest = await run_in_threadpool(thumbnail_cache.lookup_source, url)
+    if digest is not None:
+        return digest
+
+    async def fetch_and_store() -> str:
+        try:
+            data = await _fetch_source(url)
+        except httpx.HTTPError as e:
+            raise ThumbnailError(f"원본 다운로드 실패: {type(e).__name__} {url}") from e
+        # 디코딩/리사이즈는 CPU 작업이므로 스레드 풀에서
+        return await run_in_threadpool(
+            thumbnail_cache.store, url, data, settings.THUMBNAIL_MAX_SOURCE_PIXELS
+        )
+
+    return await _fetch_flight.do(url, fetch_and_store)
@@ -1,39 +1,87 @@
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.crud import lookups
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash, verify_password_and_update
+from app.services import user_cache
 
-def get_by_id(db: Session, user_id: str) -> Optional[User]:
+class DuplicateUserError(Exception):
+    """이메일 또는 사용자명이 이미 사용 중 (유니크 제약 위반)"""
+
+    def __init__(self, field: str):
+        super().__init__(f"duplicate {field}")
+        self.field = field
+
+def duplicate_field(error: IntegrityError) -> Optional[str]:
+    """유니크 제약 위반 오류에서 중복된 필드(email/username) 추출"""
+    diag = getattr(error.orig, "diag", None)
+    # PostgreSQL은 제약 이름, SQLite는 오류 메시지에 인덱스/컬럼 이름이 포함됨
+    source = getattr(diag, "constraint_name", None) or str(error.orig)
+    for field in ("email", "username"):
+        if field in source:
+            return field
+    return None
+
+def get_by_id(db: Session, user_id: UUID) -> Optional[User]:
     """ID로 사용자 조회"""
-    return db.query(User).filter(User.id == user_id).first()
+    return lookups.user_by_id(db, user_id)
+
+def get_profiles(db: Session, user_ids: List[UUID]) -> List[Optional[dict]]:
+    """
+    요청 순서대로 공개 프로필 반환 (없거나 비활성 사용자는 None)
+
+    캐시에 있는 사용자는 그대로 쓰고, 나머지는 IN 쿼리 한 번으로 조회한 뒤 캐시에 채웁니다.
+    """
+    unique_ids = list(dict.fromkeys(user_ids))
+    profiles = user_cache.get_profiles(unique_ids)
+    missing = [user_id for user_id in unique_ids if user_id not in profiles]
+    if missing:
+        fetched = [user_cache.profile_for(row) for row in lookups.profiles_by_ids(db, missing)]
+        user_cache.set_profiles(fetched)
+        profiles.update((profile["id"], profile) for profile in fetched)
+    return [profiles.get(user_id) for user_id in user_ids]
 
 def get_by_email(db: Session, email: str) -> Optional[User]:
-    """이메일로 사용자 조회"""
-    return db.query(User).filter(User.email == email).first()
+    """이메일로 사용자 조회 (대소문자 무시)"""
+    return lookups.user_by_email(db, email)
 
 def get_by_username(db: Session, username: str) -> Optional[User]:
-    """사용자명으로 사용자 조회"""
-    return db.query(User).filter(User.username == username).first()
+    """사용자명으로 사용자 조회 (대소문자 무시)"""
+    return lookups.user_by_username(db, username)
+
+def _commit_unique(db: Session) -> None:
+    """커밋하면서 이메일/사용자명 유니크 제약 위반을 DuplicateUserError로 변환"""
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        field = duplicate_field(e)
+        if field is None:
+            raise
+        raise DuplicateUserError(field) from e
 
 def create(db: Session, obj_in: UserCreate) -> User:
-    """새 사용자 생성"""
+    """새 사용자 생성 (중복은 사전 조회 없이 유니크 제약으로 감지)"""
     db_obj = User(
         email=obj_in.email,
         username=obj_in.username,
         hashed_password=get_password_hash(obj_in.password),
-        is_active=obj_in.is_active,
-        is_superuser=obj_in.is_superuser,
+        # 관리자 권한은 scripts.set_superuser로만 부여
+        is_active=True,
+        is_superuser=False,
     )
     db.add(db_obj)
-    db.commit()
+    _commit_unique(db)
     db.refresh(db_obj)
     return db_obj
 
 def update(db: Session, db_obj: User, obj_in: UserUpdate) -> User:
     """사용자 정보 업데이트"""
-    update_data = obj_in.dict(exclude_unset=True)
+    update_data = obj_in.model_dump(exclude_unset=True)
     
     # 비밀번호가 업데이트되는 경우 해싱 처리
     if "password" in update_data and update_data["password"]:
@@ -44,7 +92,7 @@ def update(db: Session, db_obj: User, obj_in: UserUpdate) -> User:
         setattr(db_obj, field, value)
     
     db.add(db_obj)
-    db.commit()
+    _commit_unique(db)
     db.refresh(db_obj)
     return db_obj
 
@@ -53,8 +101,14 @@ def authenticate(db: Session, username: str, password: str) -> Optional[User]:
     user = get_by_username(db, username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    verified, new_hash = verify_password_and_update(password, user.hashed_password)
+    if not verified:
         return None
+    # 해싱 정책(스킴/비용)이 바뀐 경우 로그인 성공 시점에 재해싱
+    if new_hash:
+        user.hashed_password = new_hash
+        db.add(user)
+        db.commit()
     return user
 
 def is_active(user: User) -> bool:
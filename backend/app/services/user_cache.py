@@ -0,0 +1,223 @@
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.db.redis import redis_client
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+_STALE_KEY = "user_stamps_stale"
+
+class VersionStamp(NamedTuple):
+    """사용자 응답의 버전 정보 (ETag / Last-Modified)"""
+    user_id: UUID
+    version: int
+    last_modified: datetime
+
+    @property
+    def etag(self) -> str:
+        # 같은 URL(/users/me)을 다른 사용자가 재검증해도 맞지 않도록 사용자 ID 포함
+        return f'"{self.user_id}-{self.version}"'
+
+def stamp_for(user: User) -> VersionStamp:
+    """사용자 행에서 버전 스탬프 생성 (로그인 시각이 더 최근이면 Last-Modified로 사용)"""
+    candidates = [t for t in (user.updated_at, user.last_login_at, user.created_at) if t]
+    return VersionStamp(user.id, user.version or 0, max(candidates) if candidates else datetime.min)
+
+# 다른 서비스에 제공하는 공개 프로필 필드 (/users/batch)
+PROFILE_FIELDS = ("id", "username", "name", "profile_image")
+
+def profile_for(user) -> dict:
+    """사용자 행(ORM 객체 또는 Row)에서 공개 프로필 생성"""
+    return {field: getattr(user, field) for field in PROFILE_FIELDS}
+
+class MemoryStampStore:
+    """프로세스 내부 스탬프/프로필 캐시 (단일 워커 전용, 다른 워커의 무효화를 받지 못함)"""
+
+    def __init__(self, ttl_seconds: int, profile_ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.profile_ttl_seconds = profile_ttl_seconds
+        self._data: Dict[UUID, Tuple[VersionStamp, float]] = {}
+        self._profiles: Dict[UUID, Tuple[dict, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID) -> Optional[VersionStamp]:
+        with self._lock:
+            item = self._data.get(user_id)
+            if item is None:
+                return None
+            stamp, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._data[user_id]
+                return None
+            return stamp
+
+    def set(self, stamp: VersionStamp) -> None:
+        with self._lock:
+            self._data[stamp.user_id] = (stamp, time.monotonic() + self.ttl_seconds)
+
+    def get_profiles(self, user_ids: List[UUID]) -> Dict[UUID, dict]:
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for user_id in user_ids:
+                item = self._profiles.get(user_id)
+                if item is None:
+                    continue
+                if item[1] <= now:
+                    del self._profiles[user_id]
+                    continue
+                found[user_id] = item[0]
+        return found
+
+    def set_profiles(self, profiles: List[dict]) -> None:
+        expires_at = time.monotonic() + self.profile_ttl_seconds
+        with self._lock:
+            for profile in profiles:
+                self._profiles[profile["id"]] = (profile, expires_at)
+
+    def delete_many(self, user_ids: Iterable[UUID]) -> None:
+        with self._lock:
+            for user_id in user_ids:
+                self._data.pop(user_id, None)
+                self._profiles.pop(user_id, None)
+
+class RedisStampStore:
+    """Redis 스탬프/프로필 캐시 (여러 워커가 공유)"""
+
+    def __init__(self, client, ttl_seconds: int, profile_ttl_seconds: int):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.profile_ttl_seconds = profile_ttl_seconds
+
+    def key(self, user_id: UUID) -> str:
+        return f"user_version:{user_id}"
+
+    def profile_key(self, user_id: UUID) -> str:
+        return f"user_profile:{user_id}"
+
+    def get(self, user_id: UUID) -> Optional[VersionStamp]:
+        value = self.client.get(self.key(user_id))
+        if not value:
+            return None
+        version, last_modified = value.split("|", 1)
+        return VersionStamp(user_id, int(version), datetime.fromisoformat(last_modified))
+
+    def set(self, stamp: VersionStamp) -> None:
+        self.client.setex(
+            self.key(stamp.user_id),
+            self.ttl_seconds,
+            f"{stamp.version}|{stamp.last_modified.isoformat()}",
+        )
+
+    def get_profiles(self, user_ids: List[UUID]) -> Dict[UUID, dict]:
+        # MGET은 클러스터에서 슬롯이 다른 키를 묶을 수 없으므로 파이프라인 GET
+        pipe = self.client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.get(self.profile_key(user_id))
+        found = {}
+        for user_id, value in zip(user_ids, pipe.execute()):
+            if value:
+                profile = orjson.loads(value)
+                profile["id"] = user_id
+                found[user_id] = profile
+        return found
+
+    def set_profiles(self, profiles: List[dict]) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for profile in profiles:
+            pipe.setex(self.profile_key(profile["id"]), self.profile_ttl_seconds, orjson.dumps(profile))
+        pipe.execute()
+
+    def delete_many(self, user_ids: Iterable[UUID]) -> None:
+        # 클러스터에서도 슬롯이 다른 키를 한 번에 지우지 않도록 키마다 삭제
+        pipe = self.client.pipeline(transaction=False)
+        for user_id in user_ids:
+            pipe.delete(self.key(user_id))
+            pipe.delete(self.profile_key(user_id))
+        pipe.execute()
+
+def create_stamp_store():
+    """설정된 백엔드로 스탬프/프로필 캐시 생성 (none이면 매번 DB에서 확인)"""
+    backend = settings.USER_VERSION_CACHE_BACKEND
+    ttl = settings.USER_VERSION_CACHE_TTL_SECONDS
+    profile_ttl = settings.USER_PROFILE_CACHE_TTL_SECONDS
+    if backend == "redis":
+        return RedisStampStore(redis_client, ttl, profile_ttl)
+    if backend == "memory":
+        return MemoryStampStore(ttl, profile_ttl)
+    if backend == "none":
+        return None
+    raise ValueError(f"알 수 없는 버전 캐시 백엔드: {backend}")
+
+stamp_store = create_stamp_store()
+
+def get_stamp(user_id: UUID) -> Optional[VersionStamp]:
+    """캐시된 버전 스탬프 조회 (캐시 장애 시 None → DB로 확인)"""
+    if stamp_store is None:
+        return None
+    try:
+        return stamp_store.get(user_id)
+    except Exception as e:
+        logger.error(f"버전 스탬프 조회 실패: {str(e)}")
+        return None
+
+def set_stamp(stamp: VersionStamp) -> None:
+    if stamp_store is None:
+        return
+    try:
+        stamp_store.set(stamp)
+    except Exception as e:
+        logger.error(f"버전 스탬프 저장 실패: {str(e)}")
+
+def get_profiles(user_ids: List[UUID]) -> Dict[UUID, dict]:
+    """캐시된 공개 프로필 조회 (없는 ID는 결과에서 빠짐, 캐시 장애 시 빈 결과)"""
+    if stamp_store is None or not user_ids:
+        return {}
+    try:
+        return stamp_store.get_profiles(user_ids)
+    except Exception as e:
+        logger.error(f"프로필 캐시 조회 실패: {str(e)}")
+        return {}
+
+def set_profiles(profiles: List[dict]) -> None:
+    if stamp_store is None or not profiles:
+        return
+    try:
+        stamp_store.set_profiles(profiles)
+    except Exception as e:
+        logger.error(f"프로필 캐시 저장 실패: {str(e)}")
+
+def mark_stale(db: Session, user_ids: Iterable[UUID]) -> None:
+    """커밋되면 스탬프/프로필을 지울 사용자 등록 (Core UPDATE 등 ORM 이벤트가 없는 경로용)"""
+    db.info.setdefault(_STALE_KEY, set()).update(user_ids)
+
+# 수정이 커밋된 뒤에 지워야 커밋 전 값이 다시 캐시되지 않음
+# 커밋 직전에 읽힌 값이 남는 경합은 TTL로 제한
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    session = object_session(target)
+    if session is not None:
+        mark_stale(session, [target.id])
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    user_ids = session.info.pop(_STALE_KEY, None)
+    if user_ids and stamp_store is not None:
+        try:
+            stamp_store.delete_many(user_ids)
+        except Exception as e:
+            logger.error(f"버전 스탬프 무효화 실패: {str(e)}")
+
+@event.listens_for(Session, "after_rollback")
+def _discard_stale(session: Session) -> None:
+    session.info.pop(_STALE_KEY, None)
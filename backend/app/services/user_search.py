@@ -0,0 +1,172 @@
+import base64
+import json
+import time
+import uuid
+from decimal import Decimal, InvalidOperation
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import Numeric, and_, cast, func, literal, or_, select, tuple_
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.user import User
+
+PREFIX = "prefix"
+FUZZY = "fuzzy"
+
+class InvalidCursor(ValueError):
+    """잘못된 페이지 커서"""
+
+def encode_cursor(values: List[Any]) -> str:
+    """[정렬 키, 사용자 ID] (UUID/Decimal은 문자열로 직렬화)"""
+    values = [str(value) if isinstance(value, Decimal) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(values).encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise InvalidCursor(cursor)
+    if not isinstance(values, list) or len(values) != 2 or not isinstance(values[1], str):
+        raise InvalidCursor(cursor)
+    try:
+        values[1] = uuid.UUID(values[1])
+    except ValueError:
+        raise InvalidCursor(cursor)
+    return values
+
+def _cursor_score(value: Any) -> Decimal:
+    """유사도 모드 커서의 정렬 키 (숫자 또는 숫자 문자열)"""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise InvalidCursor(value)
+    try:
+        score = Decimal(str(value))
+    except InvalidOperation:
+        raise InvalidCursor(value)
+    if not score.is_finite():
+        raise InvalidCursor(value)
+    return score
+
+def _cursor_text(value: Any) -> str:
+    """접두어/부분 문자열 모드 커서의 정렬 키 (NULL 정렬 키는 빈 문자열과 같음)"""
+    if value is None:
+        return ""
+    if not isinstance(value, str):
+        raise InvalidCursor(value)
+    return value
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+def _prefix_match(expr, q: str, dialect: str):
+    if dialect == "postgresql":
+        # 상수 패턴이어야 text_pattern_ops 인덱스를 사용
+        return expr.like(_escape_like(q) + "%", escape="\\")
+    # SQLite 등: lower() 인덱스를 쓰는 범위 조회로 접두어 검색
+    return and_(expr >= q, expr < q + "\uffff")
+
+def _substring_match(expr, q: str):
+    return expr.like("%" + _escape_like(q) + "%", escape="\\")
+
+def _apply_time_budget(db: Session, timeout_ms: int):
+    """
+    검색 쿼리에 시간 제한 적용, 해제 함수 반환
+
+    PostgreSQL은 트랜잭션 단위 statement_timeout,
+    SQLite는 progress handler로 제한 시간을 넘으면 쿼리를 중단합니다.
+    """
+    conn = db.connection()
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+        conn.exec_driver_sql(
+            f"SET LOCAL pg_trgm.similarity_threshold = {float(settings.USER_SEARCH_MIN_SIMILARITY)}"
+        )
+        return lambda: None
+    if dialect == "sqlite":
+        raw = conn.connection.driver_connection
+        deadline = time.monotonic() + timeout_ms / 1000
+        raw.set_progress_handler(lambda: int(time.monotonic() > deadline), 1000)
+        return lambda: raw.set_progress_handler(None, 0)
+    return lambda: None
+
+def search_users(
+    db: Session,
+    q: str,
+    *,
+    mode: str = PREFIX,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    include_email: bool = False,
+    timeout_ms: int = settings.USER_SEARCH_TIMEOUT_MS,
+) -> Tuple[list, Optional[str], bool]:
+    """
+    username/name(/email) 검색, keyset 페이지네이션
+
+    반환값: (결과 행 목록, 다음 페이지 커서, 시간 제한 초과 여부)
+    - prefix: 접두어 일치, lower(username), id 순
+    - fuzzy: PostgreSQL은 pg_trgm 유사도 순, 그 외 DB는 부분 문자열 일치
+    """
+    q = q.strip().lower()
+    dialect = db.get_bind().dialect.name
+    username = func.lower(User.username)
+    name = func.lower(User.name)
+    email = func.lower(User.email)
+    after = decode_cursor(cursor) if cursor else None
+
+    stmt = select(User.id, User.username, User.name, User.profile_image)
+    if include_email:
+        stmt = stmt.add_columns(User.email)
+
+    if mode == FUZZY and dialect == "postgresql":
+        # float4 유사도를 그대로 커서에 담으면 JSON 왕복에서 값이 달라져 행이 중복/누락되므로
+        # 정렬과 비교 모두 소수 6자리 numeric으로 반올림한 값 사용 (커서에는 문자열로 저장)
+        score = func.round(
+            cast(
+                func.greatest(
+                    func.similarity(username, q), func.similarity(func.coalesce(name, ""), q)
+                ),
+                Numeric,
+            ),
+            6,
+        )
+        conditions = [username.op("%")(q), name.op("%")(q)]
+        if include_email:
+            conditions.append(_prefix_match(email, q, dialect))
+        stmt = stmt.add_columns(score.label("sort_key")).where(or_(*conditions))
+        if after:
+            after_score = literal(_cursor_score(after[0]), Numeric)
+            stmt = stmt.where(or_(score < after_score, and_(score == after_score, User.id > after[1])))
+        stmt = stmt.order_by(score.desc(), User.id)
+    else:
+        match = _substring_match if mode == FUZZY else (lambda expr, value: _prefix_match(expr, value, dialect))
+        conditions = [match(username, q), match(name, q)]
+        if include_email:
+            conditions.append(match(email, q))
+        # username이 없고 name만 일치하는 행도 커서 비교에서 빠지지 않도록 NULL은 빈 문자열로 정렬
+        sort_key = func.coalesce(username, "")
+        stmt = stmt.add_columns(sort_key.label("sort_key")).where(or_(*conditions))
+        if after:
+            stmt = stmt.where(tuple_(sort_key, User.id) > tuple_(literal(_cursor_text(after[0])), literal(after[1], User.id.type)))
+        stmt = stmt.order_by(sort_key, User.id)
+
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    stmt = stmt.limit(limit + 1)
+
+    reset = _apply_time_budget(db, timeout_ms)
+    try:
+        rows = db.execute(stmt).all()
+    except OperationalError:
+        # 시간 제한 초과 (PostgreSQL: QueryCanceled, SQLite: interrupted)
+        db.rollback()
+        return [], None, True
+    finally:
+        reset()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([last.sort_key, str(last.id)])
+    return rows, next_cursor, False
@@ -0,0 +1,78 @@
+"""
+JWT 코덱 백엔드 비교 벤치마크
+
+실행: python -m scripts.bench_jwt [--ops 20000] [--algorithm HS256]
+
+백엔드별/클레임 형식별로 인코딩·디코딩 처리량과 토큰 크기를 출력합니다.
+PyJWT가 설치되어 있지 않으면 pyjwt 백엔드는 건너뜁니다.
+백엔드를 바꿔도 기존 토큰이 그대로 검증되는지 교차 디코딩도 확인합니다.
+"""
+import argparse
+import secrets
+import time
+import uuid
+from typing import Callable, Dict
+
+from app.core.security import TokenCodec, compact_claims, create_token_codec
+
+
+def ops_per_sec(fn: Callable[[], object], ops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(ops):
+        fn()
+    return ops / (time.perf_counter() - start)
+
+
+def bench(name: str, codec: TokenCodec, claims: Dict, ops: int) -> str:
+    token = codec.encode(claims)
+    encode_rate = ops_per_sec(lambda: codec.encode(claims), ops)
+    decode_rate = ops_per_sec(lambda: codec.decode(token), ops)
+    print(f"  {name:<16} {encode_rate:>12,.0f} {decode_rate:>12,.0f} {len(token):>8}")
+    return token
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JWT 코덱 벤치마크")
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--algorithm", default="HS256")
+    args = parser.parse_args()
+
+    secret = secrets.token_urlsafe(32)
+    codecs = {}
+    for backend in ("jose", "pyjwt", "hmac"):
+        try:
+            codecs[backend] = create_token_codec(backend, secret, args.algorithm)
+        except ImportError:
+            print(f"[{backend}] 건너뜀: PyJWT 미설치")
+        except ValueError as e:
+            print(f"[{backend}] 건너뜀: {e}")
+
+    claims = {"exp": int(time.time()) + 3600, "sub": str(uuid.uuid4()), "type": "access"}
+    formats = {"standard": claims, "compact": compact_claims(claims)}
+
+    tokens = {}
+    for format_name, format_claims in formats.items():
+        print(f"[{format_name}] {'backend':<16} {'encode/s':>12} {'decode/s':>12} {'bytes':>8}")
+        for backend, codec in codecs.items():
+            tokens[backend, format_name] = bench(backend, codec, format_claims, args.ops)
+
+    # 다른 백엔드가 발급한 토큰도 검증되어야 무중단 전환 가능
+    failures = [
+        f"{issuer}->{verifier}"
+        for (issuer, _), token in tokens.items()
+        for verifier, codec in codecs.items()
+        if not _decodes(codec, token)
+    ]
+    print("교차 디코딩:", "모두 성공" if not failures else "실패 " + ", ".join(failures))
+
+
+def _decodes(codec: TokenCodec, token: str) -> bool:
+    try:
+        codec.decode(token)
+        return True
+    except Exception:
+        return False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+UserSchema 직렬화 비용 마이크로 벤치마크
+
+실행: python -m scripts.bench_serialization [반복 횟수]
+"""
+import json
+import sys
+import timeit
+from datetime import datetime
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from app.models.user import User
+from app.schemas.user import User as UserSchema
+
+
+def make_user() -> User:
+    """DB 없이 사용할 임시 ORM 객체 생성"""
+    now = datetime.utcnow()
+    return User(
+        id="3f1c2b9e-8d4a-4f7e-9a51-2c6b7d8e9f01",
+        email="bench@example.com",
+        username="bench_user",
+        is_active=True,
+        is_superuser=False,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def legacy_path(user: User) -> bytes:
+    """기존 경로: jsonable_encoder + 표준 json"""
+    return json.dumps(jsonable_encoder(UserSchema.model_validate(user))).encode("utf-8")
+
+
+def orjson_path(user: User) -> bytes:
+    """새 경로: from_attributes 검증 + orjson"""
+    return orjson.dumps(UserSchema.model_validate(user).model_dump(mode="json"))
+
+
+def pydantic_json_path(user: User) -> bytes:
+    """참고: Pydantic 코어의 직접 JSON 직렬화"""
+    return UserSchema.model_validate(user).model_dump_json().encode("utf-8")
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    user = make_user()
+
+    print(f"UserSchema 직렬화 ({number}회 반복)")
+    for name, fn in (
+        ("jsonable_encoder + json", legacy_path),
+        ("model_dump + orjson", orjson_path),
+        ("model_dump_json", pydantic_json_path),
+    ):
+        elapsed = min(timeit.repeat(lambda: fn(user), number=number, repeat=3))
+        print(f"  {name:<26} {elapsed / number * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
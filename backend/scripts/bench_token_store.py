@@ -0,0 +1,72 @@
+"""
+토큰 저장소 백엔드 비교 벤치마크
+
+실행: python -m scripts.bench_token_store [--ops 20000] [--redis-url redis://localhost:6379/15]
+                                          [--cluster-url redis://localhost:7000]
+
+memory 백엔드는 항상 측정하고, Redis/Redis Cluster는 주소가 주어지고 접속 가능할 때만 측정합니다.
+"""
+import argparse
+import secrets
+import time
+from typing import Callable, List, Tuple
+
+import redis
+from redis.cluster import RedisCluster
+
+from app.db.token_store import MemoryTokenStore, RedisClusterTokenStore, RedisTokenStore, TokenStore
+
+
+def ops_per_sec(fn: Callable[[int], None], ops: int) -> float:
+    start = time.perf_counter()
+    for i in range(ops):
+        fn(i)
+    return ops / (time.perf_counter() - start)
+
+
+def bench(name: str, store: TokenStore, ops: int) -> None:
+    prefix = f"bench-{secrets.token_hex(4)}"
+    token = secrets.token_urlsafe(180)  # 실제 JWT와 비슷한 길이
+
+    results: List[Tuple[str, float]] = [
+        ("save_refresh_token", ops_per_sec(lambda i: store.save_refresh_token(f"{prefix}-{i}", token, 60), ops)),
+        ("get_refresh_token", ops_per_sec(lambda i: store.get_refresh_token(f"{prefix}-{i}"), ops)),
+        ("rotate_refresh_token", ops_per_sec(
+            lambda i: store.rotate_refresh_token(f"{prefix}-{i}", token, token + "r", token + "a", 60, 10), ops
+        )),
+        ("is_token_blacklisted", ops_per_sec(lambda i: store.is_token_blacklisted(f"{token}{i}"), ops)),
+        ("blacklist_token", ops_per_sec(lambda i: store.blacklist_token(f"{token}{i}", 60), ops)),
+        ("delete_refresh_token", ops_per_sec(lambda i: store.delete_refresh_token(f"{prefix}-{i}"), ops)),
+    ]
+    print(f"[{name}]")
+    for op, rate in results:
+        print(f"  {op:<22} {rate:>12,.0f} ops/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="토큰 저장소 벤치마크")
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--redis-url", help="단일 Redis 주소 (예: redis://localhost:6379/15)")
+    parser.add_argument("--cluster-url", help="Redis Cluster 시작 노드 주소 (예: redis://localhost:7000)")
+    args = parser.parse_args()
+
+    bench("memory", MemoryTokenStore(), args.ops)
+
+    if args.redis_url:
+        try:
+            client = redis.Redis.from_url(args.redis_url, decode_responses=True)
+            client.ping()
+            bench("redis", RedisTokenStore(client), args.ops)
+        except redis.RedisError as e:
+            print(f"[redis] 건너뜀: {e}")
+
+    if args.cluster_url:
+        try:
+            client = RedisCluster.from_url(args.cluster_url, decode_responses=True)
+            bench("redis_cluster", RedisClusterTokenStore(client), args.ops)
+        except redis.RedisError as e:
+            print(f"[redis_cluster] 건너뜀: {e}")
+
+
+if __name__ == "__main__":
+    main()
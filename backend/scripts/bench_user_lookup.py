@@ -0,0 +1,99 @@
+"""
+사용자 단건 조회 오버헤드 벤치마크
+
+ORM Query를 매번 구성하는 기존 방식과 crud/lookups.py의 재사용 문장을 비교해
+조회 1회당 평균 시간(µs)을 출력합니다.
+
+실행: python -m scripts.bench_user_lookup [--url sqlite://] [--users 1000] [--lookups 20000]
+
+--url을 주지 않으면 메모리 SQLite에 합성 사용자를 만들어 측정합니다.
+PostgreSQL에서는 postgresql+psycopg:// 주소로 서버 측 prepared statement 효과도 함께 확인할 수 있습니다.
+"""
+import argparse
+import time
+import uuid
+from typing import Callable, List
+
+from sqlalchemy import create_engine, func, insert
+from sqlalchemy.orm import Session
+
+from app.crud import lookups
+from app.db.base import Base
+from app.models.oauth import OAuthProvider
+from app.models.user import OAuthAccount, User
+
+
+def populate(engine, count: int) -> List[dict]:
+    Base.metadata.create_all(bind=engine)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "email": f"lookup{i}@example.com",
+            "username": f"lookup{i}",
+            "oauth_provider": OAuthProvider.KAKAO.value,
+            "oauth_id": f"k{i}",
+        }
+        for i in range(count)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(User.__table__), rows)
+        conn.execute(insert(OAuthAccount.__table__), [
+            {"user_id": row["id"], "provider": row["oauth_provider"], "provider_user_id": row["oauth_id"]}
+            for row in rows
+        ])
+    return rows
+
+
+def per_lookup_us(engine, fn: Callable[[Session, dict], object], rows: List[dict], lookups_count: int) -> float:
+    with Session(engine) as db:
+        fn(db, rows[0])  # 컴파일 캐시 예열
+        started = time.perf_counter()
+        for i in range(lookups_count):
+            fn(db, rows[i % len(rows)])
+            # 요청마다 새 세션을 쓰는 것처럼 identity map을 비움
+            db.expunge_all()
+        return (time.perf_counter() - started) / lookups_count * 1e6
+
+
+CASES = {
+    "get_by_id": (
+        lambda db, r: db.query(User).filter(User.id == r["id"]).first(),
+        lambda db, r: lookups.user_by_id(db, r["id"]),
+    ),
+    "get_by_email": (
+        lambda db, r: db.query(User).filter(func.lower(User.email) == r["email"].lower()).first(),
+        lambda db, r: lookups.user_by_email(db, r["email"]),
+    ),
+    "get_by_username": (
+        lambda db, r: db.query(User).filter(func.lower(User.username) == r["username"].lower()).first(),
+        lambda db, r: lookups.user_by_username(db, r["username"]),
+    ),
+    "get_by_provider_and_id": (
+        lambda db, r: db.query(OAuthAccount).filter(
+            OAuthAccount.provider == r["oauth_provider"],
+            OAuthAccount.provider_user_id == r["oauth_id"],
+        ).first(),
+        lambda db, r: lookups.oauth_account_by_provider_id(db, r["oauth_provider"], r["oauth_id"]),
+    ),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 단건 조회 벤치마크")
+    parser.add_argument("--url", default="sqlite://", help="측정용 DB 주소 (기본: 메모리 SQLite)")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    rows = populate(engine, args.users)
+
+    print(f"{'lookup':<24} {'query (µs)':>12} {'cached (µs)':>12} {'speedup':>8}")
+    for name, (legacy, cached) in CASES.items():
+        before = per_lookup_us(engine, legacy, rows, args.lookups)
+        after = per_lookup_us(engine, cached, rows, args.lookups)
+        print(f"{name:<24} {before:>12.1f} {after:>12.1f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+사용자 검색 지연 시간 벤치마크
+
+DATABASE_URL이 가리키는 DB에서 /users/search와 같은 쿼리를 실행해 지연 시간 분포를 측정합니다.
+--populate N 을 주면 먼저 합성 사용자 N명을 적재합니다 (예: 1,000,000).
+
+실행: python -m scripts.bench_user_search --populate 1000000 --queries 500
+"""
+import argparse
+import random
+import statistics
+import string
+import time
+import uuid
+from typing import List
+
+from sqlalchemy import insert
+
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.models.user import User
+from app.services import user_search
+
+SYLLABLES = ["ka", "min", "jun", "seo", "yeon", "ji", "hoon", "soo", "al", "ice", "bob", "ann", "lee", "park", "kim"]
+
+
+def random_username(i: int) -> str:
+    return "".join(random.choices(SYLLABLES, k=random.randint(2, 3))) + str(i)
+
+
+def populate(count: int, batch_size: int = 10000) -> None:
+    """합성 사용자 적재 (비밀번호 해시는 생략)"""
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    Base.metadata.create_all(bind=engine)
+    users = User.__table__
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        for offset in range(0, count, batch_size):
+            rows = []
+            for i in range(offset, min(offset + batch_size, count)):
+                username = random_username(i)
+                rows.append({
+                    "id": uuid.uuid4(),
+                    "username": username,
+                    "email": f"{username}@example.com",
+                    "name": " ".join(random.choices(SYLLABLES, k=2)).title(),
+                    "is_active": True,
+                    "is_superuser": False,
+                })
+            conn.execute(insert(users), rows)
+    print(f"사용자 {count:,}명 적재: {time.perf_counter() - started:.1f}s")
+
+
+def run(mode: str, queries: List[str], limit: int) -> None:
+    timings = []
+    timed_out = 0
+    db = SessionLocal()
+    try:
+        for q in queries:
+            started = time.perf_counter()
+            _, _, expired = user_search.search_users(db, q, mode=mode, limit=limit, include_email=True)
+            timings.append((time.perf_counter() - started) * 1000)
+            timed_out += expired
+            db.rollback()  # 쿼리마다 트랜잭션(SET LOCAL) 초기화
+    finally:
+        db.close()
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"  {mode:<7} p50={statistics.median(timings):7.2f}ms p95={p95:7.2f}ms "
+        f"max={timings[-1]:7.2f}ms timed_out={timed_out}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 검색 벤치마크")
+    parser.add_argument("--populate", type=int, default=0, help="먼저 적재할 합성 사용자 수")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    engine.echo = False
+    if args.populate:
+        populate(args.populate)
+
+    queries = [
+        "".join(random.choices(SYLLABLES, k=1)) + "".join(random.choices(string.ascii_lowercase, k=random.randint(0, 2)))
+        for _ in range(args.queries)
+    ]
+    print(f"검색 {args.queries}회 ({engine.dialect.name})")
+    for mode in (user_search.PREFIX, user_search.FUZZY):
+        run(mode, queries, args.limit)
+
+
+if __name__ == "__main__":
+    main()
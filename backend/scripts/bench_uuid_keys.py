@@ -0,0 +1,123 @@
+"""
+문자열 ID와 네이티브 UUID 기본 키 비교 벤치마크
+
+같은 UUID 값을 문자열(varchar, 36자) 기본 키 테이블과 Uuid 기본 키 테이블에 각각 넣고,
+자식 테이블(외래 키 + 인덱스)까지 만들어 인덱스 크기와 조회/조인 지연 시간을 비교합니다.
+
+실행: python -m scripts.bench_uuid_keys [--url sqlite:////tmp/uuid_bench.db] [--rows 100000] [--lookups 5000]
+
+인덱스 크기는 PostgreSQL은 pg_relation_size, SQLite는 dbstat 가상 테이블로 구합니다.
+"""
+import argparse
+import random
+import statistics
+import time
+import uuid
+from typing import Callable, Dict, List
+
+from sqlalchemy import (
+    Column, ForeignKey, Integer, MetaData, String, Table, Uuid, bindparam, create_engine, insert, select, text,
+)
+
+metadata = MetaData()
+
+TABLES: Dict[str, Dict[str, Table]] = {}
+for label, key_type in (("varchar", String(36)), ("uuid", Uuid())):
+    parent = Table(
+        f"bench_{label}_users", metadata,
+        Column("id", key_type, primary_key=True),
+        Column("username", String, nullable=False),
+    )
+    child = Table(
+        f"bench_{label}_accounts", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("user_id", key_type, ForeignKey(parent.c.id), nullable=False, index=True),
+        Column("provider", String, nullable=False),
+    )
+    TABLES[label] = {"parent": parent, "child": child}
+
+
+def populate(engine, rows: int, batch_size: int = 10000) -> List[uuid.UUID]:
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+    ids = [uuid.uuid4() for _ in range(rows)]
+    with engine.begin() as conn:
+        for label, tables in TABLES.items():
+            as_key = str if label == "varchar" else (lambda value: value)
+            for offset in range(0, rows, batch_size):
+                chunk = ids[offset:offset + batch_size]
+                conn.execute(insert(tables["parent"]), [
+                    {"id": as_key(value), "username": f"user{offset + i}"} for i, value in enumerate(chunk)
+                ])
+                conn.execute(insert(tables["child"]), [
+                    {"user_id": as_key(value), "provider": "kakao"} for value in chunk
+                ])
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE")
+    return ids
+
+
+def index_sizes(engine) -> Dict[str, int]:
+    """인덱스 이름 -> 바이트"""
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            rows = conn.execute(text(
+                "SELECT indexrelname, pg_relation_size(indexrelid) FROM pg_stat_user_indexes "
+                "WHERE relname LIKE 'bench\\_%'"
+            )).all()
+        else:
+            rows = conn.execute(text(
+                "SELECT name, sum(pgsize) FROM dbstat WHERE name IN "
+                "(SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name LIKE 'bench\\_%' ESCAPE '\\') "
+                "GROUP BY name"
+            )).all()
+    return {name: int(size) for name, size in rows}
+
+
+def latency_us(engine, fn: Callable, keys: List, lookups: int) -> Dict[str, float]:
+    samples = []
+    with engine.connect() as conn:
+        fn(conn, keys[0])  # 컴파일 캐시 예열
+        for _ in range(lookups):
+            key = random.choice(keys)
+            started = time.perf_counter()
+            fn(conn, key)
+            samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    return {"p50": statistics.median(samples), "p95": samples[int(len(samples) * 0.95) - 1]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="문자열 ID / UUID 기본 키 비교")
+    parser.add_argument("--url", default="sqlite:////tmp/uuid_bench.db", help="측정용 DB 주소")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    started = time.perf_counter()
+    ids = populate(engine, args.rows)
+    print(f"{args.rows:,}행 적재: {time.perf_counter() - started:.1f}s ({engine.dialect.name})")
+
+    print(f"\n{'index':<40} {'size (KiB)':>12}")
+    for name, size in sorted(index_sizes(engine).items()):
+        print(f"{name:<40} {size / 1024:>12,.0f}")
+
+    print(f"\n{'query':<20} {'key':<8} {'p50 (µs)':>10} {'p95 (µs)':>10}")
+    for label, tables in TABLES.items():
+        parent, child = tables["parent"], tables["child"]
+        keys = [str(value) for value in ids] if label == "varchar" else ids
+        by_id = select(parent.c.username).where(parent.c.id == bindparam("key"))
+        join = (
+            select(parent.c.username, child.c.provider)
+            .join(child, child.c.user_id == parent.c.id)
+            .where(parent.c.id == bindparam("key"))
+        )
+        for name, stmt in (("pk lookup", by_id), ("fk join", join)):
+            result = latency_us(engine, lambda conn, key: conn.execute(stmt, {"key": key}).all(), keys, args.lookups)
+            print(f"{name:<20} {label:<8} {result['p50']:>10.1f} {result['p95']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+비밀번호 해시 비용 보정 스크립트
+
+현재 호스트에서 해시 1회에 걸리는 시간을 측정하고,
+목표 지연 시간 안에 들어오는 가장 강한 파라미터를 추천합니다.
+
+실행: python -m scripts.calibrate_password_hash --target-ms 250 --scheme argon2
+"""
+import argparse
+import statistics
+import time
+from typing import Callable, List, Optional, Tuple
+
+from passlib.hash import argon2, bcrypt
+
+from app.core.config import settings
+
+SAMPLE_PASSWORD = "calibration-password-123!"
+
+
+def measure(hash_fn: Callable[[str], str], samples: int) -> float:
+    """해시 함수의 중앙값 실행 시간(ms)"""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hash_fn(SAMPLE_PASSWORD)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt(target_ms: float, samples: int) -> Tuple[Optional[int], List[Tuple[int, float]]]:
+    """목표 시간 이하인 최대 bcrypt rounds 탐색"""
+    results = []
+    recommended = None
+    for rounds in range(8, 18):
+        elapsed = measure(bcrypt.using(rounds=rounds).hash, samples)
+        results.append((rounds, elapsed))
+        if elapsed > target_ms:
+            break
+        recommended = rounds
+    return recommended, results
+
+
+def calibrate_argon2(
+    target_ms: float, samples: int, memory_cost: int, parallelism: int
+) -> Tuple[Optional[int], List[Tuple[int, float]]]:
+    """메모리/병렬도를 고정하고 목표 시간 이하인 최대 argon2id time_cost 탐색"""
+    results = []
+    recommended = None
+    for time_cost in range(1, 21):
+        hasher = argon2.using(
+            type="ID", time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism
+        )
+        elapsed = measure(hasher.hash, samples)
+        results.append((time_cost, elapsed))
+        if elapsed > target_ms:
+            break
+        recommended = time_cost
+    return recommended, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="비밀번호 해시 비용 보정")
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default=settings.PASSWORD_HASH_SCHEMES[0])
+    parser.add_argument("--target-ms", type=float, default=250.0, help="해시 1회 목표 지연 시간(ms)")
+    parser.add_argument("--samples", type=int, default=3, help="파라미터별 측정 횟수")
+    parser.add_argument("--memory-cost", type=int, default=settings.ARGON2_MEMORY_COST, help="argon2 메모리(KiB)")
+    parser.add_argument("--parallelism", type=int, default=settings.ARGON2_PARALLELISM, help="argon2 병렬도")
+    args = parser.parse_args()
+
+    print(f"스킴={args.scheme}, 목표={args.target_ms:.0f}ms, 측정 횟수={args.samples}")
+    if args.scheme == "bcrypt":
+        recommended, results = calibrate_bcrypt(args.target_ms, args.samples)
+        for rounds, elapsed in results:
+            print(f"  rounds={rounds:<3} {elapsed:8.1f} ms")
+        env_lines = [f"BCRYPT_ROUNDS={recommended}"]
+    else:
+        recommended, results = calibrate_argon2(
+            args.target_ms, args.samples, args.memory_cost, args.parallelism
+        )
+        for time_cost, elapsed in results:
+            print(f"  time_cost={time_cost:<3} {elapsed:8.1f} ms")
+        env_lines = [
+            f"ARGON2_TIME_COST={recommended}",
+            f"ARGON2_MEMORY_COST={args.memory_cost}",
+            f"ARGON2_PARALLELISM={args.parallelism}",
+        ]
+
+    if recommended is None:
+        print("목표 시간 안에 들어오는 파라미터가 없습니다. 목표를 늘리거나 메모리 비용을 줄이세요.")
+        return
+
+    print("\n추천 설정 (.env):")
+    print(f"PASSWORD_HASH_SCHEMES={args.scheme}" + ("" if args.scheme == "bcrypt" else ",bcrypt"))
+    for line in env_lines:
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+실행 중인 서버의 라우트별 메모리 할당 집계를 파일로 저장
+
+실행: python -m scripts.dump_memory_profile --token <관리자 액세스 토큰> [--url http://localhost:8000] [--out memory-profile.json]
+
+- 기본: GET /admin/memory-profile 응답을 로컬 파일로 저장하고 상위 라우트를 출력
+- --server: 서버가 자신의 MEMORY_PROFILER_DUMP_PATH에 저장 (POST /admin/memory-profile/dump)
+- --reset: 저장 후 집계 초기화
+
+워커가 여러 개면 요청을 받은 워커 하나의 집계만 저장됩니다 (보고서의 pid로 구분).
+"""
+import argparse
+import json
+import os
+import sys
+
+import httpx
+
+from app.core.config import settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="메모리 할당 프로파일 저장")
+    parser.add_argument("--url", default="http://localhost:8000", help="서버 주소")
+    parser.add_argument("--token", default=os.getenv("ADMIN_ACCESS_TOKEN"), help="관리자 액세스 토큰 (기본: ADMIN_ACCESS_TOKEN)")
+    parser.add_argument("--out", default="memory-profile.json", help="저장할 파일")
+    parser.add_argument("--server", action="store_true", help="서버 쪽 파일로 저장")
+    parser.add_argument("--reset", action="store_true", help="저장 후 집계 초기화")
+    parser.add_argument("--top", type=int, default=10, help="출력할 라우트 수")
+    args = parser.parse_args()
+    if not args.token:
+        sys.exit("--token 또는 ADMIN_ACCESS_TOKEN이 필요합니다.")
+
+    base = f"{args.url.rstrip('/')}{settings.API_V1_STR}/admin/memory-profile"
+    headers = {"Authorization": f"Bearer {args.token}"}
+    with httpx.Client(headers=headers, timeout=30) as client:
+        if args.server:
+            response = client.post(f"{base}/dump")
+            response.raise_for_status()
+            print(f"서버에 저장: {response.json()['path']}")
+        else:
+            response = client.get(base)
+            response.raise_for_status()
+            report = response.json()
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            if not report["enabled"]:
+                print("경고: 서버에서 MEMORY_PROFILER_ENABLED가 꺼져 있습니다.")
+            print(f"pid={report['pid']} 표본 {report['sampled_requests']}건 -> {args.out}")
+            print(f"{'route':<48} {'samples':>8} {'avg KiB':>10} {'max KiB':>10}")
+            for route in report["routes"][:args.top]:
+                print(
+                    f"{route['route']:<48} {route['samples']:>8} "
+                    f"{route['avg_net_bytes'] / 1024:>10.1f} {route['max_net_bytes'] / 1024:>10.1f}"
+                )
+        if args.reset:
+            client.delete(base).raise_for_status()
+
+
+if __name__ == "__main__":
+    main()
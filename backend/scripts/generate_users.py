@@ -0,0 +1,206 @@
+"""
+합성 사용자 데이터셋 생성기
+
+users / oauth_accounts에 운영 규모의 사용자를 대량 적재합니다.
+
+실행: python -m scripts.generate_users --users 1000000 [--mix password=0.4,kakao=0.4,google=0.2]
+
+- 가입 방식 비율(--mix): 비밀번호 가입, 카카오/구글 OAuth 가입
+  (OAuth 사용자는 실제 가입 경로와 같이 users.oauth_* 와 oauth_accounts를 함께 생성)
+- 이메일 도메인과 사용자명은 실제와 비슷한 치우친 분포를 따르고, 일부는 대문자가 섞여 있음
+- 비밀번호는 한 번만 해싱해 모든 사용자에 재사용 (bcrypt 비용 없이 적재, 로그인 가능)
+- 행 내용은 (시드, 순번)으로 결정되므로 이미 적재된 수부터 이어서 추가할 수 있음 (--append)
+"""
+import argparse
+import random
+import string
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+
+from app.core.security import get_password_hash
+from app.db.base import Base
+from app.db.session import engine
+from app.models.oauth import OAuthProvider
+from app.models.user import OAuthAccount, User
+
+DEFAULT_PASSWORD = "scale-test-password"
+DEFAULT_MIX = "password=0.4,kakao=0.4,google=0.2"
+
+# 흔한 이름일수록 앞쪽 (Zipf 분포로 선택)
+GIVEN_NAMES = [
+    "minjun", "seojun", "jiho", "doyun", "seoyeon", "jiwoo", "haeun", "minseo", "jimin", "yejun",
+    "junho", "hyunwoo", "sujin", "eunji", "jiyoung", "daniel", "james", "sarah", "emma", "david",
+    "yuna", "chaewon", "taeyang", "woojin", "sohee", "kevin", "grace", "hana", "sora", "jaehyun",
+]
+SURNAMES = ["kim", "lee", "park", "choi", "jung", "kang", "cho", "yoon", "jang", "lim", "han", "oh", "seo", "shin"]
+WORDS = ["dev", "cat", "blue", "star", "moon", "coffee", "pro", "jjang", "lucky", "happy", "zzang", "love"]
+
+# (도메인, 가중치)
+EMAIL_DOMAINS = [
+    ("gmail.com", 45), ("naver.com", 25), ("kakao.com", 8), ("daum.net", 6), ("hanmail.net", 5),
+    ("nate.com", 3), ("outlook.com", 3), ("icloud.com", 2), ("yahoo.com", 1), ("example.org", 2),
+]
+
+# 카카오는 이메일 제공 동의를 받지 못한 사용자가 흔함
+KAKAO_EMAIL_RATE = 0.7
+
+_ZIPF_WEIGHTS = [1 / (rank + 1) for rank in range(len(GIVEN_NAMES))]
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """'password=0.4,kakao=0.4,google=0.2' -> 합이 1인 비율"""
+    mix = {}
+    for part in value.split(","):
+        kind, _, ratio = part.partition("=")
+        kind = kind.strip()
+        if kind not in ("password", OAuthProvider.KAKAO.value, OAuthProvider.GOOGLE.value):
+            raise argparse.ArgumentTypeError(f"알 수 없는 가입 방식: {kind}")
+        mix[kind] = float(ratio)
+    total = sum(mix.values())
+    if total <= 0:
+        raise argparse.ArgumentTypeError("비율 합이 0입니다.")
+    return {kind: ratio / total for kind, ratio in mix.items()}
+
+
+def _suffix(index: int) -> str:
+    """순번을 짧은 36진수로 (사용자명/이메일 유일성 보장)"""
+    digits = string.digits + string.ascii_lowercase
+    out = ""
+    while True:
+        index, rem = divmod(index, 36)
+        out = digits[rem] + out
+        if index == 0:
+            return out
+
+
+def _handle(rng: random.Random, index: int) -> str:
+    given = rng.choices(GIVEN_NAMES, weights=_ZIPF_WEIGHTS)[0]
+    style = rng.random()
+    if style < 0.45:
+        handle = f"{given}{rng.randint(0, 99):02d}"
+    elif style < 0.7:
+        handle = f"{given}.{rng.choice(SURNAMES)}"
+    elif style < 0.85:
+        handle = f"{rng.choice(WORDS)}_{given}"
+    else:
+        handle = f"{rng.choice(SURNAMES)}{given}{rng.randint(1970, 2010)}"
+    # 마지막 "_" 뒤의 순번으로 유일성 보장 (앞부분끼리 우연히 이어져 겹치지 않도록 구분)
+    handle = f"{handle}_{_suffix(index)}"
+    # 대소문자 무시 유일성/조회 경로를 확인하도록 일부는 대문자 포함
+    return handle.capitalize() if rng.random() < 0.1 else handle
+
+
+def build_user(index: int, seed: int, mix: Dict[str, float], hashed_password: str) -> Tuple[dict, Optional[dict]]:
+    """순번에 해당하는 (users 행, oauth_accounts 행 또는 None)"""
+    rng = random.Random(seed * 1_000_003 + index)
+    kind = rng.choices(list(mix), weights=list(mix.values()))[0]
+    handle = _handle(rng, index)
+    domain = rng.choices([d for d, _ in EMAIL_DOMAINS], weights=[w for _, w in EMAIL_DOMAINS])[0]
+    email: Optional[str] = f"{handle}@{domain}"
+    name = f"{rng.choice(SURNAMES).title()} {rng.choices(GIVEN_NAMES, weights=_ZIPF_WEIGHTS)[0].title()}"
+    created_at = datetime(2021, 1, 1) + timedelta(seconds=rng.randint(0, 5 * 365 * 86400))
+    user_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    user = {
+        "id": user_id,
+        "email": email,
+        "username": handle,
+        "hashed_password": None,
+        "is_active": rng.random() > 0.01,
+        "is_superuser": False,
+        "oauth_provider": None,
+        "oauth_id": None,
+        "name": name,
+        "created_at": created_at,
+    }
+    if kind == "password":
+        user["hashed_password"] = hashed_password
+        return user, None
+
+    if kind == OAuthProvider.KAKAO.value:
+        # 카카오 회원번호는 10자리 숫자
+        provider_user_id = str(1_000_000_000 + seed * 7_919 + index)
+        if rng.random() >= KAKAO_EMAIL_RATE:
+            user["email"] = None
+    else:
+        # 구글 sub는 21자리 숫자
+        provider_user_id = str(100_000_000_000_000_000_000 + seed * 7_919 + index)
+    user.update({
+        "username": f"{kind}_{provider_user_id}",
+        "oauth_provider": kind,
+        "oauth_id": provider_user_id,
+    })
+    account = {"user_id": user_id, "provider": kind, "provider_user_id": provider_user_id}
+    return user, account
+
+
+def generate(
+    engine: Engine,
+    start: int,
+    stop: int,
+    mix: Dict[str, float],
+    seed: int = 42,
+    batch_size: int = 10000,
+    password: str = DEFAULT_PASSWORD,
+) -> float:
+    """순번 [start, stop) 사용자 적재, 소요 시간(초) 반환"""
+    Base.metadata.create_all(bind=engine)
+    hashed_password = get_password_hash(password)
+    started = time.perf_counter()
+    for offset in range(start, stop, batch_size):
+        users: List[dict] = []
+        accounts: List[dict] = []
+        for index in range(offset, min(offset + batch_size, stop)):
+            user, account = build_user(index, seed, mix, hashed_password)
+            users.append(user)
+            if account is not None:
+                accounts.append(account)
+        # 배치마다 커밋 (대량 적재 중 트랜잭션/WAL이 커지지 않도록)
+        with engine.begin() as conn:
+            conn.execute(insert(User.__table__), users)
+            if accounts:
+                conn.execute(insert(OAuthAccount.__table__), accounts)
+        done = min(offset + batch_size, stop) - start
+        if done % (batch_size * 10) == 0 or offset + batch_size >= stop:
+            elapsed = time.perf_counter() - started
+            print(f"  {start + done:,}명 적재 ({done / elapsed:,.0f}명/s)")
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE users")
+            conn.exec_driver_sql("ANALYZE oauth_accounts")
+    return time.perf_counter() - started
+
+
+def count_users(engine: Engine) -> int:
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(User.__table__)).scalar()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="합성 사용자 데이터셋 생성")
+    parser.add_argument("--users", type=int, required=True, help="적재할 사용자 수 (--append면 목표 총 사용자 수)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"가입 방식 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="비밀번호 가입 사용자의 공통 비밀번호")
+    parser.add_argument("--append", action="store_true", help="현재 사용자 수부터 이어서 --users명까지 적재")
+    args = parser.parse_args()
+
+    engine.echo = False
+    start = count_users(engine) if args.append else 0
+    if start >= args.users:
+        print(f"이미 {start:,}명이 있습니다.")
+        return
+    print(f"사용자 {start:,} ~ {args.users:,} 적재 ({engine.dialect.name}, mix={args.mix})")
+    elapsed = generate(engine, start, args.users, args.mix, args.seed, args.batch_size, args.password)
+    print(f"완료: {args.users - start:,}명, {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+사용자 ID 컬럼을 문자열에서 네이티브 UUID로 변환
+
+users.id, oauth_accounts.user_id, login_events.user_id를 한 트랜잭션에서 바꿉니다.
+기존 ID가 모두 UUID 형식인지 먼저 확인하고, 하나라도 아니면 아무것도 바꾸지 않습니다.
+
+실행: python -m scripts.migrate_uuid_keys [--dry-run]
+
+- PostgreSQL: varchar -> uuid 타입 변경 (id::uuid), gen_random_uuid() 기본값,
+  외래 키 재생성, 중복 인덱스 ix_users_id 삭제, ix_oauth_accounts_user_id 생성
+- SQLite: 타입 변경이 없으므로 값만 SQLAlchemy Uuid 저장 형식(하이픈 없는 소문자 32자)으로 변경
+"""
+import argparse
+import sys
+
+from sqlalchemy import text
+
+from app.db.session import engine
+
+# (테이블, 컬럼)
+KEY_COLUMNS = [("users", "id"), ("oauth_accounts", "user_id"), ("login_events", "user_id")]
+
+_UUID_PATTERN = "^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$"
+
+POSTGRES_STEPS = [
+    "ALTER TABLE oauth_accounts DROP CONSTRAINT IF EXISTS oauth_accounts_user_id_fkey",
+    "ALTER TABLE users ALTER COLUMN id TYPE uuid USING id::uuid",
+    "ALTER TABLE users ALTER COLUMN id SET DEFAULT gen_random_uuid()",
+    "ALTER TABLE oauth_accounts ALTER COLUMN user_id TYPE uuid USING user_id::uuid",
+    "ALTER TABLE login_events ALTER COLUMN user_id TYPE uuid USING user_id::uuid",
+    "ALTER TABLE oauth_accounts ADD CONSTRAINT oauth_accounts_user_id_fkey "
+    "FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE",
+    # 기본 키 인덱스와 중복
+    "DROP INDEX IF EXISTS ix_users_id",
+    "CREATE INDEX IF NOT EXISTS ix_oauth_accounts_user_id ON oauth_accounts (user_id)",
+]
+
+SQLITE_STEPS = [
+    f"UPDATE {table} SET {column} = lower(replace({column}, '-', '')) WHERE length({column}) = 36"
+    for table, column in KEY_COLUMNS
+] + [
+    "DROP INDEX IF EXISTS ix_users_id",
+    "CREATE INDEX IF NOT EXISTS ix_oauth_accounts_user_id ON oauth_accounts (user_id)",
+]
+
+
+def invalid_count(conn, dialect: str, table: str, column: str) -> int:
+    if dialect == "postgresql":
+        sql = f"SELECT count(*) FROM {table} WHERE {column}::text !~ :pattern"
+        return conn.execute(text(sql), {"pattern": _UUID_PATTERN}).scalar()
+    # SQLite에는 정규식이 없으므로 길이와 16진수 문자만 확인
+    sql = (
+        f"SELECT count(*) FROM {table} WHERE NOT ("
+        f"(length({column}) = 36 AND length(replace({column}, '-', '')) = 32 "
+        f"AND lower(replace({column}, '-', '')) NOT GLOB '*[^0-9a-f]*') "
+        f"OR (length({column}) = 32 AND lower({column}) NOT GLOB '*[^0-9a-f]*'))"
+    )
+    return conn.execute(text(sql)).scalar()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 ID를 네이티브 UUID로 변환")
+    parser.add_argument("--dry-run", action="store_true", help="검사와 실행할 SQL 출력만 수행")
+    args = parser.parse_args()
+
+    dialect = engine.dialect.name
+    if dialect == "postgresql":
+        steps = POSTGRES_STEPS
+    elif dialect == "sqlite":
+        steps = SQLITE_STEPS
+    else:
+        sys.exit(f"지원하지 않는 DB입니다: {dialect}")
+
+    with engine.begin() as conn:
+        invalid = {
+            f"{table}.{column}": invalid_count(conn, dialect, table, column)
+            for table, column in KEY_COLUMNS
+        }
+        bad = {name: count for name, count in invalid.items() if count}
+        if bad:
+            sys.exit(f"UUID 형식이 아닌 값이 있어 중단합니다: {bad}")
+
+        for step in steps:
+            print(step)
+            if not args.dry_run:
+                conn.execute(text(step))
+    print("완료 (dry run)" if args.dry_run else "완료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Redis 키스페이스 메모리 보고서
+
+실행: python -m scripts.redis_keyspace_report [--prefix blacklist: --prefix refresh_token:] [--sample-rate 0.05] [--out keyspace.json]
+
+설정(REDIS_HOST 등)의 Redis에 직접 붙어서 접두사별로 SCAN하고,
+키 수 / MEMORY USAGE 표본 기반 바이트 추정치 / 남은 TTL 분포를 출력합니다.
+SCAN과 속도 제한(--keys-per-second)으로 조금씩 훑으므로 운영 Redis에서도 실행할 수 있지만,
+키가 많으면 그만큼 오래 걸립니다. 서버를 거치려면 GET /admin/redis-keyspace를 사용하세요.
+"""
+import argparse
+import json
+import sys
+
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.db.keyspace import TTL_BUCKETS, scan_keyspace
+from app.db.redis import redis_client
+
+
+def human_bytes(value) -> str:
+    if value is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if value < 1024 or unit == "GiB":
+            return f"{value:.1f}{unit}" if unit != "B" else f"{value}B"
+        value /= 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Redis 키스페이스 메모리 보고서")
+    parser.add_argument("--prefix", action="append", help="접두사 (여러 번 지정 가능, 기본: REDIS_KEYSPACE_PREFIXES)")
+    parser.add_argument("--sample-rate", type=float, default=settings.REDIS_KEYSPACE_SAMPLE_RATE)
+    parser.add_argument("--scan-count", type=int, default=settings.REDIS_KEYSPACE_SCAN_COUNT)
+    parser.add_argument("--keys-per-second", type=float, default=settings.REDIS_KEYSPACE_KEYS_PER_SECOND,
+                        help="스캔 속도 상한 (0이면 제한 없음)")
+    parser.add_argument("--max-keys", type=int, default=None, help="접두사당 최대 키 수 (기본: 전체)")
+    parser.add_argument("--max-seconds", type=float, default=None, help="전체 스캔 시간 상한 (기본: 제한 없음)")
+    parser.add_argument("--out", help="JSON 보고서를 저장할 파일")
+    args = parser.parse_args()
+
+    try:
+        report = scan_keyspace(
+            redis_client,
+            args.prefix or settings.REDIS_KEYSPACE_PREFIXES,
+            scan_count=args.scan_count,
+            keys_per_second=args.keys_per_second or None,
+            sample_rate=args.sample_rate,
+            max_keys=args.max_keys,
+            max_seconds=args.max_seconds,
+        )
+    except RedisError as e:
+        sys.exit(f"Redis 조회 실패: {e}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+
+    print(
+        f"키 {report['scanned_keys']:,}개, {report['seconds']}s, "
+        f"used_memory={human_bytes(report['used_memory'])}, 표본 비율={report['sample_rate']}"
+        + (" (시간 상한 도달, 부분 결과)" if report["timed_out"] else "")
+    )
+    buckets = [name for _, name in TTL_BUCKETS]
+    print(
+        f"{'prefix':<16} {'keys':>10} {'key name':>9} {'avg':>9} {'max':>9} {'estimated':>10} {'no ttl':>8} "
+        + " ".join(f"{name:>7}" for name in buckets)
+    )
+    for prefix in report["prefixes"]:
+        histogram = {bucket["bucket"]: bucket["keys"] for bucket in prefix["ttl_histogram"]}
+        name = prefix["prefix"] + ("" if prefix["complete"] else " (부분)")
+        print(
+            f"{name:<16} {prefix['keys']:>10,} {prefix['avg_key_name_bytes'] or 0:>8.0f}B "
+            f"{human_bytes(prefix['avg_bytes'] and round(prefix['avg_bytes'])):>9} {human_bytes(prefix['max_bytes']):>9} "
+            f"{human_bytes(prefix['estimated_bytes']):>10} {prefix['no_ttl']:>8,} "
+            + " ".join(f"{histogram[bucket]:>7,}" for bucket in buckets)
+        )
+
+
+if __name__ == "__main__":
+    main()
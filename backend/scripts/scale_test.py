@@ -0,0 +1,177 @@
+"""
+사용자 규모별 지연 시간 테스트
+
+DATABASE_URL이 가리키는 DB를 단계별 규모(기본 1만 / 100만 / 1000만 명)까지 합성 사용자로 채우고,
+각 단계에서 주요 조회 경로의 지연 시간 분포를 측정합니다.
+
+실행: python -m scripts.scale_test [--sizes 10000,1000000,10000000] [--samples 500] [--max-p95-ms 50]
+
+- get_by_email / get_by_username: 서비스 계층 단건 조회
+- find_or_create_oauth_user: 기존 OAuth 계정 로그인 경로와 신규 가입 경로
+- GET /users/me: 토큰 검증부터 응답 직렬화까지 (TestClient, 조건부 요청 없이 항상 DB 조회)
+
+데이터는 scripts.generate_users로 이어서 적재하므로 이미 채워진 DB는 부족한 만큼만 추가합니다.
+테스트용 DB에서만 실행하세요 (신규 가입 경로 측정은 사용자를 추가로 만듭니다).
+--max-p95-ms를 주면 어느 항목이든 p95가 기준을 넘을 때 종료 코드 1로 끝납니다.
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from fastapi.testclient import TestClient
+from sqlalchemy import bindparam, select
+
+from app.api.api_v1.endpoints.oauth import find_or_create_oauth_user
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.session import SessionLocal, engine
+from app.main import app
+from app.models.oauth import OAuthProvider
+from app.models.user import User
+from app.services import user as user_service
+from scripts.generate_users import DEFAULT_MIX, count_users, generate, parse_mix
+
+# 임의의 UUID 이상인 행부터 연속으로 읽어 기본 키 인덱스만 타고 표본 추출 (모자라면 처음부터 이어서)
+_SAMPLE_COLUMNS = select(User.id, User.email, User.username, User.oauth_provider, User.oauth_id)
+
+_SAMPLE_USERS_FROM = (
+    _SAMPLE_COLUMNS.where(User.id >= bindparam("pivot"), User.is_active.is_(True))
+    .order_by(User.id)
+    .limit(bindparam("count"))
+)
+
+_SAMPLE_USERS_BEFORE = (
+    _SAMPLE_COLUMNS.where(User.id < bindparam("pivot"), User.is_active.is_(True))
+    .order_by(User.id)
+    .limit(bindparam("count"))
+)
+
+
+def sample_users(db, count: int) -> List:
+    pivot = uuid.uuid4()
+    rows = db.execute(_SAMPLE_USERS_FROM, {"pivot": pivot, "count": count}).all()
+    if len(rows) < count:
+        rows += db.execute(_SAMPLE_USERS_BEFORE, {"pivot": pivot, "count": count - len(rows)}).all()
+    if len(rows) < count:
+        sys.exit(f"활성 사용자가 {len(rows)}명뿐이라 표본 {count}명을 뽑을 수 없습니다 (--samples를 줄이세요)")
+    return rows
+
+
+def measure(fn: Callable, items: List) -> Dict[str, float]:
+    """항목마다 fn을 실행해 지연 시간(ms) 분포 반환"""
+    if not items:
+        return {}
+    fn(items[0])  # 예열
+    timings = []
+    for item in items:
+        started = time.perf_counter()
+        fn(item)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+
+    def pct(p: float) -> float:
+        return timings[min(len(timings) - 1, int(len(timings) * p))]
+
+    return {"n": len(timings), "p50": pct(0.5), "p95": pct(0.95), "p99": pct(0.99), "max": timings[-1]}
+
+
+def run_step(client: TestClient, samples: int, new_users: int) -> Dict[str, Dict[str, float]]:
+    loop = asyncio.new_event_loop()
+    db = SessionLocal()
+    try:
+        users = sample_users(db, samples)
+        with_email = [row for row in users if row.email]
+        oauth = [row for row in users if row.oauth_provider]
+
+        def call_find_or_create(provider: OAuthProvider, provider_user_id: str, email: Optional[str]):
+            loop.run_until_complete(find_or_create_oauth_user(db, provider, provider_user_id, email))
+            db.expunge_all()
+
+        results = {
+            "get_by_email": measure(
+                lambda row: (user_service.get_by_email(db, row.email), db.expunge_all()), with_email
+            ),
+            "get_by_username": measure(
+                lambda row: (user_service.get_by_username(db, row.username), db.expunge_all()), users
+            ),
+            "find_or_create (existing)": measure(
+                lambda row: call_find_or_create(OAuthProvider(row.oauth_provider), row.oauth_id, row.email), oauth
+            ),
+            "find_or_create (new)": measure(
+                lambda provider_user_id: call_find_or_create(
+                    OAuthProvider.GOOGLE, provider_user_id, f"scale-{provider_user_id}@example.com"
+                ),
+                [f"scale{uuid.uuid4().int % 10**20:020d}" for _ in range(new_users)],
+            ),
+        }
+
+        headers = [
+            {"Authorization": f"Bearer {create_access_token(subject=str(row.id))}"} for row in users
+        ]
+
+        def get_me(header: dict) -> None:
+            response = client.get(f"{settings.API_V1_STR}/users/me", headers=header)
+            if response.status_code != 200:
+                raise RuntimeError(f"/users/me 실패: {response.status_code} {response.text}")
+
+        results["GET /users/me"] = measure(get_me, headers)
+        return results
+    finally:
+        db.close()
+        loop.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 규모별 지연 시간 테스트")
+    parser.add_argument("--sizes", default="10000,1000000,10000000", help="측정할 사용자 수 (쉼표 구분, 오름차순)")
+    parser.add_argument("--samples", type=int, default=500, help="항목별 측정 횟수")
+    parser.add_argument("--new-users", type=int, default=50, help="신규 가입 경로 측정 횟수")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-p95-ms", type=float, default=None, help="p95 허용 기준 (넘으면 실패)")
+    args = parser.parse_args()
+
+    engine.echo = False
+    # 조회마다 남는 정보 로그가 측정을 왜곡하지 않도록
+    logging.getLogger("app").setLevel(logging.WARNING)
+    random.seed(args.seed)
+    sizes = sorted(int(size) for size in args.sizes.split(","))
+
+    report = []
+    with TestClient(app) as client:
+        for size in sizes:
+            current = count_users(engine)
+            if current < size:
+                print(f"[{size:,}] 사용자 {current:,} -> {size:,} 적재")
+                elapsed = generate(engine, current, size, args.mix, args.seed)
+                print(f"[{size:,}] 적재 {elapsed:.1f}s")
+            elif current > size:
+                print(f"[{size:,}] 이미 {current:,}명이 있어 현재 규모로 측정합니다.")
+            for name, stats in run_step(client, args.samples, args.new_users).items():
+                report.append((max(size, current), name, stats))
+
+    print(f"\n{'users':>12} {'operation':<28} {'n':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    failed = []
+    for size, name, stats in report:
+        if not stats:
+            print(f"{size:>12,} {name:<28} {'-':>5}")
+            continue
+        print(
+            f"{size:>12,} {name:<28} {stats['n']:>5} {stats['p50']:>8.2f} {stats['p95']:>8.2f} "
+            f"{stats['p99']:>8.2f} {stats['max']:>8.2f}"
+        )
+        if args.max_p95_ms is not None and stats["p95"] > args.max_p95_ms:
+            failed.append(f"{size:,} {name} p95={stats['p95']:.2f}ms")
+
+    if failed:
+        print("\n기준 초과: " + ", ".join(failed))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+사용자에게 관리자 권한 부여/회수
+
+API의 생성/수정 요청으로는 is_superuser를 바꿀 수 없으므로 관리자 지정은 이 스크립트로만 합니다.
+
+실행: python -m scripts.set_superuser <사용자명 또는 이메일> [--revoke]
+"""
+import argparse
+import sys
+
+from app.db.session import SessionLocal
+from app.services import user as user_service
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="관리자 권한 부여/회수")
+    parser.add_argument("user", help="사용자명 또는 이메일")
+    parser.add_argument("--revoke", action="store_true", help="관리자 권한 회수")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user = user_service.get_by_username(db, args.user) or user_service.get_by_email(db, args.user)
+        if user is None:
+            sys.exit(f"사용자를 찾을 수 없습니다: {args.user}")
+        user.is_superuser = not args.revoke
+        db.commit()
+        print(f"{user.username} ({user.id}): is_superuser={user.is_superuser}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
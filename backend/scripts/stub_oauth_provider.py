@@ -0,0 +1,120 @@
+"""
+카카오/구글 OAuth 제공자 스텁 서버
+
+지연과 오류율을 조절해서 서킷 브레이커/마감 시간/재시도 동작을 로컬에서 확인합니다.
+
+실행: python -m scripts.stub_oauth_provider --port 9100 --latency 0.5 --error-rate 0.3
+
+백엔드 .env 설정 예:
+KAKAO_TOKEN_URL=http://localhost:9100/kakao/token
+KAKAO_USER_INFO_URL=http://localhost:9100/kakao/user/me
+GOOGLE_TOKEN_URL=http://localhost:9100/google/token
+GOOGLE_USER_INFO_URL=http://localhost:9100/google/userinfo
+THUMBNAIL_ALLOWED_HOSTS=[".kakaocdn.net", ".googleusercontent.com", "localhost"]
+
+사용자 정보의 프로필 이미지는 이 서버의 /images/<사용자>.png를 가리킵니다.
+--image-version을 바꿔 다시 띄우면 프로필 이미지 주소가 바뀐 것처럼 동작하고,
+GET /images/stats로 이미지별 다운로드 횟수를 확인할 수 있습니다.
+"""
+import argparse
+import asyncio
+import hashlib
+import io
+import random
+from collections import Counter
+
+import uvicorn
+from fastapi import FastAPI, Form, Header, HTTPException, Request, Response
+from PIL import Image, ImageDraw
+
+app = FastAPI(title="OAuth provider stub")
+config = {"latency": 0.0, "error_rate": 0.0, "error_status": 503, "image_version": 1}
+image_fetches: Counter = Counter()
+
+
+async def simulate() -> None:
+    """설정된 지연 후 일정 확률로 서버 오류 발생"""
+    if config["latency"]:
+        await asyncio.sleep(config["latency"])
+    if random.random() < config["error_rate"]:
+        raise HTTPException(status_code=config["error_status"], detail="stub failure")
+
+
+def user_id_from(authorization: str) -> str:
+    # 액세스 토큰 = "stub-<code>" 이므로 code 기준으로 같은 사용자를 돌려줌
+    return authorization.removeprefix("Bearer ").removeprefix("stub-")
+
+
+def image_url(request: Request, user_id: str) -> str:
+    return str(request.url_for("profile_image", name=user_id)) + f"?v={config['image_version']}"
+
+
+@app.post("/kakao/token")
+@app.post("/google/token")
+async def token(code: str = Form("")) -> dict:
+    await simulate()
+    return {"access_token": "stub-" + (code or "anonymous"), "token_type": "bearer", "expires_in": 3600}
+
+
+@app.get("/kakao/user/me")
+async def kakao_user(request: Request, authorization: str = Header("")) -> dict:
+    await simulate()
+    user_id = user_id_from(authorization)
+    return {
+        "id": abs(hash(user_id)) % 10 ** 10,
+        "kakao_account": {
+            "email": f"{user_id}@kakao.stub",
+            "profile": {"nickname": f"kakao {user_id}", "profile_image_url": image_url(request, user_id)},
+        },
+    }
+
+
+@app.get("/google/userinfo")
+async def google_user(request: Request, authorization: str = Header("")) -> dict:
+    await simulate()
+    user_id = user_id_from(authorization)
+    return {
+        "id": f"g{user_id}",
+        "email": f"{user_id}@google.stub",
+        "name": f"google {user_id}",
+        "picture": image_url(request, user_id),
+    }
+
+
+@app.get("/images/stats")
+async def image_stats() -> dict:
+    """이미지별 다운로드 횟수 (썸네일 캐시가 원본을 한 번만 받는지 확인용)"""
+    return dict(image_fetches)
+
+
+@app.get("/images/{name}.png", name="profile_image")
+async def profile_image(name: str, v: int = 1) -> Response:
+    """사용자/버전마다 색이 다른 640x480 PNG"""
+    await simulate()
+    image_fetches[f"{name}.png?v={v}"] += 1
+    color = tuple(hashlib.sha256(f"{name}:{v}".encode()).digest()[:3])
+    image = Image.new("RGB", (640, 480), color)
+    ImageDraw.Draw(image).ellipse((160, 80, 480, 400), fill=(255, 255, 255))
+    out = io.BytesIO()
+    image.save(out, "PNG")
+    return Response(out.getvalue(), media_type="image/png")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OAuth 제공자 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="서버 오류 확률 (0~1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--image-version", type=int, default=1, help="프로필 이미지 주소의 버전 (바꾸면 새 이미지)")
+    args = parser.parse_args()
+    config.update(
+        latency=args.latency, error_rate=args.error_rate, error_status=args.error_status,
+        image_version=args.image_version,
+    )
+    uvicorn.run(app, host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
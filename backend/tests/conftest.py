@@ -0,0 +1,14 @@
+"""
+테스트 공통 설정
+
+app 모듈은 import 시점에 설정을 읽고 DB 엔진/Redis 클라이언트를 만들므로,
+외부 서비스(PostgreSQL/Redis) 없이 실행되도록 메모리 백엔드를 기본값으로 지정합니다.
+이미 지정된 환경 변수는 그대로 사용합니다.
+"""
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TOKEN_STORE_BACKEND", "memory")
+os.environ.setdefault("AVAILABILITY_FILTER_BACKEND", "memory")
+os.environ.setdefault("USER_VERSION_CACHE_BACKEND", "memory")
+os.environ.setdefault("ACTIVE_USERS_BACKEND", "memory")
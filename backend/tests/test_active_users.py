@@ -0,0 +1,127 @@
+import asyncio
+import uuid
+from datetime import timedelta
+
+import pytest
+
+from app.services import active_users
+from app.services.active_users import ActiveUserRecorder, MemoryActiveUserStore
+
+WINDOW = 300
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+class FailingStore:
+    def add(self, day_users) -> None:
+        raise ConnectionError("redis down")
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(active_users, "time", fake)
+    return fake
+
+def run(store, scenario, **kwargs):
+    """flush 태스크를 시작한 recorder로 scenario 실행 (자동 flush는 일어나지 않도록 간격을 길게)"""
+    options = {"dedup_window": WINDOW, "flush_interval": 3600, "max_pending": 100}
+    options.update(kwargs)
+    recorder = ActiveUserRecorder(store, **options)
+
+    async def main():
+        await recorder.start()
+        try:
+            await scenario(recorder)
+        finally:
+            await recorder.stop()
+
+    asyncio.run(main())
+    return recorder
+
+def today_count(store: MemoryActiveUserStore) -> int:
+    return store.count([active_users._utc_today()])
+
+def test_record_is_ignored_before_start():
+    recorder = ActiveUserRecorder(MemoryActiveUserStore(30))
+    recorder.record(uuid.uuid4())
+    assert recorder.stats()["recorded"] == 0
+    assert recorder.stats()["pending"] == 0
+
+def test_same_user_is_deduplicated_within_window(clock):
+    store = MemoryActiveUserStore(30)
+    user = uuid.uuid4()
+
+    async def scenario(recorder):
+        recorder.record(user)
+        clock.now += WINDOW - 1
+        recorder.record(user)
+        recorder.record(user)
+
+    recorder = run(store, scenario)
+    stats = recorder.stats()
+    assert stats["recorded"] == 1
+    assert stats["deduplicated"] == 2
+    assert stats["flushed"] == 1
+    assert today_count(store) == 1
+
+def test_user_is_recorded_again_after_window(clock):
+    store = MemoryActiveUserStore(30)
+    user = uuid.uuid4()
+
+    async def scenario(recorder):
+        recorder.record(user)
+        clock.now += WINDOW
+        recorder.record(user)
+
+    recorder = run(store, scenario)
+    assert recorder.stats()["recorded"] == 2
+    assert recorder.stats()["deduplicated"] == 0
+    # 일별 집계는 고유 사용자 수
+    assert today_count(store) == 1
+
+def test_drops_new_users_when_pending_is_full(clock):
+    store = MemoryActiveUserStore(30)
+    users = [uuid.uuid4() for _ in range(5)]
+
+    async def scenario(recorder):
+        for user in users:
+            recorder.record(user)
+        assert recorder.stats()["pending"] == 3
+        assert recorder.stats()["dropped"] == 2
+        # 버린 사용자는 dedup 대상이 아니므로 flush 뒤 다시 기록됨
+        await recorder._flush()
+        recorder.record(users[-1])
+        recorder.record(users[0])
+
+    recorder = run(store, scenario, max_pending=3)
+    stats = recorder.stats()
+    assert stats["recorded"] == 4
+    assert stats["deduplicated"] == 1
+    assert stats["dropped"] == 2
+    assert stats["flushed"] == 4
+    assert today_count(store) == 4
+
+def test_failed_flush_counts_as_dropped(clock):
+    async def scenario(recorder):
+        recorder.record(uuid.uuid4())
+        recorder.record(uuid.uuid4())
+
+    recorder = run(FailingStore(), scenario)
+    stats = recorder.stats()
+    assert stats["recorded"] == 2
+    assert stats["flushed"] == 0
+    assert stats["dropped"] == 2
+    assert stats["pending"] == 0
+
+def test_memory_store_counts_unique_users_across_days():
+    store = MemoryActiveUserStore(30)
+    today = active_users._utc_today()
+    yesterday = today - timedelta(days=1)
+    a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    store.add({yesterday: {a, b}, today: {b, c}})
+    assert store.daily_counts([yesterday, today]) == [2, 2]
+    assert store.count([yesterday, today]) == 3
@@ -0,0 +1,68 @@
+import pytest
+
+from app.core.bloom import BloomFilter, RedisBloomFilter, optimal_size
+
+def test_optimal_size():
+    bits, hashes = optimal_size(1000, 0.01)
+    # 원소당 약 9.6비트, 해시 7개
+    assert 9500 <= bits <= 9700
+    assert hashes == 7
+
+def test_no_false_negatives_after_add():
+    bloom = BloomFilter(1000, 0.01)
+    items = [f"u:user{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(bloom.might_contain(item) for item in items)
+
+def test_no_false_negatives_after_add_many_from_generator():
+    bloom = BloomFilter(5000, 0.01)
+    # 청크 크기(_CHUNK)보다 긴 스트림
+    bloom.add_many(f"e:user{i}@example.com" for i in range(5000))
+    assert all(bloom.might_contain(f"e:user{i}@example.com") for i in range(5000))
+
+def test_false_positive_rate_near_target():
+    bloom = BloomFilter(2000, 0.01)
+    bloom.add_many(f"u:taken{i}" for i in range(2000))
+    false_positives = sum(bloom.might_contain(f"u:free{i}") for i in range(10000))
+    assert false_positives / 10000 < 0.03
+
+def test_memory_filter_is_never_complete():
+    bloom = BloomFilter(10, 0.01)
+    bloom.add("u:a")
+    bloom.mark_complete()
+    assert not bloom.is_complete()
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    return fakeredis.FakeRedis(decode_responses=True)
+
+def test_redis_no_false_negatives(redis_client):
+    bloom = RedisBloomFilter(redis_client, "bloom:test", 3000, 0.01)
+    bloom.add_many(f"u:user{i}" for i in range(2500))
+    bloom.add("u:late")
+    assert all(bloom.might_contain(f"u:user{i}") for i in range(2500))
+    assert bloom.might_contain("u:late")
+
+def test_redis_filter_shared_between_instances(redis_client):
+    writer = RedisBloomFilter(redis_client, "bloom:test", 100, 0.01)
+    reader = RedisBloomFilter(redis_client, "bloom:test", 100, 0.01)
+    writer.add("u:alice")
+    assert reader.might_contain("u:alice")
+
+def test_redis_complete_only_after_mark(redis_client):
+    bloom = RedisBloomFilter(redis_client, "bloom:test", 100, 0.01)
+    assert not bloom.is_complete()
+    # 비트맵이 생겨도 전체 스캔 완료 전에는 믿지 않음
+    bloom.add_many(["u:a", "u:b"])
+    assert not bloom.is_complete()
+    bloom.mark_complete()
+    assert bloom.is_complete()
+
+def test_redis_incomplete_when_bitmap_evicted(redis_client):
+    bloom = RedisBloomFilter(redis_client, "bloom:test", 100, 0.01)
+    bloom.add("u:a")
+    bloom.mark_complete()
+    redis_client.delete("bloom:test")
+    assert not bloom.is_complete()
@@ -0,0 +1,148 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.api.api_v1.endpoints import oauth
+from app.core import resilience
+from app.core.resilience import CircuitBreaker, Deadline
+from app.models.oauth import OAuthProvider
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(resilience, "time", fake)
+    return fake
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = {"failure_threshold": 3, "slow_call_seconds": 1.0, "reset_timeout": 30.0}
+    options.update(kwargs)
+    return CircuitBreaker("test", **options)
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow_request() is not None
+        breaker.record_failure()
+
+def test_closed_allows_requests(clock):
+    breaker = make_breaker()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() == CircuitBreaker.CLOSED
+    assert breaker.allow_request() == CircuitBreaker.CLOSED
+
+def test_opens_after_failure_threshold(clock):
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.is_open
+    assert breaker.allow_request() is None
+
+def test_success_resets_failure_count(clock):
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_slow_success_counts_as_failure(clock):
+    breaker = make_breaker(failure_threshold=1)
+    breaker.record_success(breaker.slow_call_seconds + 0.1)
+    assert breaker.is_open
+
+def test_half_open_allows_single_trial(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += breaker.reset_timeout - 0.1
+    assert breaker.is_open
+    clock.now += 0.1
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() == CircuitBreaker.HALF_OPEN
+    # 시험 호출이 끝나기 전에는 다른 요청을 보내지 않음
+    assert breaker.allow_request() is None
+
+def test_trial_success_closes(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+    assert breaker.allow_request() == CircuitBreaker.HALF_OPEN
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request() == CircuitBreaker.CLOSED
+
+def test_trial_failure_reopens(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+    assert breaker.allow_request() == CircuitBreaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.is_open
+    # reset_timeout은 다시 열린 시점부터
+    clock.now += breaker.reset_timeout - 0.1
+    assert breaker.allow_request() is None
+
+def test_release_trial_frees_slot_without_changing_state(clock):
+    breaker = make_breaker()
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+    assert breaker.allow_request() == CircuitBreaker.HALF_OPEN
+    breaker.release_trial()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() == CircuitBreaker.HALF_OPEN
+
+def test_provider_request_releases_trial_on_unrecorded_error(clock, monkeypatch):
+    breaker = make_breaker()
+    monkeypatch.setitem(oauth.provider_breakers, OAuthProvider.KAKAO, breaker)
+    trip(breaker)
+    clock.now += breaker.reset_timeout
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        # 브레이커에 기록하지 않는 예외 (전송 오류/5xx가 아님)
+        raise httpx.TooManyRedirects("redirect loop", request=request)
+
+    async def call():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await oauth.provider_request(client, OAuthProvider.KAKAO, Deadline(5), "GET", "http://provider/me")
+
+    with pytest.raises(httpx.TooManyRedirects):
+        asyncio.run(call())
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() == CircuitBreaker.HALF_OPEN
+
+def test_call_started_while_closed_keeps_trial_slot(clock, monkeypatch):
+    breaker = make_breaker()
+    monkeypatch.setitem(oauth.provider_breakers, OAuthProvider.KAKAO, breaker)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            raise httpx.TooManyRedirects("redirect loop", request=request)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            # 닫혀 있을 때 시작한 느린 호출
+            stale = asyncio.create_task(
+                oauth.provider_request(client, OAuthProvider.KAKAO, Deadline(5), "GET", "http://provider/me")
+            )
+            await asyncio.sleep(0)
+            trip(breaker)
+            clock.now += breaker.reset_timeout
+            assert breaker.allow_request() == CircuitBreaker.HALF_OPEN
+            release.set()
+            with pytest.raises(httpx.TooManyRedirects):
+                await stale
+
+    asyncio.run(scenario())
+    # 늦게 끝난 호출이 실제 시험 호출의 자리를 풀지 않아야 함
+    assert breaker.allow_request() is None
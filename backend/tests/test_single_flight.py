@@ -0,0 +1,140 @@
+import asyncio
+import gc
+
+import pytest
+
+from app.core.resilience import SingleFlight
+
+class Counter:
+    """호출 횟수를 세고 release가 설정될 때까지 기다리는 공유 호출"""
+
+    def __init__(self, result="ok", error=None):
+        self.calls = 0
+        self.result = result
+        self.error = error
+        self.release = asyncio.Event()
+        self.finished = False
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        self.finished = True
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+def test_concurrent_calls_share_one_execution():
+    async def scenario():
+        flight = SingleFlight("test")
+        call = Counter()
+        tasks = [asyncio.create_task(flight.do("k", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        call.release.set()
+        assert await asyncio.gather(*tasks) == ["ok"] * 5
+        assert call.calls == 1
+        assert flight.shared == 4
+
+    asyncio.run(scenario())
+
+def test_exception_is_shared():
+    async def scenario():
+        flight = SingleFlight("test")
+        call = Counter(error=ValueError("boom"))
+        tasks = [asyncio.create_task(flight.do("k", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+        call.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+        assert call.calls == 1
+
+    asyncio.run(scenario())
+
+def test_key_is_cleared_after_completion():
+    async def scenario():
+        flight = SingleFlight("test")
+        first = Counter(result=1)
+        first.release.set()
+        assert await flight.do("k", first) == 1
+        # 결과를 캐시하지 않으므로 다음 호출은 다시 실행
+        second = Counter(result=2)
+        second.release.set()
+        assert await flight.do("k", second) == 2
+        assert flight.shared == 0
+
+    asyncio.run(scenario())
+
+def test_different_keys_run_separately():
+    async def scenario():
+        flight = SingleFlight("test")
+        a, b = Counter(result="a"), Counter(result="b")
+        tasks = [asyncio.create_task(flight.do("a", a)), asyncio.create_task(flight.do("b", b))]
+        await asyncio.sleep(0)
+        a.release.set()
+        b.release.set()
+        assert await asyncio.gather(*tasks) == ["a", "b"]
+        assert (a.calls, b.calls) == (1, 1)
+
+    asyncio.run(scenario())
+
+def test_followers_survive_first_caller_cancellation():
+    async def scenario():
+        flight = SingleFlight("test")
+        call = Counter()
+        first = asyncio.create_task(flight.do("k", call))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do("k", call)) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        # 먼저 온 요청의 클라이언트 연결이 끊김
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        call.release.set()
+        assert await asyncio.gather(*followers) == ["ok"] * 3
+        assert call.calls == 1
+
+    asyncio.run(scenario())
+
+def test_follower_cancellation_does_not_affect_others():
+    async def scenario():
+        flight = SingleFlight("test")
+        call = Counter()
+        first = asyncio.create_task(flight.do("k", call))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", call))
+        await asyncio.sleep(0)
+        follower.cancel()
+        call.release.set()
+        assert await first == "ok"
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+
+    asyncio.run(scenario())
+
+def test_call_finishes_when_every_caller_is_cancelled():
+    errors = []
+
+    async def scenario():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+        flight = SingleFlight("test")
+        call = Counter(error=ValueError("boom"))
+        tasks = [asyncio.create_task(flight.do("k", call)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        call.release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert call.finished
+        # 끝난 호출의 키는 지워져서 다음 요청은 새로 실행
+        again = Counter(result="again")
+        again.release.set()
+        assert await flight.do("k", again) == "again"
+        gc.collect()
+
+    asyncio.run(scenario())
+    # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 없어야 함
+    assert errors == []
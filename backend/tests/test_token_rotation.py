@@ -0,0 +1,123 @@
+import threading
+
+import pytest
+
+from app.db import token_store
+from app.db.token_store import MemoryTokenStore, RedisClusterTokenStore, RedisTokenStore
+
+TTL = 3600
+GRACE = 10
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(token_store, "time", fake)
+    return fake
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip("fakeredis")
+    # 회전은 Lua 스크립트(EVALSHA)로 실행
+    pytest.importorskip("lupa")
+    return fakeredis.FakeRedis(decode_responses=True)
+
+@pytest.fixture(params=["memory", "redis", "redis_cluster"])
+def store(request):
+    if request.param == "memory":
+        return MemoryTokenStore()
+    client = request.getfixturevalue("redis_client")
+    if request.param == "redis":
+        return RedisTokenStore(client)
+    # 해시 태그 키 이름만 다르므로 단일 fakeredis로 스크립트 동작 확인
+    return RedisClusterTokenStore(client)
+
+def rotate(store, old, new_refresh, new_access, grace=GRACE):
+    return store.rotate_refresh_token("u1", old, new_refresh, new_access, TTL, grace)
+
+def test_rotate_swaps_matching_token(store):
+    store.save_refresh_token("u1", "r0", TTL)
+    assert rotate(store, "r0", "r1", "a1") == ("a1", "r1")
+    assert store.get_refresh_token("u1") == "r1"
+
+def test_rotate_rejects_unknown_token(store):
+    store.save_refresh_token("u1", "r0", TTL)
+    assert rotate(store, "forged", "r1", "a1") is None
+    assert store.get_refresh_token("u1") == "r0"
+
+def test_rotate_without_stored_token(store):
+    assert rotate(store, "r0", "r1", "a1") is None
+    assert store.get_refresh_token("u1") is None
+
+def test_replay_within_grace_returns_same_pair(store):
+    store.save_refresh_token("u1", "r0", TTL)
+    assert rotate(store, "r0", "r1", "a1") == ("a1", "r1")
+    # 동시에 갱신한 다른 탭: 새로 만든 토큰 대신 이미 발급한 쌍을 받음
+    assert rotate(store, "r0", "r2", "a2") == ("a1", "r1")
+    assert store.get_refresh_token("u1") == "r1"
+
+def test_new_token_keeps_rotating_after_replay(store):
+    store.save_refresh_token("u1", "r0", TTL)
+    rotate(store, "r0", "r1", "a1")
+    rotate(store, "r0", "r2", "a2")
+    assert rotate(store, "r1", "r3", "a3") == ("a3", "r3")
+    # 유예 기록은 마지막 교체 기준 (두 단계 전 토큰은 거부)
+    assert rotate(store, "r0", "r4", "a4") is None
+    assert rotate(store, "r1", "r5", "a5") == ("a3", "r3")
+
+def test_no_replay_without_grace(store):
+    store.save_refresh_token("u1", "r0", TTL)
+    assert rotate(store, "r0", "r1", "a1", grace=0) == ("a1", "r1")
+    assert rotate(store, "r0", "r2", "a2", grace=0) is None
+
+def test_delete_clears_grace_record(store):
+    store.save_refresh_token("u1", "r0", TTL)
+    rotate(store, "r0", "r1", "a1")
+    store.delete_refresh_token("u1")
+    assert store.get_refresh_token("u1") is None
+    assert rotate(store, "r0", "r2", "a2") is None
+    assert rotate(store, "r1", "r2", "a2") is None
+
+def test_memory_replay_expires_after_grace(clock):
+    store = MemoryTokenStore()
+    store.save_refresh_token("u1", "r0", TTL)
+    rotate(store, "r0", "r1", "a1")
+    clock.now += GRACE - 0.1
+    assert rotate(store, "r0", "r2", "a2") == ("a1", "r1")
+    clock.now += 0.2
+    assert rotate(store, "r0", "r2", "a2") is None
+    assert store.get_refresh_token("u1") == "r1"
+
+def test_redis_grace_record_has_ttl(redis_client):
+    store = RedisTokenStore(redis_client)
+    store.save_refresh_token("u1", "r0", TTL)
+    rotate(store, "r0", "r1", "a1")
+    assert 0 < redis_client.ttl(store.refresh_grace_key("u1")) <= GRACE
+    assert 0 < redis_client.ttl(store.refresh_token_key("u1")) <= TTL
+
+def test_concurrent_rotations_issue_one_pair(store):
+    store.save_refresh_token("u1", "r0", TTL)
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        results.append(rotate(store, "r0", f"r-{n}", f"a-{n}"))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 한 요청만 교체에 성공하고 나머지는 같은 쌍을 받음
+    assert len(set(results)) == 1
+    access, refresh = results[0]
+    assert store.get_refresh_token("u1") == refresh
+    assert access == "a-" + refresh[len("r-"):]